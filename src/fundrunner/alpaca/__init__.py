@@ -1,6 +1,6 @@
 """Alpaca API wrappers and trading utilities."""
 
-from .api_client import AlpacaClient
+from .api_client import AlpacaClient, get_client
 from .portfolio_manager import PortfolioManager
 from .portfolio_manager_active import (
     calculate_weights,
@@ -16,6 +16,7 @@ __all__ = [
     "TradeManager",
     "YieldFarmer",
     "calculate_weights",
+    "get_client",
     "parse_target_weights",
     "rebalance_decisions",
 ]
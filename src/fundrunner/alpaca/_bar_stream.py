@@ -0,0 +1,56 @@
+"""Minute-bar websocket adapter over ``alpaca_trade_api.stream.DataStream``.
+
+``DataStream`` (alpaca-trade-api 3.x, pinned ``<3.3`` in ``pyproject.toml``)
+only exposes a blocking ``run()`` and an async ``_run_forever`` that retries
+every error without limit, so callers can neither tell whether the connection
+is up nor stop retrying. This adapter drives the handshake and message loop
+itself. It is the only place that touches ``DataStream`` internals; re-check
+it before raising the version cap.
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+from alpaca_trade_api.common import URL
+from alpaca_trade_api.stream import DataStream
+
+
+class BarStream:
+    """One-connection-at-a-time wrapper around a raw-data ``DataStream``."""
+
+    def __init__(self, key_id: str, secret_key: str, url: str, feed: str) -> None:
+        self._stream = DataStream(key_id, secret_key, URL(url), raw_data=True, feed=feed)
+
+    async def connect(self) -> None:
+        """Open the websocket, authenticate and re-send existing subscriptions.
+
+        Raises on any handshake failure so the caller can count attempts.
+        """
+        stream = self._stream
+        stream._loop = asyncio.get_running_loop()
+        await stream._start_ws()
+        if any(stream._handlers["bars"].values()):
+            await stream._subscribe_all()
+        stream._running = True
+
+    def subscribe_bars(self, handler, *symbols) -> None:
+        """Register ``handler`` for ``symbols``; blocks while connected.
+
+        Once connected the subscribe message is sent on the stream's loop and
+        waited for, so call this from a worker thread in that case.
+        """
+        self._stream.subscribe_bars(handler, *symbols)
+
+    async def consume(self) -> None:
+        """Dispatch messages until :meth:`stop` is called; raises on drops."""
+        await self._stream._consume()
+
+    async def stop(self) -> None:
+        """Ask a running :meth:`consume` to return after closing the socket."""
+        await self._stream.stop_ws()
+
+    async def close(self) -> None:
+        """Close the websocket, if open, and mark the stream disconnected."""
+        await self._stream.close()
+        self._stream._running = False
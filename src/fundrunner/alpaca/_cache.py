@@ -0,0 +1,150 @@
+"""On-disk TTL cache for Alpaca REST responses."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import pickle
+import shutil
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Hashable
+
+logger = logging.getLogger(__name__)
+
+
+class FileCache:
+    """Pickle-backed cache storing one file per ``(endpoint, key)`` pair.
+
+    Entries live under ``<root>/<endpoint>/<md5(key)>.pkl`` together with the
+    time they were written and their TTL. Expired entries are ignored on read
+    and overwritten by the next successful fetch.
+    """
+
+    def __init__(self, root: str | Path) -> None:
+        self.root = Path(root)
+        self._refreshing: set[Path] = set()
+        self._lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+
+    def _path(self, endpoint: str, key: Hashable) -> Path:
+        digest = hashlib.md5(repr(key).encode("utf-8")).hexdigest()
+        return self.root / endpoint / f"{digest}.pkl"
+
+    def _read(self, path: Path) -> dict | None:
+        try:
+            with path.open("rb") as fh:
+                return pickle.load(fh)
+        except FileNotFoundError:
+            return None
+        except Exception as exc:
+            logger.warning("Discarding unreadable cache entry %s: %s", path, exc)
+            return None
+
+    def get(self, endpoint: str, key: Hashable) -> Any | None:
+        """Return the cached value for ``key`` or ``None`` if missing/expired."""
+        entry = self._read(self._path(endpoint, key))
+        if entry is None:
+            return None
+        if time.time() - entry["timestamp"] > entry["ttl_seconds"]:
+            return None
+        return entry["value"]
+
+    def set(self, endpoint: str, key: Hashable, value: Any, ttl: float) -> None:
+        """Store ``value`` for ``key`` with a lifetime of ``ttl`` seconds."""
+        path = self._path(endpoint, key)
+        entry = {"timestamp": time.time(), "ttl_seconds": ttl, "value": value}
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a temp file and rename so readers never see partial data
+            fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "wb") as fh:
+                pickle.dump(entry, fh, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, path)
+        except OSError as exc:
+            logger.warning("Failed to write cache entry %s: %s", path, exc)
+
+    def invalidate(self, endpoint: str, key: Hashable | None = None) -> None:
+        """Drop the entry for ``key``, or every entry under ``endpoint``."""
+        if key is None:
+            shutil.rmtree(self.root / endpoint, ignore_errors=True)
+            return
+        try:
+            self._path(endpoint, key).unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as exc:
+            logger.warning("Failed to drop cache entry %s: %s", key, exc)
+
+    def get_or_fetch(
+        self,
+        endpoint: str,
+        key: Hashable,
+        ttl: float,
+        fetch: Callable[[], Any],
+        revalidate: bool = False,
+    ) -> Any:
+        """Return a cached value, calling ``fetch`` on a miss.
+
+        Parameters
+        ----------
+        endpoint:
+            Namespace for the entry, e.g. ``"bars"``.
+        key:
+            Hashable request parameters identifying the entry.
+        ttl:
+            Lifetime of a fresh entry in seconds.
+        fetch:
+            Zero-argument callable returning the value. ``None`` results are
+            not cached.
+        revalidate:
+            When ``True``, hits older than half of ``ttl`` are returned
+            immediately while ``fetch`` refreshes the entry in the background.
+        """
+        path = self._path(endpoint, key)
+        entry = self._read(path)
+        if entry is not None:
+            age = time.time() - entry["timestamp"]
+            if age <= entry["ttl_seconds"]:
+                if revalidate and age > entry["ttl_seconds"] / 2:
+                    self._schedule_refresh(endpoint, key, ttl, fetch, path)
+                return entry["value"]
+
+        value = fetch()
+        if value is not None:
+            self.set(endpoint, key, value, ttl)
+        return value
+
+    def _schedule_refresh(
+        self,
+        endpoint: str,
+        key: Hashable,
+        ttl: float,
+        fetch: Callable[[], Any],
+        path: Path,
+    ) -> None:
+        with self._lock:
+            if path in self._refreshing:
+                return
+            self._refreshing.add(path)
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=2, thread_name_prefix="alpaca-cache"
+                )
+
+        def refresh() -> None:
+            try:
+                value = fetch()
+                if value is not None:
+                    self.set(endpoint, key, value, ttl)
+            except Exception as exc:
+                logger.warning("Background cache refresh failed for %s: %s", key, exc)
+            finally:
+                with self._lock:
+                    self._refreshing.discard(path)
+
+        self._executor.submit(refresh)
@@ -0,0 +1,78 @@
+"""Numeric kernels for per-symbol trade statistics.
+
+:func:`trade_stats` reduces a ``(N, T)`` matrix of closing prices (one row per
+symbol, right-aligned and NaN-padded) to mean return, volatility and sigmoid
+probability of profit. When :mod:`numba` is installed the row loop is JIT
+compiled and parallelised across symbols; otherwise an equivalent NumPy
+implementation is used.
+"""
+
+import warnings
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # pragma: no cover - optional dependency
+    njit = None
+    prange = range
+
+
+def _trade_stats_loop(closes):
+    n, t = closes.shape
+    out = np.empty((n, 3))
+    for i in prange(n):
+        total = 0.0
+        count = 0
+        for j in range(1, t):
+            r = closes[i, j] / closes[i, j - 1] - 1.0
+            if not np.isnan(r):
+                total += r
+                count += 1
+        mean = total / count if count > 0 else np.nan
+        var = 0.0
+        if count > 1:
+            for j in range(1, t):
+                r = closes[i, j] / closes[i, j - 1] - 1.0
+                if not np.isnan(r):
+                    var += (r - mean) * (r - mean)
+            vol = np.sqrt(var / (count - 1))
+        else:
+            vol = np.nan
+        out[i, 0] = mean
+        out[i, 1] = vol
+        out[i, 2] = 1.0 / (1.0 + np.exp(-5.0 * mean / vol)) if vol > 0 else 0.5
+    return out
+
+
+def _trade_stats_numpy(closes):
+    with np.errstate(invalid="ignore", divide="ignore"), warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        returns = np.diff(closes, axis=1) / closes[:, :-1]
+        counts = np.count_nonzero(~np.isnan(returns), axis=1)
+        mean = np.nanmean(returns, axis=1)
+        vol = np.where(counts > 1, np.nanstd(returns, axis=1, ddof=1), np.nan)
+        risk_adjusted = np.where(vol > 0, mean / vol, 0.0)
+        prob = np.where(vol > 0, 1.0 / (1.0 + np.exp(-5.0 * risk_adjusted)), 0.5)
+    return np.column_stack((mean, vol, prob))
+
+
+# ``fastmath`` is left off: it lets LLVM assume no NaNs, which breaks the
+# padding checks above.
+_trade_stats = (
+    njit(parallel=True, cache=True)(_trade_stats_loop)
+    if njit is not None
+    else _trade_stats_numpy
+)
+
+
+def trade_stats(closes):
+    """Return ``(N, 3)`` mean return, volatility and probability of profit.
+
+    Volatility uses ``ddof=1`` like pandas and is NaN for rows with fewer than
+    two returns; such rows get a probability of ``0.5``. ``float32`` input is
+    kept as is for throughput; other dtypes are computed in ``float64``.
+    """
+    closes = np.asarray(closes)
+    dtype = np.float32 if closes.dtype == np.float32 else np.float64
+    return _trade_stats(np.ascontiguousarray(closes, dtype=dtype))
@@ -1,8 +1,33 @@
 # api_client.py
 """Wrapper around :mod:`alpaca_trade_api` providing convenience helpers."""
 
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, time as dt_time, timedelta
+from functools import lru_cache, partial
+
 import alpaca_trade_api as tradeapi
-from fundrunner.utils.config import API_KEY, API_SECRET, BASE_URL, DATA_FEED
+import numpy as np
+import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from fundrunner.alpaca._cache import FileCache
+from fundrunner.utils import fast_json
+from fundrunner.utils.config import (
+    API_KEY,
+    API_SECRET,
+    BASE_URL,
+    DATA_FEED,
+    DATA_STREAM_URL,
+    ALPACA_CACHE_DIR,
+    ALPACA_CACHE_ENABLED,
+    BARS_DAILY_TTL,
+    BARS_INTRADAY_TTL,
+    ACCOUNT_TTL,
+    ORDERS_TTL,
+    POSITIONS_TTL,
+    WATCHLISTS_TTL,
+)
 from fundrunner.utils.error_handling import (
     handle_api_errors,
     handle_trading_errors,
@@ -12,26 +37,191 @@ from fundrunner.utils.error_handling import (
     ErrorType
 )
 import logging
+import socket
+import threading
+import time
 
 # Configure logging for this module
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
+# Debug records (and the reprs of large position, order and watchlist lists)
+# are never built unless debugging is re-enabled with
+# ``logging.getLogger("fundrunner.alpaca.api_client").setLevel(logging.DEBUG)``.
+# Warnings and errors propagate to the application's handlers.
+logger.setLevel(logging.WARNING)
+
+# Seconds a resolved watchlist name -> id mapping is reused
+WATCHLIST_CACHE_TTL = 300
+
+# Upper bound on concurrent REST calls issued by the batched helpers
+MAX_CONCURRENCY = 16
+
+# Default number of orders in flight at once in ``submit_orders_bulk``. Kept
+# below ``MAX_CONCURRENCY`` so order bursts stay clear of the trading API's
+# per-minute request limit.
+ORDER_CONCURRENCY = 8
+
+# Shared HTTP session so every AlpacaClient reuses the same keep-alive pool
+_session = None
+
+
+class _KeepAliveAdapter(HTTPAdapter):
+    """``HTTPAdapter`` enabling ``TCP_NODELAY`` and TCP keep-alive probes.
+
+    Passing ``socket_options`` replaces urllib3's defaults, so ``TCP_NODELAY``
+    is listed explicitly alongside ``SO_KEEPALIVE``.
+    """
+
+    socket_options = [
+        (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+    ]
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs.setdefault("socket_options", self.socket_options)
+        super().init_poolmanager(*args, **kwargs)
+
+
+def _fast_json_hook(response, *args, **kwargs):
+    """Make ``response.json()`` decode with :func:`fast_json.loads`.
+
+    ``REST`` parses every reply via ``response.json()``; swapping the decoder
+    here speeds up large bar payloads without patching ``alpaca_trade_api``.
+    """
+    response.json = partial(_decode_response, response)
+    return response
+
+
+def _decode_response(response, **kwargs):
+    return fast_json.loads(response.content)
+
+
+def _build_session():
+    """Return a ``requests.Session`` with a pooled, retrying HTTP adapter.
 
-# Create a console handler with a warning log level so debug info is not printed to terminal
-ch = logging.StreamHandler()
-ch.setLevel(logging.WARNING)
+    ``REST`` already retries 429/504 responses itself, so the adapter only
+    retries connection errors and transient 5xx responses. ``POST`` is not in
+    urllib3's default ``allowed_methods`` so order submissions are never
+    replayed.
+    """
+    session = requests.Session()
+    retry = Retry(
+        total=3,
+        backoff_factor=0.2,
+        status_forcelist=(500, 502, 503),
+        raise_on_status=False,
+    )
+    # Size the pool for the batched helpers so concurrent calls never block
+    # waiting on a free connection.
+    adapter = _KeepAliveAdapter(
+        pool_connections=16,
+        pool_maxsize=max(32, 2 * MAX_CONCURRENCY),
+        max_retries=retry,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.hooks["response"].append(_fast_json_hook)
+    return session
 
-# Create a formatter and attach it to the handler
-formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
-ch.setFormatter(formatter)
 
-# Add the handler to the logger if it's not already added
-if not logger.hasHandlers():
-    logger.addHandler(ch)
+def get_session():
+    """Return the process-wide HTTP session used by :class:`AlpacaClient`."""
+    global _session
+    if _session is None:
+        _session = _build_session()
+    return _session
+
+
+def _is_daily(timeframe):
+    return getattr(timeframe, "unit", None) == tradeapi.rest.TimeFrameUnit.Day
+
+
+def _bars_ttl(timeframe):
+    return BARS_DAILY_TTL if _is_daily(timeframe) else BARS_INTRADAY_TTL
+
+
+_INTRADAY_UNIT_SECONDS = {
+    tradeapi.rest.TimeFrameUnit.Minute: 60,
+    tradeapi.rest.TimeFrameUnit.Hour: 3600,
+}
+
+
+def _bars_bucket(timeframe, now):
+    """Return the cache-key period that ``now`` falls in for ``timeframe``.
+
+    Daily and longer bars change once per date. Intraday bars change once per
+    bar interval, so a cached frame is never more than one bar behind.
+    """
+    step = _INTRADAY_UNIT_SECONDS.get(getattr(timeframe, "unit", None))
+    if step is None:
+        return now.date()
+    step *= timeframe.amount
+    seconds = now.hour * 3600 + now.minute * 60 + now.second
+    return now.date(), seconds // step
+
+
+@lru_cache(maxsize=16)
+def _daily_window(days, today):
+    """Return ``(start, end)`` for ``days`` whole days ending at ``today`` 00:00 UTC.
+
+    Daily windows only change at the date boundary, so they are memoized.
+    """
+    end_dt = datetime.combine(today, dt_time.min)
+    start_dt = end_dt - timedelta(days=days)
+    return start_dt.isoformat() + "Z", end_dt.isoformat() + "Z"
+
+
+def _bar_window(days, timeframe=tradeapi.rest.TimeFrame.Day, now=None):
+    """Return ``(start, end)`` RFC 3339 strings spanning the last ``days`` days.
+
+    Daily bars use a window aligned to UTC midnight so only closed sessions
+    are requested; intraday bars run up to the current second. ``now`` lets
+    callers reuse a timestamp they already took.
+    """
+    if now is None:
+        now = datetime.utcnow()
+    if _is_daily(timeframe):
+        return _daily_window(days, now.date())
+    end_dt = now.replace(microsecond=0)
+    start_dt = end_dt - timedelta(days=days)
+    return start_dt.isoformat() + "Z", end_dt.isoformat() + "Z"
+
+
+def _raw_entity(obj):
+    """Return the JSON payload behind an Alpaca entity, or ``obj`` itself."""
+    raw = getattr(obj, "_raw", None)
+    return raw if isinstance(raw, dict) else obj
+
+
+def _as_order(value):
+    return tradeapi.entity.Order(value) if isinstance(value, dict) else value
+
+
+def _as_watchlist(value):
+    return tradeapi.entity.Watchlist(value) if isinstance(value, dict) else value
+
+
+def _is_fractional(qty):
+    """Return ``True`` if ``qty`` is a non-integral float or decimal string."""
+    if isinstance(qty, float):
+        return not qty.is_integer()
+    if isinstance(qty, str):
+        # "1.50" -> "1.5" keeps its point, "2.00" -> "2" does not
+        return "." in qty.rstrip("0").rstrip(".")
+    return False
+
+
+# Numeric fields copied from Alpaca position payloads
+_POSITION_FIELDS = (
+    "qty",
+    "market_value",
+    "avg_entry_price",
+    "current_price",
+    "unrealized_plpc",
+)
 
 
 class AlpacaClient:
-    def __init__(self, data_feed: str = DATA_FEED):
+    def __init__(self, data_feed: str = DATA_FEED, cache: FileCache | None = None):
         """Initialize the Alpaca API client.
 
         Parameters
@@ -39,6 +229,10 @@ class AlpacaClient:
         data_feed : str, optional
             Market data feed to use (``"iex"`` or ``"sip"``), by default
             configured via :data:`config.DATA_FEED`.
+        cache : FileCache, optional
+            Cache for historical bars. Defaults to a cache under
+            :data:`config.ALPACA_CACHE_DIR` unless ``ALPACA_CACHE_ENABLED`` is
+            false.
         """
         logger.debug(
             "Initializing AlpacaClient with BASE_URL: %s and API_KEY: %s",
@@ -46,7 +240,19 @@ class AlpacaClient:
             API_KEY,
         )
         self.api = tradeapi.REST(API_KEY, API_SECRET, BASE_URL, api_version="v2")
+        # ``REST`` does not accept a session argument, so swap in the shared
+        # pooled session to avoid a TCP/TLS handshake per client.
+        self._session = get_session()
+        self.api._session = self._session
         self.data_feed = data_feed
+        if cache is None and ALPACA_CACHE_ENABLED:
+            cache = FileCache(ALPACA_CACHE_DIR)
+        self.cache = cache
+        # (fetched_at, balances) from get_account; kept in memory only
+        self._account: tuple[float, dict] | None = None
+        # Watchlist name -> id map used by add_to_watchlist
+        self._wl_cache: dict[str, str] = {}
+        self._wl_cache_ts = 0.0
 
     def safe_float(self, val, default=0.0):
         """Return ``val`` converted to ``float`` or ``default`` on failure."""
@@ -56,12 +262,47 @@ class AlpacaClient:
         except (ValueError, TypeError):
             return default
 
+    def _cached_call(self, endpoint, ttl, fetch, *args):
+        """Return ``fetch(*args)``, served from ``self.cache`` within ``ttl``.
+
+        Keys include the endpoint URL and API key so paper and live accounts
+        never share entries.
+        """
+        if self.cache is None:
+            return fetch(*args)
+        key = (BASE_URL, API_KEY, *args)
+        return self.cache.get_or_fetch(endpoint, key, ttl, partial(fetch, *args))
+
+    def _invalidate(self, *endpoints):
+        """Drop cached reads made stale by a write."""
+        if "account" in endpoints:
+            self._account = None
+        if self.cache is not None:
+            for endpoint in endpoints:
+                self.cache.invalidate(endpoint)
+
     @handle_api_errors
     def get_account(self):
+        """Return sanitized account balances, cached for ``ACCOUNT_TTL`` seconds.
+
+        Balances are kept in memory only, never in the on-disk cache, and are
+        dropped by every order submission or cancellation.
+        """
+        if self.cache is None:
+            return self._fetch_account()
+        now = time.monotonic()
+        if self._account is not None and now - self._account[0] < ACCOUNT_TTL:
+            return self._account[1]
+        account = self._fetch_account()
+        self._account = (now, account)
+        return account
+
+    def _fetch_account(self):
         logger.debug("Fetching account information via GET /account")
         try:
             account = self.api.get_account()
-            logger.debug("Account fetched successfully: %s", account)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Account fetched successfully: %s", account)
             # Sanitize and return only the relevant fields
             sanitized_account = {
                 "cash": self.safe_float(account.cash),
@@ -69,7 +310,8 @@ class AlpacaClient:
                 "equity": self.safe_float(account.equity),
                 "portfolio_value": self.safe_float(account.portfolio_value),
             }
-            logger.debug("Sanitized account: %s", sanitized_account)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Sanitized account: %s", sanitized_account)
             return sanitized_account
         except Exception as e:
             logger.error("Error fetching account information: %s", e, exc_info=True)
@@ -93,16 +335,12 @@ class AlpacaClient:
             time_in_force,
         )
 
-        try:
-            qty_val = float(qty)
-            if qty_val % 1 != 0 and time_in_force.lower() != "day":
+        if _is_fractional(qty) and time_in_force.lower() != "day":
+            if logger.isEnabledFor(logging.DEBUG):
                 logger.debug(
                     "Overriding time_in_force to 'day' for fractional qty %s", qty
                 )
-                time_in_force = "day"
-        except Exception:
-            # If conversion fails, just proceed with provided values
-            pass
+            time_in_force = "day"
 
         try:
             order = self.api.submit_order(
@@ -112,49 +350,124 @@ class AlpacaClient:
                 type=order_type,
                 time_in_force=time_in_force,
             )
-            logger.debug("Order submitted successfully: %s", order)
+            self._invalidate("account", "positions", "orders")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Order submitted successfully: %s", order)
             return order
         except Exception as e:
             logger.error("Error submitting order: %s", e, exc_info=True)
             raise
 
+    def submit_orders_bulk(self, orders, max_concurrency=ORDER_CONCURRENCY):
+        """Submit many orders concurrently over the shared session.
+
+        Parameters
+        ----------
+        orders : Iterable[dict]
+            Each dict requires ``symbol``, ``qty`` and ``side`` and may set
+            ``order_type`` (default ``"market"``) and ``time_in_force``
+            (default ``"gtc"``).
+        max_concurrency : int, optional
+            Maximum number of orders in flight, capped at ``MAX_CONCURRENCY``
+            so workers never wait on the session's connection pool.
+
+        Returns
+        -------
+        list
+            Results in the same order as ``orders``. Each item is the
+            submitted order or the exception raised for that order, so one
+            rejection does not hide the outcome of the others.
+        """
+        orders = list(orders)
+        if not orders:
+            return []
+
+        def submit(order):
+            try:
+                return self.submit_order(
+                    order["symbol"],
+                    order["qty"],
+                    order["side"],
+                    order.get("order_type", "market"),
+                    order.get("time_in_force", "gtc"),
+                )
+            except Exception as e:
+                return e
+
+        workers = max(1, min(max_concurrency, MAX_CONCURRENCY, len(orders)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(submit, orders))
+
     def list_positions(self):
         """Return current open positions with key pricing fields.
 
         The returned dictionaries contain ``symbol``, ``qty``, ``market_value``,
         ``avg_entry_price``, ``current_price`` and ``unrealized_pl_percent``.
         ``avg_entry_price`` and ``current_price`` allow downstream consumers to
-        compute profit/loss metrics directly.
+        compute profit/loss metrics directly. Results are cached for
+        ``POSITIONS_TTL`` seconds and dropped whenever an order is placed or
+        canceled.
         """
+        return self._cached_call("positions", POSITIONS_TTL, self._fetch_positions)
+
+    def _fetch_positions(self):
 
         logger.debug("Listing all positions via GET /positions")
         try:
             positions = self.api.list_positions()
-            sanitized_positions = []
-            for pos in positions:
-                sanitized_positions.append(
-                    {
-                        "symbol": pos.symbol,
-                        "qty": self.safe_float(pos.qty),
-                        "market_value": self.safe_float(pos.market_value),
-                        "avg_entry_price": self.safe_float(
-                            getattr(pos, "avg_entry_price", None)
-                        ),
-                        "current_price": self.safe_float(
-                            getattr(pos, "current_price", None)
-                        ),
-                        "unrealized_pl_percent": self.safe_float(
-                            getattr(pos, "unrealized_plpc", 0)
-                        )
-                        * 100,
-                    }
-                )
-            logger.debug("Sanitized positions: %s", sanitized_positions)
+            sanitized_positions = self._sanitize_positions(positions)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Sanitized positions: %s", sanitized_positions)
             return sanitized_positions
         except Exception as e:
             logger.error("Error listing positions: %s", e, exc_info=True)
             raise
 
+    def _sanitize_positions(self, positions):
+        """Convert Alpaca position entities into plain dictionaries.
+
+        Entities carrying their ``_raw`` JSON payload are converted in one
+        vectorized pandas pass; other objects fall back to per-attribute
+        coercion with :meth:`safe_float`.
+        """
+        raw = [getattr(pos, "_raw", None) for pos in positions]
+        if raw and all(isinstance(r, dict) for r in raw):
+            df = pd.DataFrame.from_records(raw, columns=["symbol", *_POSITION_FIELDS])
+            numeric = (
+                df[list(_POSITION_FIELDS)]
+                .apply(pd.to_numeric, errors="coerce")
+                .fillna(0.0)
+                .astype("float64")
+            )
+            records = pd.DataFrame(
+                {
+                    "symbol": df["symbol"],
+                    "qty": numeric["qty"],
+                    "market_value": numeric["market_value"],
+                    "avg_entry_price": numeric["avg_entry_price"],
+                    "current_price": numeric["current_price"],
+                    "unrealized_pl_percent": numeric["unrealized_plpc"] * 100,
+                }
+            )
+            return records.to_dict("records")
+
+        return [
+            {
+                "symbol": pos.symbol,
+                "qty": self.safe_float(pos.qty),
+                "market_value": self.safe_float(pos.market_value),
+                "avg_entry_price": self.safe_float(
+                    getattr(pos, "avg_entry_price", None)
+                ),
+                "current_price": self.safe_float(getattr(pos, "current_price", None)),
+                "unrealized_pl_percent": self.safe_float(
+                    getattr(pos, "unrealized_plpc", 0)
+                )
+                * 100,
+            }
+            for pos in positions
+        ]
+
     def get_position(self, symbol):
         """Return position information for ``symbol`` with pricing fields."""
 
@@ -176,7 +489,8 @@ class AlpacaClient:
                 )
                 * 100,
             }
-            logger.debug("Sanitized position: %s", sanitized_position)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Sanitized position: %s", sanitized_position)
             return sanitized_position
         except Exception as e:
             logger.error(
@@ -188,28 +502,43 @@ class AlpacaClient:
         logger.debug("Canceling order with ID: %s", order_id)
         try:
             result = self.api.cancel_order(order_id)
-            logger.debug("Order canceled: %s", result)
+            self._invalidate("account", "positions", "orders")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Order canceled: %s", result)
             return result
         except Exception as e:
             logger.error("Error canceling order %s: %s", order_id, e, exc_info=True)
             raise
 
     def list_orders(self, status="open"):
+        """Return orders with ``status``, cached for ``ORDERS_TTL`` seconds."""
+        orders = self._cached_call("orders", ORDERS_TTL, self._fetch_orders, status)
+        return [_as_order(o) for o in orders]
+
+    def _fetch_orders(self, status):
         logger.debug("Listing orders with status: %s", status)
         try:
             orders = self.api.list_orders(status=status)
-            logger.debug("Orders retrieved: %s", orders)
-            return orders
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Orders retrieved: %s", orders)
+            return [_raw_entity(o) for o in orders]
         except Exception as e:
             logger.error("Error listing orders: %s", e, exc_info=True)
             raise
 
     def list_watchlists(self):
+        watchlists = self._cached_call(
+            "watchlists", WATCHLISTS_TTL, self._fetch_watchlists
+        )
+        return [_as_watchlist(w) for w in watchlists]
+
+    def _fetch_watchlists(self):
         logger.debug("Listing all watchlists")
         try:
             watchlists = self.api.get_watchlists()
-            logger.debug("Watchlists retrieved: %s", watchlists)
-            return watchlists
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Watchlists retrieved: %s", watchlists)
+            return [_raw_entity(w) for w in watchlists]
         except Exception as e:
             logger.error("Error listing watchlists: %s", e, exc_info=True)
             raise
@@ -218,35 +547,78 @@ class AlpacaClient:
         logger.debug("Creating watchlist with name: %s and symbols: %s", name, symbols)
         try:
             wl = self.api.create_watchlist(name=name, symbols=symbols)
-            logger.debug("Watchlist created successfully: %s", wl)
+            self._invalidate("watchlists", "watchlist")
+            # Record the new id so the next add by name needs no lookup
+            self._expire_watchlist_ids()
+            self._wl_cache[name.lower()] = wl.id
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Watchlist created successfully: %s", wl)
             return wl
         except Exception as e:
             logger.error("Error creating watchlist: %s", e, exc_info=True)
             raise
 
+    def _resolve_watchlist_id(self, name):
+        """Return the id of the watchlist called ``name`` (case-insensitive).
+
+        Names are remembered for ``WATCHLIST_CACHE_TTL`` seconds. An unknown
+        name is first looked up with Alpaca's by-name endpoint, which costs
+        one small round trip; only when that misses (e.g. the case differs)
+        is the full watchlist list fetched and matched.
+        """
+        key = name.lower()
+        self._expire_watchlist_ids()
+        if key in self._wl_cache:
+            return self._wl_cache[key]
+        try:
+            wl = self.api.get_watchlist_by_name(name)
+        except (tradeapi.rest.APIError, requests.HTTPError):
+            self._wl_cache = {w.name.lower(): w.id for w in self.list_watchlists()}
+            self._wl_cache_ts = time.monotonic()
+        else:
+            self._wl_cache[key] = wl.id
+        try:
+            return self._wl_cache[key]
+        except KeyError:
+            raise ValueError(f"No watchlist found with name {name}") from None
+
+    def _expire_watchlist_ids(self):
+        """Start a fresh name map once the current one is older than the TTL."""
+        if time.monotonic() - self._wl_cache_ts > WATCHLIST_CACHE_TTL:
+            self._wl_cache = {}
+            self._wl_cache_ts = time.monotonic()
+
+    def _forget_watchlist(self, watchlist_id):
+        """Drop ``watchlist_id`` from the name map and the cached reads."""
+        self._wl_cache = {
+            name: wl_id
+            for name, wl_id in self._wl_cache.items()
+            if wl_id != watchlist_id
+        }
+        self._invalidate("watchlists", "watchlist")
+
     def add_to_watchlist(self, watchlist_identifier, symbol):
         if not str(watchlist_identifier).isdigit():
-            watchlists = self.api.list_watchlists()
-            matching = [
-                w for w in watchlists if w.name.lower() == watchlist_identifier.lower()
-            ]
-            if matching:
-                watchlist_id = matching[0].id
-            else:
-                raise ValueError(f"No watchlist found with name {watchlist_identifier}")
+            watchlist_id = self._resolve_watchlist_id(watchlist_identifier)
         else:
             watchlist_id = watchlist_identifier
 
         result = self.api.add_to_watchlist(watchlist_id, symbol)
+        self._invalidate("watchlists", "watchlist")
         return result
 
     def remove_from_watchlist(self, watchlist_id, symbol):
         logger.debug("Removing symbol %s from watchlist %s", symbol, watchlist_id)
         try:
             result = self.api.remove_from_watchlist(watchlist_id, symbol)
-            logger.debug(
-                "Symbol %s removed from watchlist %s: %s", symbol, watchlist_id, result
-            )
+            self._invalidate("watchlists", "watchlist")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Symbol %s removed from watchlist %s: %s",
+                    symbol,
+                    watchlist_id,
+                    result,
+                )
             return result
         except Exception as e:
             logger.error(
@@ -259,11 +631,19 @@ class AlpacaClient:
             raise
 
     def get_watchlist(self, watchlist_id):
+        return _as_watchlist(
+            self._cached_call(
+                "watchlist", WATCHLISTS_TTL, self._fetch_watchlist, watchlist_id
+            )
+        )
+
+    def _fetch_watchlist(self, watchlist_id):
         logger.debug("Fetching watchlist with ID: %s", watchlist_id)
         try:
             wl = self.api.get_watchlist(watchlist_id)
-            logger.debug("Watchlist retrieved: %s", wl)
-            return wl
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Watchlist retrieved: %s", wl)
+            return _raw_entity(wl)
         except Exception as e:
             logger.error(
                 "Error fetching watchlist %s: %s", watchlist_id, e, exc_info=True
@@ -274,7 +654,9 @@ class AlpacaClient:
         logger.debug("Deleting watchlist with ID: %s", watchlist_id)
         try:
             result = self.api.delete_watchlist(watchlist_id)
-            logger.debug("Watchlist deleted: %s", result)
+            self._forget_watchlist(watchlist_id)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Watchlist deleted: %s", result)
             return result
         except Exception as e:
             logger.error(
@@ -301,13 +683,56 @@ class AlpacaClient:
         pandas.DataFrame | None
             DataFrame of bar data indexed by time or ``None`` if retrieval fails.
             Uses ``self.data_feed`` when querying the Alpaca API.
+
+        Notes
+        -----
+        Results are cached on disk via ``self.cache`` for
+        :data:`config.BARS_DAILY_TTL` seconds for daily bars and
+        :data:`config.BARS_INTRADAY_TTL` otherwise. Intraday entries are also
+        keyed by the current bar interval. Daily entries past half their TTL
+        are served while being refreshed in the background.
+        """
+        return self._cached_bars(
+            "bars", symbol, days, timeframe, self._fetch_historical_bars
+        )
+
+    def get_historical_close_volume(
+        self, symbol, days=30, timeframe=tradeapi.rest.TimeFrame.Day
+    ):
+        """Return ``(closes, volumes)`` NumPy arrays for ``symbol``.
+
+        A lighter alternative to :meth:`get_historical_bars` for callers that
+        only need closing prices and volume: the arrays are filled straight
+        from the raw bar payload without building a DataFrame. Cached the same
+        way as :meth:`get_historical_bars`.
+
+        Returns
+        -------
+        tuple[numpy.ndarray, numpy.ndarray] | None
+            Float64 close and volume arrays in time order, or ``None`` if
+            retrieval fails.
         """
-        from datetime import datetime, timedelta
+        return self._cached_bars(
+            "close_volume", symbol, days, timeframe, self._fetch_close_volume
+        )
 
-        end_dt = datetime.utcnow()
-        start_dt = end_dt - timedelta(days=days)
-        start = start_dt.strftime("%Y-%m-%dT%H:%M:%SZ")
-        end = end_dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+    def _cached_bars(self, endpoint, symbol, days, timeframe, fetch):
+        # One timestamp per call feeds both the cache key and the bar window.
+        now = datetime.utcnow()
+        load = partial(fetch, symbol, days, timeframe, now)
+        if self.cache is None:
+            return load()
+        key = self._bars_cache_key(symbol, days, timeframe, now)
+        # Serving stale-while-refreshing is only acceptable for daily bars
+        return self.cache.get_or_fetch(
+            endpoint, key, _bars_ttl(timeframe), load, revalidate=_is_daily(timeframe)
+        )
+
+    def _bars_cache_key(self, symbol, days, timeframe, now):
+        return (symbol, str(timeframe), days, self.data_feed, _bars_bucket(timeframe, now))
+
+    def _fetch_historical_bars(self, symbol, days, timeframe, now=None):
+        start, end = _bar_window(days, timeframe, now)
         try:
             bars = self.api.get_bars(symbol, timeframe, start, end, feed=self.data_feed)
             return bars.df if hasattr(bars, "df") else None
@@ -317,6 +742,88 @@ class AlpacaClient:
             )
             return None
 
+    def _fetch_close_volume(self, symbol, days, timeframe, now=None):
+        start, end = _bar_window(days, timeframe, now)
+        try:
+            bars = self.api.get_bars(symbol, timeframe, start, end, feed=self.data_feed)
+            raw = bars._raw
+            closes = np.empty(len(raw), dtype=np.float64)
+            volumes = np.empty(len(raw), dtype=np.float64)
+            for i, bar in enumerate(raw):
+                closes[i] = bar["c"]
+                volumes[i] = bar["v"]
+            return closes, volumes
+        except Exception as e:
+            logger.error(
+                "Error fetching historical bars for %s: %s", symbol, e, exc_info=True
+            )
+            return None
+
+    def get_historical_bars_multi(
+        self, symbols, days=30, timeframe=tradeapi.rest.TimeFrame.Day
+    ):
+        """Return historical bars for many symbols using a single request.
+
+        Parameters
+        ----------
+        symbols : Iterable[str]
+            Tickers to query.
+        days : int, optional
+            Number of days of data to retrieve, by default 30.
+        timeframe : TimeFrame, optional
+            Bar timeframe, by default ``TimeFrame.Day``.
+
+        Returns
+        -------
+        dict[str, pandas.DataFrame]
+            Mapping of symbol to its bar DataFrame indexed by time. Symbols
+            without data are omitted; an empty dict is returned on failure.
+
+        Notes
+        -----
+        Frames share the on-disk cache entries of :meth:`get_historical_bars`;
+        only symbols missing from the cache are requested, still in a single
+        call.
+        """
+        symbols = list(dict.fromkeys(symbols))
+        if not symbols:
+            return {}
+        now = datetime.utcnow()
+        if self.cache is None:
+            return self._fetch_bars_multi(symbols, days, timeframe, now)
+
+        keys = {s: self._bars_cache_key(s, days, timeframe, now) for s in symbols}
+        frames = {}
+        for sym, key in keys.items():
+            cached = self.cache.get("bars", key)
+            if cached is not None:
+                frames[sym] = cached
+        missing = [s for s in symbols if s not in frames]
+        if missing:
+            fetched = self._fetch_bars_multi(missing, days, timeframe, now)
+            ttl = _bars_ttl(timeframe)
+            for sym, frame in fetched.items():
+                self.cache.set("bars", keys[sym], frame, ttl)
+            frames.update(fetched)
+        return {s: frames[s] for s in symbols if s in frames}
+
+    def _fetch_bars_multi(self, symbols, days, timeframe, now=None):
+        start, end = _bar_window(days, timeframe, now)
+        try:
+            bars = self.api.get_bars(symbols, timeframe, start, end, feed=self.data_feed)
+            df = bars.df if hasattr(bars, "df") else None
+        except Exception as e:
+            logger.error(
+                "Error fetching historical bars for %s: %s", symbols, e, exc_info=True
+            )
+            return {}
+        if df is None or df.empty or "symbol" not in df.columns:
+            return {}
+        return {
+            sym: frame.drop(columns="symbol")
+            for sym, frame in df.groupby("symbol", sort=False)
+        }
+
     def get_latest_price(self, symbol):
         """Return the latest trade price for ``symbol`` or ``None``.
 
@@ -330,3 +837,55 @@ class AlpacaClient:
                 "Error fetching latest price for %s: %s", symbol, e, exc_info=True
             )
             return None
+
+    def get_latest_prices(self, symbols):
+        """Return a mapping of ``symbol`` to latest price for many symbols.
+
+        All symbols are fetched with one multi-symbol latest-bars request. If
+        that request fails, per-symbol requests are issued concurrently over
+        the shared session instead. Symbols whose price cannot be retrieved
+        map to ``None``.
+        """
+        symbols = list(dict.fromkeys(symbols))
+        if not symbols:
+            return {}
+        try:
+            bars = self.api.get_latest_bars(symbols, feed=self.data_feed)
+            return {
+                sym: float(bars[sym].c) if sym in bars else None for sym in symbols
+            }
+        except Exception as e:
+            logger.debug("Batched latest bars failed, fetching per symbol: %s", e)
+        workers = min(MAX_CONCURRENCY, len(symbols))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            prices = pool.map(self.get_latest_price, symbols)
+        return dict(zip(symbols, prices))
+
+    def bar_stream(self):
+        """Return a :class:`~fundrunner.alpaca._bar_stream.BarStream` for minute bars.
+
+        The stream connects to ``DATA_STREAM_URL`` and delivers raw message
+        dicts (``S`` symbol, ``c`` close, ...) to handlers registered with
+        ``subscribe_bars``.
+        """
+        from fundrunner.alpaca._bar_stream import BarStream
+
+        return BarStream(API_KEY, API_SECRET, DATA_STREAM_URL, self.data_feed)
+
+
+_default_client = None
+_default_client_lock = threading.Lock()
+
+
+def get_client():
+    """Return the process-wide :class:`AlpacaClient`, creating it on first use.
+
+    Managers share this instance so the whole process uses one REST client
+    and one connection pool.
+    """
+    global _default_client
+    if _default_client is None:
+        with _default_client_lock:
+            if _default_client is None:
+                _default_client = AlpacaClient()
+    return _default_client
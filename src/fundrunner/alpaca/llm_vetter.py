@@ -1,45 +1,92 @@
-
 """Evaluate proposed trades using a large language model."""
 
 import logging
+import re
+import time
+from collections import OrderedDict
 from fundrunner.utils.gpt_client import ask_gpt
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
 
+# Leading verdict token requested from the LLM; only the first few characters are inspected
+_VERDICT_RE = re.compile(r"\W*(APPROVED|REJECTED)\b", re.IGNORECASE)
+_VERDICT_SCAN_CHARS = 16
+
+
 class LLMVetter:
-    def __init__(self, vendor="local"):
+    def __init__(self, vendor="local", cache_size=512, cache_ttl=60.0):
         """
         Args:
             vendor (str): Vendor to use for LLM query.
                           (Note: This parameter is maintained for compatibility,
                            but the actual LLM query logic now uses the unified ask_gpt function.)
+            cache_size (int): Maximum number of recent verdicts kept in memory.
+            cache_ttl (float): Seconds a cached verdict is reused for identical trade details.
         """
         self.vendor = vendor.lower()
+        self.cache_size = cache_size
+        self.cache_ttl = cache_ttl
+        self._cache = OrderedDict()
+
+    @staticmethod
+    def _cache_key(trade_details: dict, prompt: str | None):
+        return tuple(sorted((k, repr(v)) for k, v in trade_details.items())), prompt
+
+    def _cached_verdict(self, key):
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        verdict, stored_at = entry
+        if time.monotonic() - stored_at > self.cache_ttl:
+            del self._cache[key]
+            return None
+        self._cache.move_to_end(key)
+        return verdict
+
+    def _store_verdict(self, key, verdict: bool) -> None:
+        self._cache[key] = (verdict, time.monotonic())
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
 
     def vet_trade_logic(self, trade_details: dict, prompt: str = None) -> bool:
         """
         Sends trade logic details to an LLM for review and returns whether the trade is approved.
-        
+
+        The LLM is asked to start its reply with ``APPROVED`` or ``REJECTED``;
+        only that leading token is inspected. Verdicts for identical trade
+        details are reused for ``cache_ttl`` seconds to skip repeat LLM calls.
+
         Args:
             trade_details (dict): A dictionary containing trade details.
             prompt (str, optional): A custom prompt. Defaults to a prompt that reviews the provided trade details.
-        
+
         Returns:
             bool: True if the trade is approved by the LLM, otherwise False.
         """
+        key = self._cache_key(trade_details, prompt)
+        cached = self._cached_verdict(key)
+        if cached is not None:
+            return cached
         if prompt is None:
-            prompt = f"Review the following trade statistics. What stands out about this trade? What is another statistic that should be measured in evaluating the trade? Details: {trade_details}"
+            prompt = (
+                f"Review the following trade statistics. What stands out about this trade? "
+                f"What is another statistic that should be measured in evaluating the trade? "
+                f"Details: {trade_details}\n"
+                "Reply with exactly one token on the first line: APPROVED or REJECTED"
+            )
         try:
             response = ask_gpt(prompt)
             if response:
-                response_lower = response.lower()
-                logger.debug("LLM vetting response: %s", response_lower)
-                return "approved" in response_lower or "yes" in response_lower
+                logger.debug("LLM vetting response: %s", response)
+                match = _VERDICT_RE.match(response[:_VERDICT_SCAN_CHARS])
+                approved = bool(match) and match.group(1).upper() == "APPROVED"
+                self._store_verdict(key, approved)
+                return approved
             else:
                 logger.error("No response received from LLM vetting.")
                 return False
         except Exception as e:
             logger.error("Error during LLM vetting: %s", e, exc_info=True)
             return False
-
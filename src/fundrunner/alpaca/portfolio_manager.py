@@ -1,21 +1,53 @@
 """Simplified wrappers for viewing and adjusting an Alpaca portfolio."""
 
+import asyncio
 from typing import Iterable
-from fundrunner.alpaca.api_client import AlpacaClient
+from fundrunner.alpaca.api_client import get_client
 from fundrunner.alpaca.trade_manager import TradeManager
 from fundrunner.services.notifications import notify
 
+_POSITION_KEYS = (
+    "symbol",
+    "qty",
+    "market_value",
+    "avg_entry_price",
+    "current_price",
+    "unrealized_pl_percent",
+)
+
+
+def _normalize_position(pos) -> dict:
+    """Return ``pos`` as a plain dict with the standard position keys.
+
+    ``AlpacaClient.list_positions`` already yields such dicts; objects exposing
+    the fields as attributes are converted once here so callers can use
+    direct key access.
+    """
+    if isinstance(pos, dict):
+        return pos
+    return {key: getattr(pos, key, None) for key in _POSITION_KEYS}
+
 
 class PortfolioManager:
-    def __init__(self) -> None:
-        self.client = AlpacaClient()
-        self.trader = TradeManager()
+    def __init__(self, client=None) -> None:
+        """Wrap ``client``, defaulting to the shared one from ``get_client()``."""
+        self.client = client or get_client()
+        self.trader = TradeManager(self.client)
 
     def view_account(self):
+        """Return account details; the client caches them briefly."""
         return self.client.get_account()
 
+    async def view_account_async(self):
+        """Async :meth:`view_account`; the request runs in a worker thread."""
+        return await asyncio.to_thread(self.view_account)
+
+    async def view_positions_async(self):
+        """Async :meth:`view_positions`; the request runs in a worker thread."""
+        return await asyncio.to_thread(self.view_positions)
+
     def view_positions(self):
-        return self.client.list_positions()
+        return [_normalize_position(pos) for pos in self.client.list_positions()]
 
     def view_position(self, symbol):
         return self.client.get_position(symbol)
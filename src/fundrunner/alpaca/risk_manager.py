@@ -1,6 +1,9 @@
 """Utilities for adjusting risk parameters based on recent market data."""
-from datetime import datetime, timedelta
-from fundrunner.alpaca.api_client import AlpacaClient
+import warnings
+from datetime import date
+
+import numpy as np
+from fundrunner.alpaca.api_client import AlpacaClient, get_client
 from fundrunner.services.notifications import notify
 
 class RiskManager:
@@ -17,33 +20,50 @@ class RiskManager:
             base_allocation_limit: Default fraction of buying power to allocate per trade.
             base_risk_threshold: Default minimum simulated probability of profit required.
             minimum_allocation: Minimum allocation floor.
-            client: Optional ``AlpacaClient`` used to fetch historical bars.
+            client: Optional ``AlpacaClient`` used to fetch historical bars. Defaults
+                to the shared client from ``get_client()``.
         """
         self.base_allocation_limit = base_allocation_limit
         self.base_risk_threshold = base_risk_threshold
         self.minimum_allocation = minimum_allocation
-        self.client = client or AlpacaClient()
+        self.client = client or get_client()
+        # Daily bars only change once per session, so results are reused per day.
+        self._param_cache: dict[tuple[str, date], tuple[float, float]] = {}
 
-    def adjust_parameters(self, symbol):
+    def adjust_parameters(self, symbol, data=None):
         """
         Adjusts allocation and risk threshold parameters based on recent volatility and volume.
         Args:
             symbol (str): The ticker symbol for which to compute adjustments.
+            data (pandas.DataFrame, optional): Pre-fetched bars with ``close`` and
+                ``volume`` (or ``Close`` and ``Volume``) columns, e.g. from
+                ``get_historical_bars_multi``. When omitted the last 30 days of
+                closes and volumes are fetched for ``symbol`` as NumPy arrays.
         Returns:
             (tuple): (adjusted_allocation_limit, adjusted_risk_threshold)
+                Results for fetched bars are cached per symbol for the current
+                day; supplied ``data`` is always evaluated.
         """
+        key = (symbol, date.today()) if data is None else None
+        if key in self._param_cache:
+            return self._param_cache[key]
         try:
-            end_dt = datetime.utcnow()
-            start_dt = end_dt - timedelta(days=30)
-            start = start_dt.strftime("%Y-%m-%dT%H:%M:%SZ")
-            end = end_dt.strftime("%Y-%m-%dT%H:%M:%SZ")
-            data = self.client.get_bars(symbol, start=start, end=end)
-            if data.empty:
+            if data is None:
+                series = self.client.get_historical_close_volume(symbol, days=30)
+                if series is None:
+                    return self.base_allocation_limit, self.base_risk_threshold
+                closes, volumes = series
+            else:
+                close_col = "close" if "close" in data.columns else "Close"
+                volume_col = "volume" if "volume" in data.columns else "Volume"
+                closes = data[close_col].to_numpy(dtype=np.float64)
+                volumes = data[volume_col].to_numpy(dtype=np.float64)
+            if closes.size == 0:
                 return self.base_allocation_limit, self.base_risk_threshold
 
             # Compute volatility as the standard deviation of daily returns.
-            data["Return"] = data["close"].pct_change()
-            volatility = data['Return'].std()
+            rets = np.diff(closes) / closes[:-1]
+            volatility = float(rets.std(ddof=1)) if rets.size > 1 else 0.0
 
             if volatility > 0:
                 # Instead of scaling allocation upward when volatility is low,
@@ -57,7 +77,7 @@ class RiskManager:
             adjusted_allocation = max(adjusted_allocation, self.minimum_allocation)
 
             # Incorporate volume: if average volume is low, reduce allocation further.
-            avg_volume = data['volume'].mean()
+            avg_volume = float(volumes.mean())
             if avg_volume < 1e6:
                 adjusted_allocation *= 0.8  # reduce allocation by 20%
 
@@ -65,11 +85,69 @@ class RiskManager:
             adjusted_risk_threshold = self.base_risk_threshold + (volatility * 10)
             adjusted_risk_threshold = min(adjusted_risk_threshold, 0.9)
 
+            if key is not None:
+                self._param_cache[key] = (adjusted_allocation, adjusted_risk_threshold)
             return adjusted_allocation, adjusted_risk_threshold
         except Exception:
             # In case of any error, return the base parameters.
             return self.base_allocation_limit, self.base_risk_threshold
 
+    def adjust_parameters_many(self, symbols):
+        """
+        Vectorized :meth:`adjust_parameters` for a list of symbols.
+
+        Bars for all symbols are fetched in one ``get_historical_bars_multi``
+        request and stacked into a NaN-padded ``(N, T)`` matrix so volatility,
+        volume and the clamp rules are evaluated in a single NumPy pass.
+        Args:
+            symbols (list[str]): Ticker symbols to compute adjustments for.
+        Returns:
+            dict[str, tuple]: Symbol -> (adjusted_allocation_limit, adjusted_risk_threshold).
+                Symbols without usable bars receive the base parameters.
+        """
+        symbols = list(dict.fromkeys(symbols))
+        base = (self.base_allocation_limit, self.base_risk_threshold)
+        today = date.today()
+        results = {s: self._param_cache.get((s, today), base) for s in symbols}
+        missing = [s for s in symbols if (s, today) not in self._param_cache]
+        if not missing:
+            return results
+        try:
+            frames = self.client.get_historical_bars_multi(missing, days=30)
+        except Exception:
+            return results
+        frames = {s: f for s, f in frames.items() if s in missing and not f.empty}
+        if not frames:
+            return results
+
+        width = max(len(f) for f in frames.values())
+        closes = np.full((len(frames), width), np.nan)
+        volumes = np.full((len(frames), width), np.nan)
+        for row, frame in enumerate(frames.values()):
+            # Right-align so every row ends at the most recent bar.
+            closes[row, width - len(frame):] = frame["close"].to_numpy(dtype=np.float64)
+            volumes[row, width - len(frame):] = frame["volume"].to_numpy(dtype=np.float64)
+
+        # Rows with fewer than two returns yield NaN stats; those are masked below.
+        with np.errstate(invalid="ignore", divide="ignore"), warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            rets = np.diff(closes, axis=1) / closes[:, :-1]
+            counts = np.count_nonzero(~np.isnan(rets), axis=1)
+            vols = np.where(counts > 1, np.nanstd(rets, axis=1, ddof=1), 0.0)
+            avg_volumes = np.nanmean(volumes, axis=1)
+            multipliers = np.where(vols > 0, np.minimum(0.02 / vols, 1.0), 1.0)
+
+        allocations = np.maximum(
+            self.base_allocation_limit * multipliers, self.minimum_allocation
+        )
+        allocations = np.where(avg_volumes < 1e6, allocations * 0.8, allocations)
+        thresholds = np.minimum(self.base_risk_threshold + vols * 10, 0.9)
+
+        for symbol, alloc, threshold in zip(frames, allocations, thresholds):
+            results[symbol] = (float(alloc), float(threshold))
+            self._param_cache[(symbol, today)] = results[symbol]
+        return results
+
     def check_threshold(self, name: str, value: float, limit: float) -> bool:
         """Notify if ``value`` exceeds ``limit``.
 
@@ -1,9 +1,9 @@
 """Convenience wrapper for submitting Alpaca trade orders."""
-from fundrunner.alpaca.api_client import AlpacaClient
+from fundrunner.alpaca.api_client import get_client
 
 class TradeManager:
-    def __init__(self):
-        self.client = AlpacaClient()
+    def __init__(self, client=None):
+        self.client = client or get_client()
 
     def buy(self, symbol, qty, order_type='market', time_in_force='gtc'):
         return self.client.submit_order(symbol, qty, 'buy', order_type, time_in_force)
@@ -11,6 +11,10 @@ class TradeManager:
     def sell(self, symbol, qty, order_type='market', time_in_force='gtc'):
         return self.client.submit_order(symbol, qty, 'sell', order_type, time_in_force)
 
+    def submit_orders(self, orders, **kwargs):
+        """Submit several orders concurrently; see ``AlpacaClient.submit_orders_bulk``."""
+        return self.client.submit_orders_bulk(orders, **kwargs)
+
     def cancel_order(self, order_id):
         return self.client.cancel_order(order_id)
 
@@ -8,13 +8,16 @@ account info retrieval, position monitoring and order execution.
 
 import asyncio
 import logging
-import math
 import sys
 import smtplib
+import threading
+import time
+import warnings
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 import re
 
+import numpy as np
 from rich.console import Console
 from rich.table import Table
 from rich.layout import Layout
@@ -23,9 +26,9 @@ from rich.panel import Panel
 from fundrunner.dashboards.dashboard import Dashboard
 from fundrunner.dashboards.textual_dashboard import DashboardApp
 
-from fundrunner.alpaca.api_client import AlpacaClient
+from fundrunner.alpaca._kernels import trade_stats
+from fundrunner.alpaca.api_client import get_client
 from fundrunner.alpaca.portfolio_manager import PortfolioManager
-from fundrunner.alpaca.trade_manager import TradeManager
 from fundrunner.alpaca.chatgpt_advisor import get_account_overview
 from fundrunner.alpaca.llm_vetter import LLMVetter
 from fundrunner.alpaca.risk_manager import RiskManager
@@ -43,6 +46,24 @@ from fundrunner.utils.config import (
     PORTFOLIO_MANAGER_MODE,
 )
 
+# Maximum number of tickers evaluated concurrently in :meth:`TradingBot.run`
+EVAL_CONCURRENCY = 8
+
+# Seconds an LLM-suggested default ticker list is reused across bot runs
+LLM_TICKERS_TTL = 3600
+
+# Seconds between position polls while the bar stream is disconnected
+POSITION_POLL_INTERVAL = 60
+
+# Seconds between REST reconciliation sweeps while bars are streaming
+STREAM_RECONCILE_INTERVAL = 900
+
+# Consecutive failed bar-stream connections before monitoring only polls
+STREAM_MAX_RECONNECTS = 5
+
+_TICKER_RE = re.compile(r"\b[A-Z]{2,5}\b")
+_llm_tickers_cache: tuple[float, list[str]] | None = None
+
 
 class TradingBot:
     def __init__(
@@ -101,16 +122,17 @@ class TradingBot:
         self.logger.addHandler(console_handler)
 
         self.logger.info("Initializing TradingBot components.")
-        self.client = AlpacaClient()
-        self.portfolio = PortfolioManager()
-        self.trader = TradeManager()
+        self.client = get_client()
+        self.portfolio = PortfolioManager(self.client)
+        self.trader = self.portfolio.trader
         self.vetter = LLMVetter(vendor=vetter_vendor)
         self.risk_manager = RiskManager(
             base_allocation_limit=self.allocation_limit,
             base_risk_threshold=risk_threshold,
         )
         self.yield_farmer = YieldFarmer(self.client)
-        self.session_summary = []  # List of dicts with evaluation/execution info
+        self.session_summary = []  # List of dicts with execution/closing actions
+        self._rows: dict[str, dict] = {}  # Latest evaluation row per ticker
         self.trade_tracker = []  # New: list to track detailed trade info
 
         self.console = Console()
@@ -122,6 +144,14 @@ class TradingBot:
         self.calc_queue: asyncio.Queue | None = None
         self.summary_row_keys: dict[str, str] = {}
         self.dashboard_task: asyncio.Task | None = None
+        self._smtp: smtplib.SMTP | None = None
+        self._smtp_lock = threading.Lock()
+        self._notify_tasks: list[asyncio.Task] = []
+        self._bar_stream = None
+        self._watched: dict[str, dict] = {}
+        self._subscribed: set[str] = set()
+        # Symbols with a closing order in flight, mapped to when they were claimed
+        self._exiting: dict[str, float] = {}
 
         self.logger.info(
             "TradingBot initialized with auto_confirm=%s, vet_trade_logic=%s, risk_threshold=%.2f, allocation_limit=%.2f, notify_on_trade=%s, portfolio_mode=%s",
@@ -157,11 +187,24 @@ class TradingBot:
             self.calc_queue.put_nowait(message)
 
     def init_summary_table(self, ticker_list):
+        """Seed a ``Pending`` row per ticker in ``ticker_list`` order.
+
+        Evaluations finish out of order; seeding ``_rows`` here fixes the
+        display order once so updates never need to re-sort.
+        """
+        if self.dashboard or self.eval_queue:
+            self._rows = {
+                ticker: {
+                    "ticker": ticker,
+                    "current_price": "-",
+                    "probability": "-",
+                    "expected_net": "-",
+                    "decision": "Pending",
+                }
+                for ticker in ticker_list
+            }
         if self.dashboard:
-            table = self.dashboard.summary_table
-            table.rows.clear()
-            for ticker in ticker_list:
-                table.add_row(ticker, "-", "-", "-", "Pending")
+            self.dashboard.reset_summary(ticker_list)
             self.dashboard.refresh()
         if self.dashboard_app:
             for ticker in ticker_list:
@@ -191,55 +234,40 @@ class TradingBot:
 
         if not self.dashboard and not self.eval_queue:
             return
-        tickers = {row["ticker"]: row for row in self.session_summary}
-        tickers[ticker] = {
+        row = {
             "ticker": ticker,
             "current_price": str(current_price),
             "probability": safe_format(probability, "{:.2f}"),
             "expected_net": safe_format(expected_net, "{:.4f}"),
             "decision": decision,
         }
-        self.session_summary = list(tickers.values())
+        self._rows[ticker] = row
+        values = (
+            row["current_price"],
+            row["probability"],
+            row["expected_net"],
+            row["decision"],
+        )
         if self.dashboard:
-            table = self.dashboard.summary_table
-            table.rows.clear()
-            for t in sorted(tickers.keys()):
-                row = tickers[t]
-                table.add_row(
-                    row["ticker"],
-                    row["current_price"],
-                    row["probability"],
-                    row["expected_net"],
-                    row["decision"],
-                )
+            self.dashboard.update_summary_row(ticker, *values)
             self.dashboard.refresh()
         if self.dashboard_app:
             table = self.dashboard_app.eval_table
             if ticker not in self.summary_row_keys:
-                row_key = table.add_row(
-                    ticker,
-                    str(current_price),
-                    safe_format(probability, "{:.2f}"),
-                    safe_format(expected_net, "{:.4f}"),
-                    decision,
-                    key=ticker,
+                self.summary_row_keys[ticker] = table.add_row(
+                    ticker, *values, key=ticker
                 )
-                self.summary_row_keys[ticker] = row_key
             else:
                 row_key = self.summary_row_keys[ticker]
                 cols = list(table.columns.keys())
-                table.update_cell(row_key, cols[1], str(current_price))
-                table.update_cell(row_key, cols[2], safe_format(probability, "{:.2f}"))
-                table.update_cell(row_key, cols[3], safe_format(expected_net, "{:.4f}"))
-                table.update_cell(row_key, cols[4], decision)
+                for col, value in zip(cols[1:], values):
+                    table.update_cell(row_key, col, value)
 
     def generate_portfolio_table(self):
         if not self.dashboard and not self.portfolio_queue:
             return
         positions = self.portfolio.view_positions()
-        if self.dashboard:
-            table = self.dashboard.portfolio_table
-            table.rows.clear()
+        rows = []
         for pos in positions:
             symbol = str(pos.get("symbol", "N/A"))
             qty = pos.get("qty", 0)
@@ -254,30 +282,19 @@ class TradingBot:
                 avg_entry_str = "N/A"
                 current_price_str = "N/A"
                 dollar_pl_str = "N/A"
-            if self.dashboard:
-                table.add_row(
-                    symbol, str(qty), avg_entry_str, current_price_str, dollar_pl_str
-                )
+            row = (symbol, str(qty), avg_entry_str, current_price_str, dollar_pl_str)
+            rows.append(row)
             if self.portfolio_queue:
-                self.portfolio_queue.put_nowait(
-                    (
-                        symbol,
-                        str(qty),
-                        avg_entry_str,
-                        current_price_str,
-                        dollar_pl_str,
-                    )
-                )
+                self.portfolio_queue.put_nowait(row)
         if self.dashboard:
+            self.dashboard.set_rows(self.dashboard.portfolio_table, rows)
             self.dashboard.refresh()
 
     def generate_trade_tracker_table(self):
         """Populate trade tracker table in dashboard(s)."""
         if not self.dashboard and not self.trade_queue:
             return
-        if self.dashboard:
-            table = self.dashboard.trade_tracker_table
-            table.rows.clear()
+        rows = []
         for trade in self.trade_tracker:
             entry = (
                 f"{trade.get('entry_price', '-'):.2f}"
@@ -299,14 +316,13 @@ class TradingBot:
                 if trade.get("expected_shortfall") is not None
                 else "-"
             )
-            status = trade.get("status", "Pending")
-            if self.dashboard:
-                table.add_row(trade["symbol"], entry, stop, target, es_val, status)
+            status = str(trade.get("status", "Pending"))
+            row = (str(trade["symbol"]), entry, stop, target, es_val, status)
+            rows.append(row)
             if self.trade_queue:
-                self.trade_queue.put_nowait(
-                    (trade["symbol"], entry, stop, target, es_val, status)
-                )
+                self.trade_queue.put_nowait(row)
         if self.dashboard:
+            self.dashboard.set_rows(self.dashboard.trade_tracker_table, rows)
             self.dashboard.refresh()
 
     def generate_layout(self):
@@ -341,15 +357,7 @@ class TradingBot:
             self.logger.info("Using provided ticker list: %s", symbols)
             return symbols
         if DEFAULT_TICKERS_FROM_GPT:
-            prompt = (
-                "Return only a comma-separated list of 5 to 10 stock ticker symbols "
-                "suitable for short- to mid-term swing trading for a small/medium account. "
-                "Respond in the format: 'TICKERS: AAPL, MSFT, RIVN'"
-            )
-            self.logger.info("Querying LLM for default tickers with prompt: %s", prompt)
-            response = get_account_overview(prompt)
-            self.logger.debug("LLM default tickers response: %s", response)
-            tickers = re.findall(r"\b[A-Z]{2,5}\b", response) if response else []
+            tickers = self._llm_default_tickers()
             if tickers:
                 self.logger.info("Using default tickers from LLM: %s", tickers)
                 return tickers
@@ -367,19 +375,132 @@ class TradingBot:
         self.logger.info("Final ticker list from fundrunner.utils.config: %s", final_list)
         return final_list
 
-    async def evaluate_trade(self, symbol):
-        """Evaluate whether to trade ``symbol`` and return order details."""
+    def _llm_default_tickers(self):
+        """Return tickers suggested by the LLM, reused for ``LLM_TICKERS_TTL``."""
+
+        global _llm_tickers_cache
+        now = time.monotonic()
+        if _llm_tickers_cache and now - _llm_tickers_cache[0] < LLM_TICKERS_TTL:
+            self.logger.info("Using cached LLM default tickers.")
+            return list(_llm_tickers_cache[1])
+        prompt = (
+            "Return only a comma-separated list of 5 to 10 stock ticker symbols "
+            "suitable for short- to mid-term swing trading for a small/medium account. "
+            "Respond in the format: 'TICKERS: AAPL, MSFT, RIVN'"
+        )
+        self.logger.info("Querying LLM for default tickers with prompt: %s", prompt)
+        response = get_account_overview(prompt)
+        self.logger.debug("LLM default tickers response: %s", response)
+        tickers = _TICKER_RE.findall(response) if response else []
+        if tickers:
+            _llm_tickers_cache = (now, tickers)
+        return list(tickers)
+
+    def prefetch_history(self, ticker_list, days=30):
+        """Fetch daily bars for every ticker in one batched request.
+
+        Returns a mapping of symbol to bar DataFrame suitable for the
+        ``history`` argument of :meth:`evaluate_trade`. Failures yield an empty
+        mapping so evaluation falls back to per-symbol requests.
+        """
+
+        try:
+            return self.client.get_historical_bars_multi(ticker_list, days=days)
+        except Exception as e:
+            self.logger.error("Batch history fetch failed: %s", e)
+            return {}
+
+    @staticmethod
+    def compute_trade_metrics(histories):
+        """Compute trade metrics for many symbols in one vectorized pass.
+
+        Closing prices are stacked into a right-aligned, NaN-padded matrix.
+        Mean return, volatility and the sigmoid probability of profit come
+        from :func:`fundrunner.alpaca._kernels.trade_stats` (Numba-compiled
+        when available); the 5% expected shortfall is evaluated with NumPy.
+
+        Args:
+            histories (dict[str, pandas.DataFrame]): Symbol to bar DataFrame
+                with a ``close`` (or ``Close``) column.
+
+        Returns:
+            dict[str, dict]: Symbol to ``probability_of_profit``,
+            ``expected_net_value``, ``expected_shortfall`` and ``last_close``.
+            Symbols without at least two closes are omitted.
+        """
+        series = {}
+        for symbol, hist in histories.items():
+            if hist is None or hist.empty:
+                continue
+            close_col = "close" if "close" in hist.columns else "Close"
+            closes = hist[close_col].to_numpy(dtype=np.float64)
+            if closes.size > 1:
+                series[symbol] = closes
+        if not series:
+            return {}
+
+        # Probabilities only need ~1e-4 precision, so the statistics run in
+        # float32; ``last_close`` keeps the float64 price for order sizing.
+        width = max(c.size for c in series.values())
+        closes = np.full((len(series), width), np.nan, dtype=np.float32)
+        for row, values in enumerate(series.values()):
+            closes[row, width - values.size :] = values
+
+        with np.errstate(invalid="ignore", divide="ignore"), warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            returns = np.diff(closes, axis=1) / closes[:, :-1]
+            # Value at Risk at the 5% level and the mean of returns beyond it
+            var_5 = np.nanquantile(returns, 0.05, axis=1)
+            tail = np.where(returns <= var_5[:, None], returns, np.nan)
+            shortfall = np.nanmean(tail, axis=1)
+
+        stats = trade_stats(closes)
+        return {
+            symbol: {
+                "probability_of_profit": float(stats[row, 2]),
+                "expected_net_value": max(float(stats[row, 0]), 0.0),
+                "expected_shortfall": float(shortfall[row]),
+                "last_close": float(series[symbol][-1]),
+            }
+            for row, symbol in enumerate(series)
+        }
+
+    async def evaluate_trade(self, symbol, history=None, metrics=None, price=None):
+        """Evaluate whether to trade ``symbol`` and return order details.
+
+        Args:
+            symbol (str): Ticker to evaluate.
+            history (pandas.DataFrame, optional): Pre-fetched 30-day bars for
+                ``symbol`` (see :meth:`prefetch_history`). When omitted the
+                bars are requested once and shared with the risk manager.
+            metrics (dict, optional): Precomputed entry from
+                :meth:`compute_trade_metrics`; skips recomputing from history.
+            price (float, optional): Live price used for sizing, stops and the
+                recorded entry (see :meth:`run`, which batches them). Without
+                it the last daily close, i.e. the prior session's close, is
+                used, and the quote endpoint only when there is no history.
+        """
 
         self.log_calc(f"Evaluating trade for {symbol}")
+        if history is None and metrics is None:
+            # Fetch once and share the bars with the risk adjustment and metrics.
+            try:
+                history = await asyncio.to_thread(
+                    self.client.get_historical_bars, symbol, days=30
+                )
+            except Exception as e:
+                self.logger.error("Error fetching history for %s: %s", symbol, e)
         adjusted_allocation, adjusted_risk_threshold = (
-            self.risk_manager.adjust_parameters(symbol)
+            await asyncio.to_thread(
+                self.risk_manager.adjust_parameters, symbol, data=history
+            )
         )
         self.log_calc(
             f"Adjusted allocation: {adjusted_allocation:.4f}, risk threshold: {adjusted_risk_threshold:.4f}"
         )
         await asyncio.sleep(1)
         try:
-            account = self.portfolio.view_account()
+            account = await self.portfolio.view_account_async()
             self._log_account_details(account)
             self.log_calc("Fetched account information")
             await asyncio.sleep(1)
@@ -404,37 +525,20 @@ class TradingBot:
             self.logger.error("Error parsing buying power for %s: %s", symbol, e)
             return None
         # Compute equity trade metrics using historical data
+        last_close = None
         try:
-            hist = self.client.get_historical_bars(symbol, days=30)
-            if hist is None or hist.empty:
+            if metrics is None and history is not None:
+                metrics = self.compute_trade_metrics({symbol: history}).get(symbol)
+            if metrics is None:
                 self.logger.warning("No historical data for %s", symbol)
                 probability_of_profit = 0.55
                 expected_net_value = 0.02
                 es_metric = None
             else:
-                close_col = "close" if "close" in hist.columns else "Close"
-                returns = hist[close_col].pct_change().dropna()
-                mean_return = (
-                    returns.mean().item()
-                    if hasattr(returns.mean(), "item")
-                    else float(returns.mean())
-                )
-                volatility = (
-                    returns.std().item()
-                    if hasattr(returns.std(), "item")
-                    else float(returns.std())
-                )
-                if volatility > 0:
-                    risk_adjusted = mean_return / volatility
-                    probability_of_profit = 1 / (1 + math.exp(-5 * risk_adjusted))
-                else:
-                    probability_of_profit = 0.5
-                expected_net_value = max(mean_return, 0)
-                # Calculate Value at Risk (VaR) at 5% level and Expected Shortfall (ES)
-                var_5 = returns.quantile(0.05)
-                es_metric = returns[
-                    returns <= var_5
-                ].mean()  # average of worst 5% losses
+                probability_of_profit = metrics["probability_of_profit"]
+                expected_net_value = metrics["expected_net_value"]
+                es_metric = metrics["expected_shortfall"]
+                last_close = metrics["last_close"]
             self.logger.info(
                 "For %s: probability=%.2f, expected_net=%.4f, ES=%.4f",
                 symbol,
@@ -460,7 +564,14 @@ class TradingBot:
             )
             return None
         try:
-            current_price = self.client.get_latest_price(symbol)
+            current_price = price
+            if current_price is None and last_close is not None:
+                self.logger.info("Sizing %s from the prior close %.2f", symbol, last_close)
+                current_price = last_close
+            if current_price is None:
+                current_price = await asyncio.to_thread(
+                    self.client.get_latest_price, symbol
+                )
             if current_price is None:
                 raise ValueError("Price not available")
         except Exception as e:
@@ -502,6 +613,19 @@ class TradingBot:
         self.logger.info("Trade evaluated for %s: %s", symbol, trade_details)
         return trade_details
 
+    async def _eval_one(self, symbol, semaphore, history=None, metrics=None, price=None):
+        """Run :meth:`evaluate_trade` for ``symbol`` under ``semaphore``."""
+
+        async with semaphore:
+            self.logger.info("Processing %s", symbol)
+            try:
+                return await self.evaluate_trade(
+                    symbol, history=history, metrics=metrics, price=price
+                )
+            except Exception as e:
+                self.logger.error("Evaluation failed for %s: %s", symbol, e)
+                return None
+
     async def confirm_trade(self, trade_details, timeout: float | None = None):
         """Prompt the user to confirm a trade with optional timeout."""
 
@@ -539,14 +663,59 @@ class TradingBot:
         msg["Subject"] = subject
         msg.attach(MIMEText(body, "plain"))
         self.logger.info("Sending email for trade %s", trade_details["symbol"])
-        try:
-            with smtplib.SMTP(SMTP_SERVER, SMTP_PORT) as server:
+        with self._smtp_lock:
+            try:
+                try:
+                    self._smtp_connection().send_message(msg)
+                except smtplib.SMTPException:
+                    # The pooled connection may have timed out; reconnect once.
+                    self.close_notifications()
+                    self._smtp_connection().send_message(msg)
+                self.logger.info("Email sent successfully.")
+            except Exception as e:
+                self.close_notifications()
+                self.logger.error("Email send failed: %s", e)
+
+    def notify_trade_in_background(self, trade_details, order) -> None:
+        """Send the trade email from a worker thread without blocking the loop."""
+
+        task = asyncio.create_task(
+            asyncio.to_thread(self.send_trade_notification, trade_details, order)
+        )
+        self._notify_tasks.append(task)
+        task.add_done_callback(self._notify_tasks.remove)
+
+    async def flush_notifications(self) -> None:
+        """Wait for pending notification emails and close the SMTP connection."""
+
+        if self._notify_tasks:
+            await asyncio.gather(*self._notify_tasks, return_exceptions=True)
+        self.close_notifications()
+
+    def _smtp_connection(self) -> smtplib.SMTP:
+        """Return the persistent SMTP connection, logging in on first use."""
+
+        if self._smtp is None:
+            server = smtplib.SMTP(SMTP_SERVER, SMTP_PORT)
+            try:
                 server.starttls()
                 server.login(SMTP_USERNAME, SMTP_PASSWORD)
-                server.send_message(msg)
-            self.logger.info("Email sent successfully.")
-        except Exception as e:
-            self.logger.error("Email send failed: %s", e)
+            except Exception:
+                server.close()
+                raise
+            self._smtp = server
+        return self._smtp
+
+    def close_notifications(self) -> None:
+        """Close the pooled SMTP connection if one is open."""
+
+        server, self._smtp = self._smtp, None
+        if server is None:
+            return
+        try:
+            server.quit()
+        except Exception:
+            server.close()
 
     async def execute_trade(self, trade_details):
         self.logger.info("Executing trade for %s", trade_details["symbol"])
@@ -561,6 +730,11 @@ class TradingBot:
             else:
                 order = self.trader.sell(symbol, qty, order_type, time_in_force)
             self.logger.info("Trade executed for %s: %s", symbol, order)
+            if self._bar_stream is not None:
+                try:
+                    await self._refresh_watched()
+                except Exception as e:
+                    self.logger.warning("Could not watch %s: %s", symbol, e)
             from fundrunner.utils.transaction_logger import log_transaction
 
             log_transaction(trade_details, order)
@@ -575,7 +749,7 @@ class TradingBot:
             self.generate_trade_tracker_table()
             self.generate_portfolio_table()
             if self.notify_on_trade:
-                self.send_trade_notification(trade_details, order)
+                self.notify_trade_in_background(trade_details, order)
             return order
         except Exception as e:
             self.logger.error(
@@ -587,53 +761,169 @@ class TradingBot:
             return None
 
     async def monitor_positions(self):
+        """Close positions that cross the stop loss or profit target.
+
+        Exits are driven by the minute-bar websocket stream. Positions are
+        polled every ``POSITION_POLL_INTERVAL`` seconds only while the stream
+        is disconnected, plus a reconciliation sweep every
+        ``STREAM_RECONCILE_INTERVAL`` seconds; once the stream fails to connect
+        ``STREAM_MAX_RECONNECTS`` times in a row only the poll remains.
+        """
         self.logger.info("Monitoring positions for stop loss/profit target.")
-        while True:
-            positions = self.portfolio.view_positions()
-            for pos in positions:
+        poller = asyncio.create_task(self._poll_positions())
+        try:
+            try:
+                stream = self.client.bar_stream()
+            except Exception as e:
+                self.logger.warning("Bar stream unavailable, polling positions: %s", e)
+            else:
+                await self._run_bar_stream(stream)
+            await poller
+        finally:
+            poller.cancel()
+
+    async def _run_bar_stream(self, stream):
+        """Connect ``stream`` and dispatch bars until it stops or gives up.
+
+        ``stream`` is a :class:`~fundrunner.alpaca._bar_stream.BarStream`. The
+        failure count resets after each successful handshake.
+        """
+        failures = 0
+        try:
+            while failures < STREAM_MAX_RECONNECTS:
                 try:
-                    symbol = (
-                        pos.get("symbol")
-                        if isinstance(pos, dict)
-                        else getattr(pos, "symbol", None)
-                    )
-                    qty = (
-                        pos.get("qty")
-                        if isinstance(pos, dict)
-                        else getattr(pos, "qty", None)
-                    )
-                    pl_percent = (
-                        pos.get("unrealized_pl_percent", 0)
-                        if isinstance(pos, dict)
-                        else getattr(pos, "unrealized_pl_percent", 0)
-                    )
-                    self.logger.info(
-                        "Position %s: Qty=%s, Unrealized P/L%%=%.2f",
-                        symbol,
-                        qty,
-                        pl_percent,
-                    )
-                    if pl_percent <= -5 or pl_percent >= 10:
-                        self.logger.info(
-                            "Closing %s due to target: %.2f%%", symbol, pl_percent
-                        )
-                        try:
-                            order = self.trader.sell(symbol, qty, "market", "gtc")
-                            self.logger.info(
-                                "Closed position for %s: %s", symbol, order
-                            )
-                            self.session_summary.append(
-                                {
-                                    "ticker": symbol,
-                                    "action": "Closed",
-                                    "pl_percent": pl_percent,
-                                }
-                            )
-                        except Exception as e:
-                            self.logger.error("Error closing %s: %s", symbol, e)
+                    await stream.connect()
+                    failures = 0
+                    self._bar_stream = stream
+                    await self._refresh_watched()
+                    await stream.consume()
+                    return
                 except Exception as e:
-                    self.logger.error("Error processing position %s: %s", pos, e)
-            await asyncio.sleep(60)
+                    failures += 1
+                    self.logger.warning(
+                        "Bar stream failed (%d/%d): %s",
+                        failures,
+                        STREAM_MAX_RECONNECTS,
+                        e,
+                    )
+                    self._bar_stream = None
+                    await stream.close()
+                    await asyncio.sleep(min(2**failures, 30))
+            self.logger.warning("Bar stream unavailable, polling positions only.")
+        finally:
+            self._bar_stream = None
+            try:
+                await stream.close()
+            except Exception:
+                pass
+
+    async def _refresh_watched(self):
+        """Reload open positions and subscribe to bars for new symbols.
+
+        Returns the fetched positions.
+        """
+        fetched_at = time.monotonic()
+        positions = await self.portfolio.view_positions_async()
+        held = {pos["symbol"] for pos in positions}
+        # A claimed exit is finished once a fetch started after the claim no
+        # longer lists the symbol.
+        self._exiting = {
+            symbol: claimed
+            for symbol, claimed in self._exiting.items()
+            if symbol in held or claimed >= fetched_at
+        }
+        self._watched = {
+            pos["symbol"]: pos for pos in positions if pos["symbol"] not in self._exiting
+        }
+        new = set(self._watched) - self._subscribed
+        if new and self._bar_stream is not None:
+            # subscribe_bars blocks on the stream's loop once it is running,
+            # so call it from a worker thread.
+            await asyncio.to_thread(
+                self._bar_stream.subscribe_bars, self._on_bar, *sorted(new)
+            )
+            self._subscribed |= new
+        return positions
+
+    async def _on_bar(self, bar):
+        pos = self._watched.get(bar.get("S"))
+        if not pos:
+            return
+        avg_entry = pos.get("avg_entry_price")
+        if not avg_entry:
+            return
+        direction = 1 if (pos.get("qty") or 0) >= 0 else -1
+        pl_percent = (bar["c"] - avg_entry) / avg_entry * 100 * direction
+        pos["unrealized_pl_percent"] = pl_percent
+        await self._check_position(pos["symbol"], pos["qty"], pl_percent)
+
+    async def _check_position(self, symbol, qty, pl_percent):
+        """Sell ``symbol`` if ``pl_percent`` is outside the -5%/+10% band.
+
+        The symbol is claimed before the order is sent so the bar stream and
+        the poll never both close the same position.
+        """
+        if not (pl_percent <= -5 or pl_percent >= 10):
+            return False
+        if symbol in self._exiting:
+            return False
+        self._exiting[symbol] = time.monotonic()
+        watched = self._watched.pop(symbol, None)
+        self.logger.info("Closing %s due to target: %.2f%%", symbol, pl_percent)
+        try:
+            order = await asyncio.to_thread(
+                self.trader.sell, symbol, qty, "market", "gtc"
+            )
+        except Exception as e:
+            self.logger.error("Error closing %s: %s", symbol, e)
+            del self._exiting[symbol]
+            if watched is not None:
+                self._watched[symbol] = watched
+            return False
+        self.logger.info("Closed position for %s: %s", symbol, order)
+        self.session_summary.append(
+            {
+                "ticker": symbol,
+                "action": "Closed",
+                "pl_percent": pl_percent,
+            }
+        )
+        return True
+
+    async def _poll_positions(self):
+        """Check positions over REST while the bar stream is disconnected.
+
+        While bars are streaming the fetch only runs as a reconciliation
+        sweep every ``STREAM_RECONCILE_INTERVAL`` seconds.
+        """
+        last_sweep = float("-inf")
+        while True:
+            now = time.monotonic()
+            if self._bar_stream is None or now - last_sweep >= STREAM_RECONCILE_INTERVAL:
+                last_sweep = now
+                await self._sweep_positions()
+            await asyncio.sleep(POSITION_POLL_INTERVAL)
+
+    async def _sweep_positions(self):
+        try:
+            positions = await self._refresh_watched()
+        except Exception as e:
+            self.logger.error("Error fetching positions: %s", e)
+            return
+        for pos in positions:
+            try:
+                symbol = pos["symbol"]
+                qty = pos["qty"]
+                pl_percent = pos.get("unrealized_pl_percent") or 0
+                self.logger.info(
+                    "Position %s: Qty=%s, Unrealized P/L%%=%.2f",
+                    symbol,
+                    qty,
+                    pl_percent,
+                )
+                await self._check_position(symbol, qty, pl_percent)
+            except Exception as e:
+                self.logger.error("Error processing position %s: %s", pos, e)
 
     async def maintenance_mode(self, iterations: int = 5, delay: int = 60) -> None:
         """Review open positions and refresh dashboard for a set period.
@@ -645,12 +935,16 @@ class TradingBot:
 
         self.logger.info("Entering maintenance mode for %d iterations", iterations)
         for _ in range(iterations):
-            positions = self.portfolio.view_positions()
-            for trade in self.trade_tracker:
-                if trade.get("status") != "Executed":
-                    continue
+            executed = [t for t in self.trade_tracker if t.get("status") == "Executed"]
+            # Only hit /positions when there is an executed trade to compare against
+            positions = (
+                {p.get("symbol"): p for p in reversed(self.portfolio.view_positions())}
+                if executed
+                else {}
+            )
+            for trade in executed:
                 symbol = trade["symbol"]
-                pos = next((p for p in positions if p.get("symbol") == symbol), None)
+                pos = positions.get(symbol)
                 if not pos:
                     continue
                 pl_percent = pos.get("unrealized_pl_percent", 0)
@@ -667,7 +961,8 @@ class TradingBot:
     def rebalance_portfolio(self):
         """Rebalance holdings based on optimized portfolio weights."""
         positions = self.portfolio.view_positions()
-        tickers = []
+        # Index positions by symbol once so per-symbol lookups are O(1)
+        by_symbol = {}
         for pos in positions:
             symbol = (
                 pos.get("symbol")
@@ -675,7 +970,8 @@ class TradingBot:
                 else getattr(pos, "symbol", None)
             )
             if symbol:
-                tickers.append(symbol)
+                by_symbol.setdefault(symbol, pos)
+        tickers = list(by_symbol)
         if not tickers:
             return
         import pandas as pd
@@ -692,31 +988,29 @@ class TradingBot:
         weights = portfolio_optimizer.optimize_portfolio(prices_df)
         account = self.portfolio.view_account()
         portfolio_value = self.safe_float(account.get("portfolio_value"))
+        prices = self.client.get_latest_prices(list(weights))
+        orders = []
         for sym, weight in weights.items():
-            price = self.client.get_latest_price(sym)
+            price = prices.get(sym)
             if price is None or portfolio_value == 0:
                 continue
             target_qty = (portfolio_value * weight) / price
-            current = next(
-                (
-                    p
-                    for p in positions
-                    if (
-                        p.get("symbol")
-                        if isinstance(p, dict)
-                        else getattr(p, "symbol", None)
-                    )
-                    == sym
-                ),
-                None,
-            )
+            current = by_symbol.get(sym)
             current_qty = self.safe_float(current.get("qty")) if current else 0
             diff = target_qty - current_qty
             if diff > 1:
-                self.trader.buy(sym, int(diff))
+                orders.append({"symbol": sym, "qty": int(diff), "side": "buy"})
             elif diff < -1:
-                self.trader.sell(sym, int(abs(diff)))
+                orders.append({"symbol": sym, "qty": int(abs(diff)), "side": "sell"})
             self.logger.info("Rebalanced %s to %.2f%%", sym, weight * 100)
+        if not orders:
+            return
+        # Submit all rebalance orders in one concurrent batch
+        for order, result in zip(orders, self.trader.submit_orders(orders)):
+            if isinstance(result, Exception):
+                self.logger.error(
+                    "Rebalance %s %s failed: %s", order["side"], order["symbol"], result
+                )
 
     async def periodic_rebalance(self, interval_minutes: int = 60):
         """Periodically rebalance the portfolio."""
@@ -765,6 +1059,12 @@ class TradingBot:
         table.add_column("Ticker", style="bold green")
         table.add_column("Action", style="cyan")
         table.add_column("Details", style="magenta")
+        for row in self._rows.values():
+            table.add_row(
+                row["ticker"],
+                row["decision"],
+                f"P={row['probability']} Net={row['expected_net']}",
+            )
         for trade in self.session_summary:
             details = trade.get("details", "")
             pl = str(trade.get("pl_percent", ""))
@@ -846,9 +1146,33 @@ class TradingBot:
 
         monitor_task = asyncio.create_task(self.monitor_positions())
         try:
-            for symbol in ticker_list:
-                self.logger.info("Processing %s", symbol)
-                trade_details = await self.evaluate_trade(symbol)
+            histories = self.prefetch_history(ticker_list)
+            metrics = self.compute_trade_metrics(histories)
+            # Daily bars end at the prior session's close, so size orders from
+            # live prices fetched for all candidates in one request.
+            try:
+                prices = await asyncio.to_thread(
+                    self.client.get_latest_prices, ticker_list
+                )
+            except Exception as e:
+                self.logger.warning("Latest prices unavailable, using closes: %s", e)
+                prices = {}
+            # Evaluations are network-bound, so run them concurrently; the
+            # confirm/execute step below stays serial for user input.
+            semaphore = asyncio.Semaphore(EVAL_CONCURRENCY)
+            results = await asyncio.gather(
+                *(
+                    self._eval_one(
+                        symbol,
+                        semaphore,
+                        histories.get(symbol),
+                        metrics.get(symbol),
+                        prices.get(symbol),
+                    )
+                    for symbol in ticker_list
+                )
+            )
+            for symbol, trade_details in zip(ticker_list, results):
                 if trade_details:
                     decision = ""
                     if self.vet_trade_logic:
@@ -878,11 +1202,11 @@ class TradingBot:
                     )
                 else:
                     self.update_summary_row(symbol, "-", "-", "-", "No Trade")
-                await asyncio.sleep(5)
         finally:
             self.logger.info("Trading bot run completed.")
             await self.maintenance_mode()
             monitor_task.cancel()
+            await self.flush_notifications()
             if self.dashboard_app:
                 await self.dashboard_app.action_quit()
             if self.dashboard_task:
@@ -1,9 +1,9 @@
 """Helpers for managing Alpaca watchlists."""
-from fundrunner.alpaca.api_client import AlpacaClient
+from fundrunner.alpaca.api_client import get_client
 
 class WatchlistManager:
-    def __init__(self):
-        self.client = AlpacaClient()
+    def __init__(self, client=None):
+        self.client = client or get_client()
 
     def list_watchlists(self):
         return self.client.list_watchlists()
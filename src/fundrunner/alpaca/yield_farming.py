@@ -3,19 +3,22 @@
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Tuple
 
-import requests
-
 from fundrunner.services.lending_rates import LendingRateService
-from .api_client import AlpacaClient
+from fundrunner.utils import fast_json
+from .api_client import AlpacaClient, get_client, get_session
 
 logger = logging.getLogger(__name__)
 
 
 DEFAULT_LENDING_SYMBOLS = ["AAPL", "MSFT", "GOOGL"]
 
+# Upper bound on concurrent dividend lookups
+DIVIDEND_FETCH_WORKERS = 10
+
 
 class YieldFarmer:
     """Automates basic stock lending and dividend yield strategies.
@@ -30,10 +33,17 @@ class YieldFarmer:
         client: AlpacaClient | None = None,
         lending_service: LendingRateService | None = None,
     ) -> None:
-        self.client = client or AlpacaClient()
+        self.client = client or get_client()
         self.lending_service = lending_service or LendingRateService()
         self.lending_symbols = DEFAULT_LENDING_SYMBOLS
 
+    def _latest_prices(self, symbols: List[str]) -> Dict[str, float | None]:
+        """Return latest prices for ``symbols``, batched when the client can."""
+        batch = getattr(self.client, "get_latest_prices", None)
+        if batch is not None:
+            return batch(symbols)
+        return {sym: self.client.get_latest_price(sym) for sym in symbols}
+
     # ----------------------------
     # Stock Lending Helpers
     # ----------------------------
@@ -73,11 +83,12 @@ class YieldFarmer:
         if not picks:
             return []
         total_rate = sum(r for _, r in picks)
+        prices = self._latest_prices([sym for sym, _ in picks])
         portfolio: List[Dict[str, float]] = []
         for sym, rate in picks:
             weight = rate / total_rate if total_rate else 1 / len(picks)
             alloc = invest * weight
-            price = self.client.get_latest_price(sym)
+            price = prices.get(sym)
             if not price or price <= 0:
                 continue
             qty = int(alloc / price)
@@ -96,9 +107,10 @@ class YieldFarmer:
             f"{symbol}?modules=calendarEvents,summaryDetail"
         )
         try:
-            resp = requests.get(url, timeout=10)
+            # Shared pooled session: repeat lookups reuse the TLS connection.
+            resp = get_session().get(url, timeout=10)
             if resp.ok:
-                data = resp.json()["quoteSummary"]["result"][0]
+                data = fast_json.loads(resp.content)["quoteSummary"]["result"][0]
                 details = data.get("summaryDetail", {})
                 cal = data.get("calendarEvents", {})
                 yield_raw = details.get("dividendYield", {}).get("raw", 0)
@@ -141,11 +153,15 @@ class YieldFarmer:
         if invest <= 0:
             return []
 
-        info: List[Tuple[str, float, datetime | None]] = []
-        for sym in symbols:
-            yield_rate, next_date = self.fetch_dividend_info(sym)
-            if yield_rate:
-                info.append((sym, yield_rate, next_date))
+        # Lookups are independent HTTP calls, so overlap them.
+        workers = min(DIVIDEND_FETCH_WORKERS, len(symbols))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(self.fetch_dividend_info, symbols))
+        info: List[Tuple[str, float, datetime | None]] = [
+            (sym, yield_rate, next_date)
+            for sym, (yield_rate, next_date) in zip(symbols, results)
+            if yield_rate
+        ]
         if not info:
             return []
 
@@ -171,8 +187,9 @@ class YieldFarmer:
 
         info.sort(key=lambda x: x[1], reverse=True)
         weight = invest / len(info)
+        prices = self._latest_prices([sym for sym, _, _ in info])
         for sym, yld, nxt in info:
-            price = self.client.get_latest_price(sym)
+            price = prices.get(sym)
             if not price or price <= 0:
                 continue
             qty = int(weight / price)
@@ -10,7 +10,7 @@ from typing import Dict, Iterable, List, Optional
 
 import pandas as pd
 
-from fundrunner.alpaca.api_client import AlpacaClient
+from fundrunner.alpaca.api_client import get_client
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
@@ -65,7 +65,7 @@ def run_backtest(
         drawdown, and trade details. ``None`` if no data was returned.
     """
 
-    client = AlpacaClient()
+    client = get_client()
     data = client.get_bars(symbol, start_date, end_date)
     if not data:
         logger.error("No data found for symbol %s", symbol)
@@ -148,7 +148,7 @@ def backtest_portfolio(
         drawdown and the daily portfolio value history.
     """
 
-    client = AlpacaClient()
+    client = get_client()
     price_frames = {}
     dates: Optional[List[str]] = None
 
@@ -1,11 +1,14 @@
 """ChatGPT-driven trading controller."""
 
-import json
 import logging
-from typing import Any, Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
 
 from fundrunner.alpaca.portfolio_manager import PortfolioManager
 from fundrunner.alpaca.trade_manager import TradeManager
+from fundrunner.utils import fast_json
 from fundrunner.utils.gpt_client import ask_gpt
 
 logger = logging.getLogger(__name__)
@@ -24,31 +27,79 @@ def kelly_fraction(win_prob: float, win_loss_ratio: float) -> float:
     return win_prob - (1 - win_prob) / win_loss_ratio
 
 
+# Below this many positions a plain loop beats NumPy's array setup cost
+VECTORIZE_MIN_POSITIONS = 64
+
+
+def _win_loss_stats(positions: List[Dict[str, Any]]) -> Tuple[float, float, float]:
+    """Return ``(win_prob, avg_win, avg_loss)`` in a single pass."""
+    n_win = n_loss = 0
+    sum_win = sum_loss = 0.0
+    for p in positions:
+        profit = p.get("market_value", 0) * (p.get("unrealized_pl_percent", 0) / 100)
+        if profit >= 0:
+            n_win += 1
+            sum_win += profit
+        else:
+            n_loss += 1
+            sum_loss -= profit
+    return (
+        n_win / len(positions),
+        sum_win / n_win if n_win else 0.0,
+        sum_loss / n_loss if n_loss else 0.0,
+    )
+
+
+def _win_loss_stats_np(positions: List[Dict[str, Any]]) -> Tuple[float, float, float]:
+    """NumPy version of :func:`_win_loss_stats` for large portfolios."""
+    pct = np.fromiter(
+        (p.get("unrealized_pl_percent", 0) for p in positions),
+        dtype=np.float64,
+        count=len(positions),
+    )
+    value = np.fromiter(
+        (p.get("market_value", 0) for p in positions),
+        dtype=np.float64,
+        count=len(positions),
+    )
+    profits = value * (pct / 100)
+    winners = profits[profits >= 0]
+    losers = -profits[profits < 0]
+    return (
+        winners.size / profits.size,
+        float(winners.mean()) if winners.size else 0.0,
+        float(losers.mean()) if losers.size else 0.0,
+    )
+
+
 def compute_risk_metrics(positions: List[Dict[str, Any]]) -> Dict[str, float]:
     """Derive simple risk metrics from current positions."""
     if not positions:
         return {"expected_value": 0.0, "kelly_fraction": 0.0}
 
-    winners: List[float] = []
-    losers: List[float] = []
-    for pos in positions:
-        pct = pos.get("unrealized_pl_percent", 0)
-        value = pos.get("market_value", 0)
-        profit = value * (pct / 100)
-        if profit >= 0:
-            winners.append(profit)
-        else:
-            losers.append(abs(profit))
-
-    win_prob = len(winners) / len(positions)
-    avg_win = sum(winners) / len(winners) if winners else 0.0
-    avg_loss = sum(losers) / len(losers) if losers else 0.0
+    if len(positions) < VECTORIZE_MIN_POSITIONS:
+        win_prob, avg_win, avg_loss = _win_loss_stats(positions)
+    else:
+        win_prob, avg_win, avg_loss = _win_loss_stats_np(positions)
     ev = expected_value(win_prob, avg_win, avg_loss) if (avg_win or avg_loss) else 0.0
     win_loss_ratio = avg_win / avg_loss if avg_loss else 0.0
     kelly = kelly_fraction(win_prob, win_loss_ratio) if win_loss_ratio else 0.0
     return {"expected_value": ev, "kelly_fraction": kelly}
 
 
+def build_orders(actions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Return order dicts for the valid buy/sell entries in ``actions``."""
+    orders: List[Dict[str, Any]] = []
+    for action in actions:
+        act_type = action.get("action")
+        symbol = action.get("symbol")
+        qty = action.get("quantity") or action.get("qty")
+        if not symbol or qty is None or act_type not in ("buy", "sell"):
+            continue
+        orders.append({"symbol": symbol, "qty": qty, "side": act_type})
+    return orders
+
+
 def run_chatgpt_controller(max_cycles: int = 3) -> None:
     """Control trading via ChatGPT-provided actions."""
 
@@ -58,39 +109,45 @@ def run_chatgpt_controller(max_cycles: int = 3) -> None:
     request = "more_data"
     cycles = 0
 
-    while cycles < max_cycles and request == "more_data":
-        account = portfolio.view_account()
-        positions = portfolio.view_positions()
-        metrics = compute_risk_metrics(positions)
-
-        prompt = (
-            "You are a trading assistant.\n"
-            f"Account: {account}\n"
-            f"Positions: {positions}\n"
-            f"Risk metrics: {metrics}\n"
-            "Respond with JSON {\"actions\": [{...}], \"request\": \"more_data\" or \"done\"}."
-        )
-
-        response = ask_gpt(prompt)
-        if not response:
-            logger.error("No response from GPT")
-            break
-        try:
-            data = json.loads(response)
-        except json.JSONDecodeError:
-            logger.error("Failed to parse GPT response: %s", response)
-            break
-
-        actions = data.get("actions", [])
-        for action in actions:
-            act_type = action.get("action")
-            symbol = action.get("symbol")
-            qty = action.get("quantity") or action.get("qty")
-            if not symbol or qty is None:
-                continue
-            if act_type == "buy":
-                trader.buy(symbol, qty)
-            elif act_type == "sell":
-                trader.sell(symbol, qty)
-        request = data.get("request", "done")
-        cycles += 1
+    # Account and positions are independent round trips; fetch them together.
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        while cycles < max_cycles and request == "more_data":
+            account_future = pool.submit(portfolio.view_account)
+            positions_future = pool.submit(portfolio.view_positions)
+            account = account_future.result()
+            positions = positions_future.result()
+            request = _run_cycle(trader, account, positions)
+            cycles += 1
+
+
+def _run_cycle(trader, account, positions) -> str:
+    """Ask GPT for actions, submit them and return its ``request`` field.
+
+    Returns ``"done"`` when GPT gives no usable response.
+    """
+    metrics = compute_risk_metrics(positions)
+
+    prompt = (
+        "You are a trading assistant.\n"
+        f"Account: {fast_json.dumps(account)}\n"
+        f"Positions: {fast_json.dumps(positions)}\n"
+        f"Risk metrics: {fast_json.dumps(metrics)}\n"
+        "Respond with JSON {\"actions\": [{...}], \"request\": \"more_data\" or \"done\"}."
+    )
+
+    response = ask_gpt(prompt)
+    if not response:
+        logger.error("No response from GPT")
+        return "done"
+    try:
+        data = fast_json.loads(response)
+    except fast_json.JSONDecodeError:
+        logger.error("Failed to parse GPT response: %s", response)
+        return "done"
+
+    orders = build_orders(data.get("actions", []))
+    # Submit the cycle's orders concurrently; results keep action order.
+    for order, result in zip(orders, trader.submit_orders(orders)):
+        if isinstance(result, Exception):
+            logger.error("Failed to %s %s: %s", order["side"], order["symbol"], result)
+    return data.get("request", "done")
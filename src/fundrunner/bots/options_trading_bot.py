@@ -88,8 +88,19 @@ async def run_options_analysis():
 
     sentiments = {}  # <-- Initialize this before the loop!
 
+    # Each default sentiment is its own bars request; issue them together
+    # instead of one per loop iteration between prompts.
+    default_sents = dict(
+        zip(
+            tickers,
+            await asyncio.gather(
+                *(asyncio.to_thread(analyze_sentiment, t) for t in tickers)
+            ),
+        )
+    )
+
     for ticker in tickers:
-        default_sent = analyze_sentiment(ticker)
+        default_sent = default_sents[ticker]
 
         # Prompt for strike and option type (or compute ATM)
         strike = Prompt.ask(
@@ -148,11 +159,13 @@ async def run_options_analysis():
     # Continue with your trade style logic, evaluation, etc...
 
     # Prompt for options trade style
-    console.print("Select options trade style:")
-    console.print("1. Long")
-    console.print("2. Credit Spread")
-    console.print("3. Debit Spread")
-    console.print("4. Iron Condor")
+    console.print(
+        "Select options trade style:\n"
+        "1. Long\n"
+        "2. Credit Spread\n"
+        "3. Debit Spread\n"
+        "4. Iron Condor"
+    )
     style_choice = Prompt.ask(
         "Enter choice (1-4, or press Enter to scan all)", default=""
     )
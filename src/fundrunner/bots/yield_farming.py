@@ -26,12 +26,12 @@ Example
 
 ```python
 from fundrunner.alpaca.yield_farming import YieldFarmer, YieldFarmingMode
-from fundrunner.alpaca.api_client import AlpacaClient
+from fundrunner.alpaca.api_client import get_client
 from fundrunner.alpaca.trade_manager import TradeManager
 from fundrunner.alpaca.risk_manager import RiskManager
 
 # Instantiate dependencies
-client = AlpacaClient()
+client = get_client()
 trade_mgr = TradeManager()
 risk_mgr = RiskManager()
 
@@ -49,16 +49,17 @@ from __future__ import annotations
 
 import logging
 import os
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from typing import Dict, Iterable, List, Optional, Tuple
 
 import pandas as pd
 import numpy as np
-import requests
 
-from fundrunner.alpaca.api_client import AlpacaClient
+from fundrunner.alpaca.api_client import AlpacaClient, get_client, get_session
 from fundrunner.alpaca.trade_manager import TradeManager
 from fundrunner.alpaca.risk_manager import RiskManager
+from fundrunner.utils import fast_json
 
 
 class YieldFarmingMode:
@@ -99,7 +100,7 @@ class YieldFarmer:
         risk_manager: Optional[RiskManager] = None,
         logger: Optional[logging.Logger] = None,
     ) -> None:
-        self.client: AlpacaClient = client or AlpacaClient()
+        self.client: AlpacaClient = client or get_client()
         self.trader: TradeManager = trader or TradeManager()
         self.risk_manager: RiskManager = risk_manager or RiskManager(client=self.client)
         self.logger = logger or logging.getLogger(__name__)
@@ -131,9 +132,9 @@ class YieldFarmer:
         url = f"https://query1.finance.yahoo.com/v7/finance/quote?symbols={joined}"
         headers = {"User-Agent": self.USER_AGENT}
         try:
-            resp = requests.get(url, headers=headers, timeout=10)
+            resp = get_session().get(url, headers=headers, timeout=10)
             resp.raise_for_status()
-            data = resp.json()
+            data = fast_json.loads(resp.content)
             results = data.get("quoteResponse", {}).get("result", [])
             return {item["symbol"]: item for item in results}
         except Exception as e:
@@ -162,9 +163,9 @@ class YieldFarmer:
         )
         headers = {"User-Agent": self.USER_AGENT}
         try:
-            resp = requests.get(url, headers=headers, timeout=10)
+            resp = get_session().get(url, headers=headers, timeout=10)
             resp.raise_for_status()
-            raw = resp.json()
+            raw = fast_json.loads(resp.content)
             result = raw.get("quoteSummary", {}).get("result", [])
             if not result:
                 return None, None
@@ -207,13 +208,15 @@ class YieldFarmer:
         """
         symbols = list(symbols)
         quotes = self._fetch_yahoo_quote(symbols)
+        # One calendar request per symbol; run them concurrently.
+        with ThreadPoolExecutor(max_workers=min(10, len(symbols) or 1)) as pool:
+            calendars = list(pool.map(self._fetch_yahoo_calendar, symbols))
         info: Dict[str, dict] = {}
-        for sym in symbols:
+        for sym, (ex_date, _) in zip(symbols, calendars):
             q = quotes.get(sym, {}) or {}
             rate = q.get("trailingAnnualDividendRate", 0) or 0.0
             # trailingAnnualDividendYield is expressed as a fraction (e.g. 0.02 -> 2%)
             yield_frac = q.get("trailingAnnualDividendYield", 0) or 0.0
-            ex_date, _ = self._fetch_yahoo_calendar(sym)
             info[sym] = {
                 "dividend_yield": float(yield_frac) if yield_frac else 0.0,
                 "dividend_rate": float(rate) if rate else 0.0,
@@ -251,9 +254,10 @@ class YieldFarmer:
     def compute_volatility(self, symbol: str, days: int = 30) -> float:
         """Compute recent price volatility for a symbol.
 
-        Uses Alpaca's historical bar API via :class:`AlpacaClient.get_bars` to
-        fetch daily bars for the last ``days`` days and returns the standard
-        deviation of daily returns.  If data is unavailable or the result is
+        Uses Alpaca's historical bar API via
+        :meth:`AlpacaClient.get_historical_close_volume` to fetch daily bars
+        for the last ``days`` days and returns the standard deviation of daily
+        returns.  If data is unavailable or the result is
         empty, returns a small positive number to avoid division by zero.
 
         Parameters
@@ -271,19 +275,14 @@ class YieldFarmer:
             standard deviation.
         """
         try:
-            end_dt = datetime.utcnow()
-            start_dt = end_dt - timedelta(days=days)
-            start = start_dt.strftime("%Y-%m-%dT%H:%M:%SZ")
-            end = end_dt.strftime("%Y-%m-%dT%H:%M:%SZ")
-            bars = self.client.get_bars(symbol, start=start, end=end)
-            if bars.empty:
+            series = self.client.get_historical_close_volume(symbol, days=days)
+            if series is None or series[0].size < 3:
+                # Fewer than two returns: fall back to a small value
                 return 0.01
+            closes = series[0]
             # Compute percentage returns on close prices
-            bars = bars.copy()
-            bars["Return"] = bars["close"].pct_change()
-            vol = bars["Return"].std()
-            # If NaN (only one bar) fallback to small value
-            return float(vol) if (vol is not None and not np.isnan(vol)) else 0.01
+            vol = float((np.diff(closes) / closes[:-1]).std(ddof=1))
+            return vol if not np.isnan(vol) else 0.01
         except Exception as e:
             self.logger.warning("Could not compute volatility for %s: %s", symbol, e)
             return 0.01
@@ -3,7 +3,9 @@
 This module defines :class:`Dashboard`, a wrapper around ``rich.Live`` that
 maintains persistent tables for trade evaluations, tracked trades, and the
 portfolio. Tables are updated in-place and re-rendered through ``Live`` only
-when data changes.
+when data changes: ``Live`` runs without its auto-refresh timer, mutations
+made through the dashboard's methods mark it dirty, and
+:meth:`Dashboard.refresh` is a no-op otherwise.
 """
 
 from __future__ import annotations
@@ -11,20 +13,63 @@ from __future__ import annotations
 from rich.console import Console, Group
 from rich.live import Live
 from rich.panel import Panel
+from rich.style import Style
 from rich.table import Table
 
 
 class Dashboard:
     """Manage persistent trading tables and live rendering."""
 
-    def __init__(self, console: Console, refresh_per_second: int = 2) -> None:
+    __slots__ = (
+        "console",
+        "summary_table",
+        "trade_tracker_table",
+        "portfolio_table",
+        "_summary_index",
+        "_dirty",
+        "_group_cache",
+        "_live",
+    )
+
+    # (header, justify, style) for each table's columns. Styles are parsed
+    # here once rather than from strings on every render.
+    _SUMMARY_COLUMNS = (
+        ("Ticker", "left", Style.parse("bold green")),
+        ("Current Price", "right", Style.parse("cyan")),
+        ("Probability", "right", Style.parse("magenta")),
+        ("Expected Net", "right", Style.parse("yellow")),
+        ("Decision", "left", Style.parse("bold red")),
+    )
+    _TRACKER_COLUMNS = (
+        ("Symbol", "center", Style.parse("green")),
+        ("Entry Price", "right", Style.parse("cyan")),
+        ("Stop Loss", "right", Style.parse("red")),
+        ("Profit Target", "right", Style.parse("magenta")),
+        ("ES Metric", "right", Style.parse("yellow")),
+        ("Status", "center", Style.parse("bold")),
+    )
+    _PORTFOLIO_STYLE = Style.parse("bold blue")
+    _PORTFOLIO_COLUMNS = (
+        ("Symbol", "center", Style.parse("green")),
+        ("Qty", "right", Style.parse("cyan")),
+        ("Avg Entry", "right", Style.parse("magenta")),
+        ("Current Price", "right", Style.parse("yellow")),
+        ("$ P/L", "right", Style.parse("red")),
+    )
+
+    def __init__(self, console: Console) -> None:
         self.console = console
         self.summary_table = self._create_summary_table()
         self.trade_tracker_table = self._create_trade_tracker_table()
         self.portfolio_table = self._create_portfolio_table()
-        self._live = Live(
-            self._group(), console=console, refresh_per_second=refresh_per_second
-        )
+        self._summary_index: dict[str, int] = {}
+        self._dirty = True
+        # Panels hold references to the live tables, so the group only needs
+        # rebuilding if a table object is replaced.
+        self._group_cache = self._group()
+        # Redraws are driven by refresh(); an auto-refresh thread would only
+        # repaint unchanged tables.
+        self._live = Live(self._group_cache, console=console, auto_refresh=False)
 
     @property
     def live(self) -> Live:
@@ -47,36 +92,66 @@ class Dashboard:
         self._live.stop()
 
     def refresh(self) -> None:
-        """Redraw the dashboard with current table contents."""
-        self._live.update(self._group())
+        """Redraw the dashboard if any table changed since the last refresh."""
+        if not self._dirty:
+            return
+        self._live.refresh()
+        self._dirty = False
 
-    @staticmethod
-    def _create_summary_table() -> Table:
-        table = Table(title="Trade Evaluation Summary")
-        table.add_column("Ticker", style="bold green")
-        table.add_column("Current Price", justify="right", style="cyan")
-        table.add_column("Probability", justify="right", style="magenta")
-        table.add_column("Expected Net", justify="right", style="yellow")
-        table.add_column("Decision", style="bold red")
-        return table
+    def set_rows(self, table: Table, rows) -> None:
+        """Replace every row of ``table`` with ``rows``."""
+        self._clear(table)
+        for row in rows:
+            table.add_row(*row)
+        self._dirty = True
 
     @staticmethod
-    def _create_trade_tracker_table() -> Table:
-        table = Table(title="Trade Tracker")
-        table.add_column("Symbol", justify="center", style="green")
-        table.add_column("Entry Price", justify="right", style="cyan")
-        table.add_column("Stop Loss", justify="right", style="red")
-        table.add_column("Profit Target", justify="right", style="magenta")
-        table.add_column("ES Metric", justify="right", style="yellow")
-        table.add_column("Status", justify="center", style="bold")
-        return table
+    def _clear(table: Table) -> None:
+        table.rows.clear()
+        for column in table.columns:
+            column._cells.clear()
+
+    def reset_summary(self, tickers) -> None:
+        """Replace the summary rows with a ``Pending`` row per ticker."""
+        self._clear(self.summary_table)
+        self._summary_index.clear()
+        self._dirty = True
+        for ticker in tickers:
+            self.update_summary_row(ticker, "-", "-", "-", "Pending")
+
+    def update_summary_row(self, ticker: str, *values: str) -> None:
+        """Set the cells for ``ticker`` in place, appending a row if new.
+
+        Existing rows are edited through the column cell lists so the table
+        is never rebuilt.
+        """
+        table = self.summary_table
+        self._dirty = True
+        index = self._summary_index.get(ticker)
+        if index is None:
+            self._summary_index[ticker] = table.row_count
+            table.add_row(ticker, *values)
+            return
+        for column, value in zip(table.columns[1:], values):
+            column._cells[index] = value
 
     @staticmethod
-    def _create_portfolio_table() -> Table:
-        table = Table(title="Live Portfolio Positions", style="bold blue")
-        table.add_column("Symbol", justify="center", style="green")
-        table.add_column("Qty", justify="right", style="cyan")
-        table.add_column("Avg Entry", justify="right", style="magenta")
-        table.add_column("Current Price", justify="right", style="yellow")
-        table.add_column("$ P/L", justify="right", style="red")
+    def _create_table(title: str, columns, **kwargs) -> Table:
+        table = Table(title=title, **kwargs)
+        for header, justify, style in columns:
+            table.add_column(header, justify=justify, style=style)
         return table
+
+    @classmethod
+    def _create_summary_table(cls) -> Table:
+        return cls._create_table("Trade Evaluation Summary", cls._SUMMARY_COLUMNS)
+
+    @classmethod
+    def _create_trade_tracker_table(cls) -> Table:
+        return cls._create_table("Trade Tracker", cls._TRACKER_COLUMNS)
+
+    @classmethod
+    def _create_portfolio_table(cls) -> Table:
+        return cls._create_table(
+            "Live Portfolio Positions", cls._PORTFOLIO_COLUMNS, style=cls._PORTFOLIO_STYLE
+        )
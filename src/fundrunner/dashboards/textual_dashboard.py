@@ -3,23 +3,17 @@
 This module defines :class:`DashboardApp`, an asynchronous application built
 with textual. It shows three tables for trade evaluations, the trade tracker,
 and the portfolio. Data is pushed into async queues that the app consumes to
-update the widgets. A calculation log pane displays messages below the tables.
+update the widgets; producers format rows as tuples of ``str`` so the UI loop
+only inserts them. A calculation log pane displays messages below the tables.
 """
 
 from __future__ import annotations
 
 import asyncio
-from typing import Iterable
 
 from textual.app import App, ComposeResult
 from textual.containers import Horizontal, Vertical
-
-try:  # Textual 0.4
-    from textual.widgets import TextLog
-except ImportError:  # pragma: no cover - fallback for earlier versions
-    from textual.widgets import Log as TextLog
-
-from textual.widgets import DataTable
+from textual.widgets import DataTable, Log
 
 
 class DashboardApp(App):
@@ -29,16 +23,20 @@ class DashboardApp(App):
     Screen {
         layout: vertical;
     }
-    TextLog {
+    Log {
         height: 10;
     }
     """
 
+    EVAL_COLUMNS = ("Ticker", "Current Price", "Probability", "Expected Net", "Decision")
+    TRADE_COLUMNS = ("Symbol", "Entry", "Stop", "Target", "ES", "Status")
+    PORTFOLIO_COLUMNS = ("Symbol", "Qty", "Avg Entry", "Current Price", "P/L$")
+
     def __init__(
         self,
-        eval_queue: asyncio.Queue[Iterable[str]],
-        trade_queue: asyncio.Queue[Iterable[str]],
-        portfolio_queue: asyncio.Queue[Iterable[str]],
+        eval_queue: asyncio.Queue[tuple[str, ...]],
+        trade_queue: asyncio.Queue[tuple[str, ...]],
+        portfolio_queue: asyncio.Queue[tuple[str, ...]],
         calc_queue: asyncio.Queue[str] | None = None,
         **kwargs,
     ) -> None:
@@ -50,31 +48,12 @@ class DashboardApp(App):
         self.eval_table = DataTable(zebra_stripes=True)
         self.trade_table = DataTable(zebra_stripes=True)
         self.portfolio_table = DataTable(zebra_stripes=True)
-        self.calc_log = TextLog()
+        self.calc_log = Log()
 
     def compose(self) -> ComposeResult:
-        self.eval_table.add_columns(
-            "Ticker",
-            "Current Price",
-            "Probability",
-            "Expected Net",
-            "Decision",
-        )
-        self.trade_table.add_columns(
-            "Symbol",
-            "Entry",
-            "Stop",
-            "Target",
-            "ES",
-            "Status",
-        )
-        self.portfolio_table.add_columns(
-            "Symbol",
-            "Qty",
-            "Avg Entry",
-            "Current Price",
-            "P/L$",
-        )
+        self.eval_table.add_columns(*self.EVAL_COLUMNS)
+        self.trade_table.add_columns(*self.TRADE_COLUMNS)
+        self.portfolio_table.add_columns(*self.PORTFOLIO_COLUMNS)
         tables = Horizontal(
             self.eval_table,
             self.trade_table,
@@ -86,19 +65,38 @@ class DashboardApp(App):
         )
 
     async def on_mount(self) -> None:
-        self.set_interval(0.1, self._poll_queues)
-
-    async def _poll_queues(self) -> None:
-        while not self.eval_queue.empty():
-            row = await self.eval_queue.get()
-            self.eval_table.add_row(*[str(x) for x in row])
-        while not self.trade_queue.empty():
-            row = await self.trade_queue.get()
-            self.trade_table.add_row(*[str(x) for x in row])
-        while not self.portfolio_queue.empty():
-            row = await self.portfolio_queue.get()
-            self.portfolio_table.add_row(*[str(x) for x in row])
+        # One consumer per queue wakes only when data arrives, instead of a
+        # timer polling every queue ten times a second.
+        feeds = [
+            (self.eval_queue, self.eval_table.add_rows),
+            (self.trade_queue, self.trade_table.add_rows),
+            (self.portfolio_queue, self.portfolio_table.add_rows),
+        ]
         if self.calc_queue is not None:
-            while not self.calc_queue.empty():
-                line = await self.calc_queue.get()
-                self.calc_log.write_line(str(line))
+            feeds.append((self.calc_queue, self.calc_log.write_lines))
+        for queue, write in feeds:
+            self.run_worker(self._consume(queue, write), group="queues")
+
+    async def _consume(self, queue: asyncio.Queue, write) -> None:
+        """Pass items from ``queue`` to ``write`` in bursts as they arrive."""
+        while True:
+            items = [await queue.get()]
+            items.extend(self._drain(queue))
+            # Apply a burst with one bulk call in one layout pass
+            with self.batch_update():
+                write(items)
+
+    @staticmethod
+    def _drain(queue: asyncio.Queue) -> list:
+        """Return everything currently in ``queue`` without yielding.
+
+        This app is the queues' only consumer, so nothing can empty them
+        between the ``empty()`` check and ``get_nowait()``.
+        """
+        items = []
+        while not queue.empty():
+            try:
+                items.append(queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        return items
@@ -1,22 +1,20 @@
 """Interactive CLI for managing the trading bot and daemon."""
 
+import argparse
 import sys
-import asyncio
-import json
 import os
+import re
+import tempfile
 from datetime import datetime  # <-- Added import for timestamps
-from fundrunner.alpaca.trade_manager import TradeManager
-from fundrunner.alpaca.portfolio_manager import PortfolioManager
-from fundrunner.alpaca.watchlist_manager import WatchlistManager
-from fundrunner.alpaca.trading_bot import TradingBot
-from fundrunner.alpaca.yield_farming import YieldFarmer
+from functools import cached_property
+from importlib import import_module
+from operator import attrgetter
 from fundrunner.services.lending_rates import LendingRateService
 from fundrunner.services.notifications import (
     log_lending_rate_failure,
     log_lending_rate_success,
 )
-from fundrunner.services.plaid_transfer import PlaidTransferService
-from rich.console import Console
+from rich.console import Console, Group
 from rich.table import Table
 from rich.panel import Panel
 from rich.prompt import Prompt
@@ -28,17 +26,267 @@ from fundrunner.utils.error_handling import (
     TradingError,
     safe_execute,
 )
+import time
+
 import requests
-from fundrunner.utils.config import TRADING_DAEMON_URL
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
+from fundrunner.utils import fast_json
+from fundrunner.utils.config import DEFAULT_TICKERS, TRADING_DAEMON_URLS
+
+try:
+    import readline
+except ImportError:  # pragma: no cover - not available on Windows
+    readline = None
+
+
+def _build_daemon_session():
+    """Return a session with a small keep-alive pool per trading daemon.
+
+    Start/stop/status calls (and status polling) then reuse one connection
+    per daemon instead of opening a new socket per request.
+    """
+    session = requests.Session()
+    for url in TRADING_DAEMON_URLS:
+        session.mount(url, HTTPAdapter(pool_connections=1, pool_maxsize=4))
+    return session
+
+
+DAEMON_SESSION = _build_daemon_session()
+
+# Open-order columns, fetched in one call per order
+_ORDER_FIELDS = attrgetter("id", "symbol", "side", "qty", "status")
+
+_TICKER_RE = re.compile(r"[A-Z][A-Z0-9.\-]{0,9}")
+
+
+def _parse_symbols(raw: str) -> list[str]:
+    """Return the ticker symbols in ``raw`` in one pass.
+
+    Any run of separators (commas, spaces, newlines from pasted CSV) splits
+    symbols, and stray characters are dropped.
+    """
+    return _TICKER_RE.findall(raw.upper())
+
+
+def _to_float(value) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return float("nan")
+
+
+def _compute_pl(qty, avg_entry, price):
+    """Return ``(dollar_pl, pct_pl)`` arrays for per-position inputs.
+
+    ``pct_pl`` is 0 where ``avg_entry`` is 0; NaN inputs propagate.
+    """
+    import numpy as np
+
+    diff = price - avg_entry
+    with np.errstate(divide="ignore", invalid="ignore"):
+        pct = np.where(avg_entry != 0, diff / avg_entry * 100, 0.0)
+    return diff * qty, pct
+
+
+def _position_rows(positions) -> list[tuple[str, ...]]:
+    """Return formatted P/L table rows for ``positions``.
+
+    Values are parsed into arrays once and the arithmetic runs vectorized;
+    a field that is missing or not numeric shows as ``N/A`` in its columns.
+    """
+    import numpy as np
+
+    def column(field, default=None):
+        return np.fromiter(
+            (_to_float(p.get(field, default)) for p in positions),
+            dtype=np.float64,
+            count=len(positions),
+        )
+
+    def fmt(values, valid, prefix="", suffix=""):
+        text = np.char.mod(f"{prefix}%.2f{suffix}", values)
+        return np.where(valid, text, "N/A")
+
+    qty = column("qty", 0)
+    avg_entry = column("avg_entry_price")
+    price = column("current_price")
+    has_value = ~np.isnan(qty) & ~np.isnan(price)
+    has_pl = has_value & ~np.isnan(avg_entry)
+    dollar_pl, pct_pl = _compute_pl(qty, avg_entry, price)
+    return list(
+        zip(
+            (str(p.get("symbol", "N/A")) for p in positions),
+            (str(p.get("qty", 0)) for p in positions),
+            fmt(price * qty, has_value, prefix="$").tolist(),
+            fmt(avg_entry, has_pl).tolist(),
+            fmt(price, has_pl).tolist(),
+            fmt(dollar_pl, has_pl, prefix="$").tolist(),
+            fmt(pct_pl, has_pl, suffix="%%").tolist(),
+        )
+    )
 
 
 class CLI:
+    """Interactive menu over the trading managers.
+
+    Managers and the trading bot are imported and built on first use so the
+    menu appears without loading the Alpaca client, pandas or the LLM stack.
+    """
+
+    _MENU_OPTIONS = (
+        ("1", "View Account Information"),
+        ("2", "View Portfolio Dashboard"),
+        ("3", "Enter a Trade (Buy/Sell)"),
+        ("4", "View Open Orders"),
+        ("5", "Manage Watchlist"),
+        ("6", "RAG Agent - Ask Advisor"),
+        ("7", "Run Trading Bot"),
+        ("8", "View Config"),
+        ("9", "Run Yield Farmer"),
+        ("10", "Manage Transfers & Payments"),
+        ("0", "Exit"),
+    )
+    _MENU_CHOICES = tuple(sorted((key for key, _ in _MENU_OPTIONS), key=int))
+
+    _WATCHLIST_MENU = (
+        "\n[bold blue]--- Watchlist Management ---[/bold blue]\n"
+        "[bold yellow]1.[/bold yellow] List Watchlists\n"
+        "[bold yellow]2.[/bold yellow] Create a Watchlist\n"
+        "[bold yellow]3.[/bold yellow] Add Symbol to Watchlist\n"
+        "[bold yellow]4.[/bold yellow] Remove Symbol from Watchlist\n"
+        "[bold yellow]5.[/bold yellow] View a Watchlist\n"
+        "[bold yellow]6.[/bold yellow] Delete a Watchlist\n"
+        "[bold yellow]7.[/bold yellow] Back to Main Menu"
+    )
+
+    # Columns shared by the open-order and order-history tables
+    _ORDER_COLUMNS = (
+        ("Symbol", "left"),
+        ("Side", "left"),
+        ("Qty", "right"),
+        ("Status", "left"),
+    )
+
+    # Minimum seconds between portfolio snapshots taken on menu redraws
+    _SNAPSHOT_INTERVAL = 30.0
+
+    _TRANSFERS_MENU = (
+        "\n[bold blue]--- Transfers & Payments ---[/bold blue]\n"
+        "[bold yellow]1.[/bold yellow] View Credit Cards\n"
+        "[bold yellow]2.[/bold yellow] Make Credit Card Payment\n"
+        "[bold yellow]3.[/bold yellow] View Recent Transfers\n"
+        "[bold yellow]4.[/bold yellow] Back to Main Menu"
+    )
+
     def __init__(self):
-        self.trade_manager = TradeManager()
-        self.portfolio_manager = PortfolioManager()
-        self.watchlist_manager = WatchlistManager()
-        self.transfer_service = PlaidTransferService()
         self.console = Console()
+        self._completions: list[str] = []
+        self._last_snapshot: str | None = None
+        self._last_snapshot_ts = float("-inf")
+        self._enable_symbol_completion()
+
+    @cached_property
+    def _known_symbols(self) -> set[str]:
+        """Symbols offered for Tab completion at the prompts.
+
+        Seeded from ``DEFAULT_TICKERS`` and extended with every symbol typed
+        or shown in a watchlist.
+        """
+        return set(_parse_symbols(DEFAULT_TICKERS))
+
+    def _enable_symbol_completion(self) -> None:
+        """Install :meth:`_complete_symbol` as the ``readline`` completer."""
+        if readline is None:
+            return
+        readline.set_completer(self._complete_symbol)
+        readline.set_completer_delims(" ,;\t\n")
+        if "libedit" in (readline.__doc__ or ""):
+            readline.parse_and_bind("bind ^I rl_complete")
+        else:
+            readline.parse_and_bind("tab: complete")
+
+    def _complete_symbol(self, text: str, state: int):
+        """Return the ``state``-th known symbol starting with ``text``."""
+        if state == 0:
+            prefix = text.upper()
+            self._completions = sorted(
+                s for s in self._known_symbols if s.startswith(prefix)
+            )
+        if state < len(self._completions):
+            return self._completions[state]
+        return None
+
+    def _ask_symbols(self, prompt: str, **kwargs) -> list[str]:
+        """Prompt for a symbol list and remember the symbols for completion."""
+        symbols = _parse_symbols(Prompt.ask(prompt, **kwargs))
+        self._known_symbols.update(symbols)
+        return symbols
+
+    def _ask_symbol(self, prompt: str) -> str:
+        """Prompt for one symbol and remember it for completion."""
+        symbol = Prompt.ask(prompt).upper().strip()
+        if symbol:
+            self._known_symbols.add(symbol)
+        return symbol
+
+    @cached_property
+    def trade_manager(self):
+        from fundrunner.alpaca.trade_manager import TradeManager
+
+        return TradeManager()
+
+    @cached_property
+    def portfolio_manager(self):
+        from fundrunner.alpaca.portfolio_manager import PortfolioManager
+
+        return PortfolioManager()
+
+    @cached_property
+    def watchlist_manager(self):
+        from fundrunner.alpaca.watchlist_manager import WatchlistManager
+
+        return WatchlistManager()
+
+    @cached_property
+    def _event_loop(self):
+        """Event loop shared by every async menu action in this session."""
+        import asyncio
+
+        return asyncio.new_event_loop()
+
+    def _run_async(self, coro):
+        """Run ``coro`` to completion on the session's event loop.
+
+        Reusing one loop avoids building and tearing down a loop each time
+        the trading bot or options session is launched. Tasks the action
+        leaves behind (e.g. a position monitor holding a websocket) are
+        cancelled and drained before returning to the menu.
+        """
+        import asyncio
+
+        loop = self._event_loop
+        try:
+            return loop.run_until_complete(coro)
+        finally:
+            pending = asyncio.all_tasks(loop)
+            for task in pending:
+                task.cancel()
+            if pending:
+                loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+
+    def _close_event_loop(self):
+        """Shut down and close the session's event loop if one was created."""
+        loop = self.__dict__.pop("_event_loop", None)
+        if loop is not None and not loop.is_closed():
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.close()
+
+    @cached_property
+    def transfer_service(self):
+        from fundrunner.services.plaid_transfer import PlaidTransferService
+
+        return PlaidTransferService()
 
     def _format_money(self, value, currency="USD") -> str:
         """Format numeric values as currency strings for display."""
@@ -144,28 +392,34 @@ class CLI:
                 qty = pos.get("qty", 0)
                 if avg_entry is not None and current_price is not None:
                     overall_pl += (current_price - avg_entry) * qty
+            # Pick the lookup once for the account's type rather than per field
+            if isinstance(account, dict):
+                field = account.get
+            else:
+                def field(name, default):
+                    return getattr(account, name, default)
+            cash = field("cash", "N/A")
             # If in simulation mode, include cash change relative to SIMULATED_STARTING_CASH
             if SIMULATION_MODE:
-                cash = self.extract_account_field(account, "cash")
                 try:
                     overall_pl += float(cash) - SIMULATED_STARTING_CASH
-                except Exception:
+                except (TypeError, ValueError):
                     pass
 
             info_panel = Panel.fit(
-                f"[bold green]Cash:[/bold green] {self.extract_account_field(account, 'cash')}\n"
-                f"[bold cyan]Buying Power:[/bold cyan] {self.extract_account_field(account, 'buying_power')}\n"
-                f"[bold magenta]Equity:[/bold magenta] {self.extract_account_field(account, 'equity')}\n"
-                f"[bold yellow]Portfolio Value:[/bold yellow] {self.extract_account_field(account, 'portfolio_value')}\n"
+                f"[bold green]Cash:[/bold green] {cash}\n"
+                f"[bold cyan]Buying Power:[/bold cyan] {field('buying_power', 'N/A')}\n"
+                f"[bold magenta]Equity:[/bold magenta] {field('equity', 'N/A')}\n"
+                f"[bold yellow]Portfolio Value:[/bold yellow] {field('portfolio_value', 'N/A')}\n"
                 f"[bold red]Overall P/L:[/bold red] {overall_pl:.2f}",
                 title="[bold red]Account Information[/bold red]",
                 border_style="green",
             )
-            self.console.print(info_panel)
-
+            renderables = [info_panel]
             credit_cards = self._fetch_credit_cards()
             if credit_cards:
-                self.console.print(self._build_credit_card_table(credit_cards))
+                renderables.append(self._build_credit_card_table(credit_cards))
+            self.console.print(Group(*renderables))
 
         success, result = safe_execute(_view_account)
         if not success:
@@ -213,12 +467,11 @@ class CLI:
                 title=f"[bold red]Portfolio Dashboard ({timestamp})[/bold red]",
                 border_style="green",
             )
-            self.console.print(panel)
             pl_panel = Panel.fit(
                 f"[bold red]Overall Account P/L: {overall_pl:.2f}[/bold red]",
                 border_style="red",
             )
-            self.console.print(pl_panel)
+            self.console.print(Group(panel, pl_panel))
             return {"account": account, "positions": positions}
 
         success, result = safe_execute(_show_portfolio)
@@ -230,7 +483,14 @@ class CLI:
             return {}
 
     def save_portfolio_snapshot(self):
-        """Persist the latest account and position data to `portfolio_snapshot.json`."""
+        """Persist the latest account and position data to `portfolio_snapshot.json`.
+
+        Runs on every menu redraw, so it fetches at most once per
+        ``_SNAPSHOT_INTERVAL`` seconds and skips the write when nothing
+        changed.
+        """
+        if time.monotonic() - self._last_snapshot_ts < self._SNAPSHOT_INTERVAL:
+            return
         snapshot = {}
         try:
             account = self.portfolio_manager.view_account()
@@ -241,8 +501,18 @@ class CLI:
                 "account": account,
                 "positions": positions,
             }
-            with open("portfolio_snapshot.json", "w") as f:
-                json.dump(snapshot, f, indent=2)
+            data = fast_json.dumps(snapshot)
+            self._last_snapshot_ts = time.monotonic()
+            if data == self._last_snapshot:
+                return
+            # Write beside the target and rename so readers never see a
+            # partially written file
+            with tempfile.NamedTemporaryFile(
+                "w", dir=".", prefix=".portfolio_snapshot.", delete=False
+            ) as f:
+                f.write(data)
+            os.replace(f.name, "portfolio_snapshot.json")
+            self._last_snapshot = data
         except Exception as e:
             self.console.print(f"[red]Error saving portfolio snapshot: {e}[/red]")
 
@@ -253,6 +523,11 @@ class CLI:
         # Save a snapshot every time the menu is rendered so that recent data is available
         self.save_portfolio_snapshot()
 
+        self.console.print(self._menu_panel)
+
+    @cached_property
+    def _menu_panel(self) -> Panel:
+        """Main menu panel, built once and reprinted on every redraw."""
         table = Table(
             show_edge=True,
             header_style="bold magenta",
@@ -260,41 +535,13 @@ class CLI:
         )
         table.add_column("Option", justify="center", style="cyan", no_wrap=True)
         table.add_column("Description", style="green")
-
-        options = [
-            ("1", "View Account Information"),
-            ("2", "View Portfolio Dashboard"),
-            ("3", "Enter a Trade (Buy/Sell)"),
-            ("4", "View Open Orders"),
-            ("5", "Manage Watchlist"),
-            ("6", "RAG Agent - Ask Advisor"),
-            ("7", "Run Trading Bot"),
-            ("8", "View Config"),
-            ("9", "Run Yield Farmer"),
-            ("10", "Manage Transfers & Payments"),
-            ("0", "Exit"),
-        ]
-
-        for key, desc in options:
+        for key, desc in self._MENU_OPTIONS:
             table.add_row(key, desc)
-
-        menu_panel = Panel(
-            table, title="[bold red]Main Menu[/bold red]", border_style="blue"
-        )
-        self.console.print(menu_panel)
+        return Panel(table, title="[bold red]Main Menu[/bold red]", border_style="blue")
 
     def manage_watchlist_menu(self):
         while True:
-            self.console.print("\n[bold blue]--- Watchlist Management ---[/bold blue]")
-            self.console.print("[bold yellow]1.[/bold yellow] List Watchlists")
-            self.console.print("[bold yellow]2.[/bold yellow] Create a Watchlist")
-            self.console.print("[bold yellow]3.[/bold yellow] Add Symbol to Watchlist")
-            self.console.print(
-                "[bold yellow]4.[/bold yellow] Remove Symbol from Watchlist"
-            )
-            self.console.print("[bold yellow]5.[/bold yellow] View a Watchlist")
-            self.console.print("[bold yellow]6.[/bold yellow] Delete a Watchlist")
-            self.console.print("[bold yellow]7.[/bold yellow] Back to Main Menu")
+            self.console.print(self._WATCHLIST_MENU)
             choice = Prompt.ask("Select an option", default="7")
 
             if choice == "1":
@@ -303,22 +550,25 @@ class CLI:
                     if not watchlists:
                         self.console.print("[red]No watchlists found.[/red]")
                     else:
+                        table = Table(title="Watchlists", style="bold blue")
+                        table.add_column("ID", style="bold")
+                        table.add_column("Name", style="green")
+                        table.add_column("Symbols", style="cyan")
                         for wl in watchlists:
                             symbols = (
                                 ", ".join(wl.symbols)
                                 if hasattr(wl, "symbols")
                                 else "N/A"
                             )
-                            self.console.print(
-                                f"ID: [bold]{wl.id}[/bold], Name: [green]{wl.name}[/green], Symbols: [cyan]{symbols}[/cyan]"
-                            )
+                            self._known_symbols.update(getattr(wl, "symbols", ()))
+                            table.add_row(str(wl.id), str(wl.name), symbols)
+                        self.console.print(table)
                 except Exception as e:
                     self.console.print(f"[red]Error listing watchlists: {e}[/red]")
 
             elif choice == "2":
                 name = Prompt.ask("Enter watchlist name")
-                symbols_input = Prompt.ask("Enter symbols (comma separated)")
-                symbols = [s.strip().upper() for s in symbols_input.split(",")]
+                symbols = self._ask_symbols("Enter symbols (comma separated)")
                 try:
                     wl = self.watchlist_manager.create_watchlist(name, symbols)
                     self.console.print(
@@ -329,7 +579,7 @@ class CLI:
 
             elif choice == "3":
                 wl_id = Prompt.ask("Enter watchlist ID (or name)")
-                symbol = Prompt.ask("Enter symbol to add").upper().strip()
+                symbol = self._ask_symbol("Enter symbol to add")
                 try:
                     self.watchlist_manager.add_to_watchlist(wl_id, symbol)
                     self.console.print(
@@ -340,7 +590,7 @@ class CLI:
 
             elif choice == "4":
                 wl_id = Prompt.ask("Enter watchlist ID")
-                symbol = Prompt.ask("Enter symbol to remove").upper().strip()
+                symbol = self._ask_symbol("Enter symbol to remove")
                 try:
                     self.watchlist_manager.remove_from_watchlist(wl_id, symbol)
                     self.console.print(
@@ -484,11 +734,7 @@ class CLI:
             return
 
         while True:
-            self.console.print("\n[bold blue]--- Transfers & Payments ---[/bold blue]")
-            self.console.print("[bold yellow]1.[/bold yellow] View Credit Cards")
-            self.console.print("[bold yellow]2.[/bold yellow] Make Credit Card Payment")
-            self.console.print("[bold yellow]3.[/bold yellow] View Recent Transfers")
-            self.console.print("[bold yellow]4.[/bold yellow] Back to Main Menu")
+            self.console.print(self._TRANSFERS_MENU)
             choice = Prompt.ask("Select an option", default="4")
 
             if choice == "1":
@@ -510,7 +756,7 @@ class CLI:
                 self.console.print("[red]Invalid option. Try again.[/red]")
 
     def enter_trade(self):
-        symbol = Prompt.ask("Enter symbol").upper().strip()
+        symbol = self._ask_symbol("Enter symbol")
         qty_str = Prompt.ask("Enter quantity")
         try:
             qty = int(qty_str)
@@ -555,21 +801,28 @@ class CLI:
             self.console.print(f"[red]{error_msg}[/red]")
 
     def view_open_orders(self):
+        """Show open orders in a single table."""
         try:
             orders = self.trade_manager.list_open_orders()
             if not orders:
                 self.console.print("[red]No open orders.[/red]")
             else:
-                self.console.print("\n[bold blue]--- Open Orders ---[/bold blue]")
+                table = self._orders_table("Open Orders", "ID")
                 for order in orders:
-                    self.console.print(
-                        f"ID: [bold]{order.id}[/bold], Symbol: [green]{order.symbol}[/green], "
-                        f"Side: [cyan]{order.side}[/cyan], Qty: [magenta]{order.qty}[/magenta], "
-                        f"Status: [yellow]{order.status}[/yellow]"
-                    )
+                    table.add_row(*map(str, _ORDER_FIELDS(order)))
+                self.console.print(table)
         except Exception as e:
             self.console.print(f"[red]Error retrieving open orders: {e}[/red]")
 
+    @classmethod
+    def _orders_table(cls, title: str, first: str, justify: str = "left") -> Table:
+        """Return an empty order table led by the ``first`` column."""
+        table = Table(title=title, style="bold blue")
+        table.add_column(first, justify=justify)
+        for header, col_justify in cls._ORDER_COLUMNS:
+            table.add_column(header, justify=col_justify)
+        return table
+
     def view_order_history(self):
         """Display recent order history from ``transactions.log``."""
         try:
@@ -579,12 +832,7 @@ class CLI:
             if not entries:
                 self.console.print("[red]No order history found.[/red]")
                 return
-            table = Table(title="Order History", style="bold blue")
-            table.add_column("Time", justify="center")
-            table.add_column("Symbol")
-            table.add_column("Side")
-            table.add_column("Qty", justify="right")
-            table.add_column("Status")
+            table = self._orders_table("Order History", "Time", "center")
             for entry in entries:
                 details = entry.get("trade_details", {})
                 order = entry.get("order", {})
@@ -623,70 +871,23 @@ class CLI:
                 table.add_column("$ P/L", justify="right", style="red")
                 table.add_column("% P/L", justify="right", style="red")
 
-                for pos in positions:
-                    symbol = str(pos.get("symbol", "N/A"))
-                    qty = pos.get("qty", 0)
-                    market_val = pos.get("market_value", "N/A")
-                    unrealized_pl = getattr(pos, "unrealized_pl", "N/A")
-                    if unrealized_pl is not None:
-                        unrealized_pl_str = f"${unrealized_pl}"
-                    avg_entry = pos.get("avg_entry_price", None)
-                    current_price = pos.get("current_price", None)
-
-                    # Initialize placeholders
-                    avg_entry_str = "N/A"
-                    current_price_str = "N/A"
-                    dollar_pl_str = "N/A"
-                    pct_pl_str = "N/A"
-
-                    if qty is not None and current_price is not None:
-                        try:
-                            market_val_calc = float(current_price) * float(qty)
-                            market_val_str = f"${market_val_calc:.2f}"
-                        except:
-                            market_val_str = "N/A"
-                    else:
-                        market_val_str = "N/A"
-
-                    if avg_entry is not None and current_price is not None:
-                        try:
-                            avg_entry_val = float(avg_entry)
-                            current_price_val = float(current_price)
-                            dollar_pl = (current_price_val - avg_entry_val) * float(qty)
-                            avg_entry_str = f"{avg_entry_val:.2f}"
-                            current_price_str = f"{current_price_val:.2f}"
-                            dollar_pl_str = f"${dollar_pl:.2f}"
-                            pct_pl = 0.0
-                            if avg_entry_val != 0:
-                                pct_pl = (
-                                    (current_price_val - avg_entry_val)
-                                    / avg_entry_val
-                                    * 100
-                                )
-                            pct_pl_str = f"{pct_pl:.2f}%"
-                        except:
-                            pass
-
-                    table.add_row(
-                        symbol,
-                        str(qty),
-                        market_val_str,
-                        avg_entry_str,
-                        current_price_str,
-                        dollar_pl_str,
-                        pct_pl_str,
-                    )
+                for row in _position_rows(positions):
+                    table.add_row(*row)
 
                 self.console.print(table)
         except Exception as e:
             self.console.print(f"[red]Error retrieving positions: {e}[/red]")
 
     def get_trading_advice(self):
-        prompt_text = Prompt.ask("Enter your prompt for trading advice")
+        # Importing the LLM client stack takes most of a second; do it while
+        # the user is still typing the prompt.
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            advisor = pool.submit(import_module, "fundrunner.bots.chatgpt_advisor")
+            prompt_text = Prompt.ask("Enter your prompt for trading advice")
         try:
-            from fundrunner.bots.chatgpt_advisor import get_account_overview
-
-            advice = get_account_overview(prompt_text)
+            get_account_overview = advisor.result().get_account_overview
+            with self.console.status("Fetching trading advice..."):
+                advice = get_account_overview(prompt_text)
             advice_panel = Panel.fit(
                 advice, title="[bold red]Trading Advice[/bold red]", border_style="blue"
             )
@@ -696,18 +897,19 @@ class CLI:
 
     def run_trading_bot(self):
         """Launch the trading bot with optional symbol overrides."""
-        symbols_input = Prompt.ask(
+        symbols = self._ask_symbols(
             "Enter symbols (comma separated) for the trading bot (or press Enter to use default)"
         )
-        symbols = [s.strip().upper() for s in symbols_input.split(",") if s.strip()]
         try:
+            from fundrunner.alpaca.trading_bot import TradingBot
+
             bot = TradingBot(
                 auto_confirm=False,
                 vet_trade_logic=True,
                 vetter_vendor="local",
                 micro_mode=MICRO_MODE,
             )
-            asyncio.run(bot.run(symbols if symbols else None))
+            self._run_async(bot.run(symbols if symbols else None))
         except Exception as e:
             self.console.print(f"[red]Error running trading bot: {e}[/red]")
 
@@ -723,12 +925,9 @@ class CLI:
         )
         try:
             if strategy == "lending":
-                symbols_str = Prompt.ask(
+                symbols = self._ask_symbols(
                     "Symbols to consider (comma separated)", default=""
                 )
-                symbols = [
-                    s.strip().upper() for s in symbols_str.split(",") if s.strip()
-                ]
                 allocation_str = Prompt.ask("Allocation percent (0-1)", default="0.5")
                 top_n_str = Prompt.ask("Top N symbols", default="3")
 
@@ -794,18 +993,17 @@ class CLI:
                     table.add_row(sym, f"{rate:.3f}")
                 self.console.print(table)
             else:
-                symbols_str = Prompt.ask(
+                symbols = self._ask_symbols(
                     "Symbols to consider (comma separated)", default=""
                 )
-                symbols = [
-                    s.strip().upper() for s in symbols_str.split(",") if s.strip()
-                ]
                 allocation = float(
                     Prompt.ask("Allocation percent (0-1)", default="0.5")
                 )
                 active_choice = Prompt.ask(
                     "Pick next ex-dividend stock only?", choices=["y", "n"], default="n"
                 )
+                from fundrunner.alpaca.yield_farming import YieldFarmer
+
                 farmer = YieldFarmer()
                 portfolio = farmer.build_dividend_portfolio(
                     symbols,
@@ -846,7 +1044,7 @@ class CLI:
         try:
             from fundrunner.bots.options_trading_bot import run_options_analysis
 
-            asyncio.run(run_options_analysis())
+            self._run_async(run_options_analysis())
         except Exception as e:
             self.console.print(f"[red]Error running options trading session: {e}[/red]")
 
@@ -858,29 +1056,56 @@ class CLI:
         except Exception as e:
             self.console.print(f"[red]Error launching watchlist view: {e}[/red]")
 
-    def start_daemon(self):
-        """Send a request to start the trading daemon."""
-        try:
-            r = requests.post(f"{TRADING_DAEMON_URL}/start")
-            self.console.print(str(r.json()))
-        except Exception as e:
-            self.console.print(f"[red]Error starting daemon: {e}[/red]")
+    def _daemon_request(self, method, path, action, urls=None):
+        """Send ``method path`` to every daemon in ``urls`` concurrently.
 
-    def stop_daemon(self):
-        """Send a request to stop the trading daemon."""
-        try:
-            r = requests.post(f"{TRADING_DAEMON_URL}/stop")
-            self.console.print(str(r.json()))
-        except Exception as e:
-            self.console.print(f"[red]Error stopping daemon: {e}[/red]")
+        ``urls`` defaults to :data:`TRADING_DAEMON_URLS`. Responses are printed
+        in ``urls`` order, prefixed with the daemon URL when there are several.
+        """
+        urls = list(urls or TRADING_DAEMON_URLS)
+
+        def call(url):
+            try:
+                return DAEMON_SESSION.request(method, f"{url}{path}").json()
+            except Exception as e:
+                return e
+
+        with ThreadPoolExecutor(max_workers=len(urls)) as pool:
+            results = list(pool.map(call, urls))
+        for url, result in zip(urls, results):
+            prefix = f"{url}: " if len(urls) > 1 else ""
+            if isinstance(result, Exception):
+                self.console.print(f"[red]{prefix}Error {action}: {result}[/red]")
+            else:
+                self.console.print(f"{prefix}{result}")
+
+    def start_daemon(self, urls=None):
+        """Send a request to start the trading daemon(s)."""
+        self._daemon_request("POST", "/start", "starting daemon", urls)
+
+    def stop_daemon(self, urls=None):
+        """Send a request to stop the trading daemon(s)."""
+        self._daemon_request("POST", "/stop", "stopping daemon", urls)
+
+    def daemon_status(self, urls=None):
+        """Display the current status of the trading daemon(s)."""
+        self._daemon_request("GET", "/status", "retrieving daemon status", urls)
+
+    def watch_daemon_status(self, interval: float = 5.0, iterations=None, urls=None):
+        """Poll :meth:`daemon_status` every ``interval`` seconds.
 
-    def daemon_status(self):
-        """Display the current daemon status."""
+        Runs until interrupted, or for ``iterations`` polls when given. Every
+        poll goes through :data:`DAEMON_SESSION` so the connection is reused.
+        """
+        count = 0
         try:
-            r = requests.get(f"{TRADING_DAEMON_URL}/status")
-            self.console.print(str(r.json()))
-        except Exception as e:
-            self.console.print(f"[red]Error retrieving daemon status: {e}[/red]")
+            while iterations is None or count < iterations:
+                if count:
+                    time.sleep(interval)
+                self.daemon_status(urls)
+                count += 1
+        except KeyboardInterrupt:
+            pass
 
     def view_config_menu(self) -> None:
         """Display non-secret configuration settings."""
@@ -976,10 +1201,7 @@ class CLI:
 
         while True:
             self.print_menu()
-            choice = Prompt.ask(
-                "Select an option",
-                choices=["0", "1", "2", "3", "4", "5", "6", "7", "8", "9", "10"],
-            )
+            choice = Prompt.ask("Select an option", choices=self._MENU_CHOICES)
 
             if choice == "1":
                 self.view_account_info()
@@ -1003,17 +1225,37 @@ class CLI:
                 self.manage_transfers_menu()
             elif choice == "0":
                 self.console.print("[bold red]Exiting the app.[/bold red]")
+                self._close_event_loop()
                 sys.exit(0)
             Prompt.ask("\nPress Enter to return to the Main Menu", default="")
 
 
-def main():
-    """Entry point for the FundRunner CLI application."""
+def main(argv=None):
+    """Entry point for the FundRunner CLI application.
+
+    ``--watch N`` polls the trading daemon status every ``N`` seconds over one
+    pooled session instead of opening the interactive menu.
+    """
+    parser = argparse.ArgumentParser(prog="fundrunner", description="FundRunner trading CLI")
+    parser.add_argument(
+        "--watch",
+        type=float,
+        metavar="N",
+        help="poll the trading daemon status every N seconds until interrupted",
+    )
+    args = parser.parse_args(argv)
+
     # Setup global error handling
     setup_global_error_handler()
 
     cli = CLI()
-    cli.run()
+    if args.watch is not None:
+        cli.watch_daemon_status(interval=args.watch)
+        return
+    try:
+        cli.run()
+    finally:
+        cli._close_event_loop()
 
 
 if __name__ == "__main__":
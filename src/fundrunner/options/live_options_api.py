@@ -1,11 +1,19 @@
 """Helpers for retrieving live options data via Alpaca."""
 
-import requests
 import logging
+from fundrunner.alpaca.api_client import get_session
 from fundrunner.utils.config import BASE_URL, DATA_URL, API_KEY, API_SECRET
 
 logger = logging.getLogger(__name__)
 
+_HEADERS = {
+    "APCA-API-KEY-ID": API_KEY,
+    "APCA-API-SECRET-KEY": API_SECRET,
+    "Accept": "application/json",
+}
+# (connect, read) timeouts; the calls previously had none and could hang
+_TIMEOUT = (3.05, 10)
+
 
 def get_live_options_chain(symbol, expiration=None):
     """
@@ -19,15 +27,12 @@ def get_live_options_chain(symbol, expiration=None):
         dict: JSON data containing the options chain or None on error.
     """
     url = f"{DATA_URL}/v2/options/contracts"
-    headers = {
-        "APCA-API-KEY-ID": API_KEY,
-        "APCA-API-SECRET-KEY": API_SECRET,
-        "Accept": "application/json",
-    }
     params = {"symbol": symbol}
     if expiration:
         params["expiration_date"] = expiration
-    response = requests.get(url, headers=headers, params=params)
+    response = get_session().get(
+        url, headers=_HEADERS, params=params, timeout=_TIMEOUT
+    )
     if response.status_code != 200:
         logger.error("Error fetching live options chain data: %s", response.text)
         return None
@@ -37,13 +42,8 @@ def get_live_options_chain(symbol, expiration=None):
 def get_latest_stock_price(symbol):
     """Fetch the latest trade price for a stock using Alpaca's market data API."""
     url = f"{DATA_URL}/v2/stocks/{symbol}/trades/latest"
-    headers = {
-        "APCA-API-KEY-ID": API_KEY,
-        "APCA-API-SECRET-KEY": API_SECRET,
-        "Accept": "application/json",
-    }
     try:
-        resp = requests.get(url, headers=headers)
+        resp = get_session().get(url, headers=_HEADERS, timeout=_TIMEOUT)
         resp.raise_for_status()
         data = resp.json()
         return data.get("trade", {}).get("p")
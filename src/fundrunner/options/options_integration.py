@@ -3,6 +3,7 @@
 import math
 import datetime
 import logging
+from functools import cached_property
 import requests
 import numpy as np
 import pandas as pd
@@ -17,14 +18,24 @@ logger.setLevel(logging.DEBUG)
 
 
 class AlpacaTicker:
-    """Minimal ticker interface using Alpaca data."""
+    """Minimal ticker interface using Alpaca data.
+
+    Only the latest trade price is fetched for :attr:`info`, and it is fetched
+    once per instance; reuse a ticker object rather than creating new ones to
+    avoid repeat quote requests.
+    """
 
     def __init__(self, symbol: str):
         self.symbol = symbol
 
+    @cached_property
+    def last_price(self):
+        """Latest trade price for the symbol, or ``None`` if unavailable."""
+        return get_latest_stock_price(self.symbol)
+
     @property
     def info(self):
-        price = get_latest_stock_price(self.symbol)
+        price = self.last_price
         return {"regularMarketPrice": price} if price is not None else {}
 
     @property
@@ -218,11 +229,8 @@ def get_atm_strike(ticker, expiry, option_type):
             )
             return base_strike
         else:
-            chain = (
-                t.option_chain(expiry).calls
-                if option_type == "call"
-                else t.option_chain(expiry).puts
-            )
+            option_chain = t.option_chain(expiry)
+            chain = option_chain.calls if option_type == "call" else option_chain.puts
             underlying_price = t.info.get("regularMarketPrice")
             if underlying_price is None:
                 logger.error("No underlying price available for %s", ticker)
@@ -314,9 +322,7 @@ def analyze_sentiment(ticker):
     'bullish' if current price is above 20-day MA, else 'bearish'.
     """
     try:
-        t = AlpacaTicker(ticker)
-        # Placeholder: Alpaca API does not provide historical daily data here.
-        hist = pd.DataFrame()
+        closes = np.empty(0)
         response = requests.get(
             f"{DATA_URL}/v2/stocks/{ticker}/bars",
             params={"timeframe": "1Day", "limit": 20},
@@ -326,15 +332,13 @@ def analyze_sentiment(ticker):
             },
         )
         if response.status_code == 200:
-            json_data = response.json()
-            bars = json_data.get("bars", [])
-            if bars:
-                hist = pd.DataFrame(bars)
-                hist.rename(columns={"c": "Close"}, inplace=True)
-        if hist.empty:
+            bars = response.json().get("bars") or []
+            closes = np.fromiter((bar["c"] for bar in bars), dtype=np.float64)
+        if closes.size == 0:
             return "neutral"
-        ma20 = hist["Close"].rolling(window=20).mean().iloc[-1]
-        current_price = hist["Close"].iloc[-1]
+        # Same as a 20-bar rolling mean's last value: NaN until 20 closes exist
+        ma20 = closes[-20:].mean() if closes.size >= 20 else np.nan
+        current_price = closes[-1]
         sentiment = "bullish" if current_price > ma20 else "bearish"
         logger.debug(
             "Sentiment for %s: current=%.2f, MA20=%.2f, sentiment=%s",
@@ -394,10 +398,10 @@ def evaluate_option_trade(trade_details):
         strike = get_atm_strike(underlying, expiry_str, option_type)
     else:
         strike = float(trade_details.get("strike"))
+    ticker = AlpacaTicker(underlying)
     # For long puts under bearish view, choose one strike above ATM:
     if option_type == "put":
-        t = AlpacaTicker(underlying)
-        underlying_price = t.info.get("regularMarketPrice")
+        underlying_price = ticker.info.get("regularMarketPrice")
         atm = round_to_nearest(underlying_price, 5)
         if atm < underlying_price:
             atm += 5
@@ -410,7 +414,6 @@ def evaluate_option_trade(trade_details):
         strike,
         expiry_str,
     )
-    ticker = AlpacaTicker(underlying)
     try:
         options = ticker.options
         if expiry_str not in options:
@@ -539,9 +542,8 @@ def evaluate_credit_spread(trade_details, live=False):
         if option_type == "call":
             strike_short = get_atm_strike(underlying, expiry_str, option_type)
         else:
-            t = AlpacaTicker(underlying)
-            base_strike = round_to_nearest(t.info.get("regularMarketPrice"), 5)
-            if base_strike < t.info.get("regularMarketPrice"):
+            base_strike = round_to_nearest(underlying_price, 5)
+            if base_strike < underlying_price:
                 base_strike += 5
             strike_short = base_strike
         trade_details["strike_short"] = strike_short
@@ -646,8 +648,7 @@ def evaluate_credit_spread(trade_details, live=False):
     max_loss = spread_width - credit_received if spread_width > credit_received else 0
     risk_reward_ratio = credit_received / max_loss if max_loss else None
 
-    t = AlpacaTicker(underlying)
-    S = t.info.get("regularMarketPrice")
+    S = underlying_price
     r = 0.01
     opt_info = leg_short.get("greeks", {})
     d2 = opt_info.get("d2", None)
@@ -735,9 +736,8 @@ def evaluate_debit_spread(trade_details):
         if option_type == "call":
             strike_buy = get_atm_strike(underlying, expiry_str, option_type)
         else:
-            t = AlpacaTicker(underlying)
-            base_strike = round_to_nearest(t.info.get("regularMarketPrice"), 5)
-            if base_strike < t.info.get("regularMarketPrice"):
+            base_strike = round_to_nearest(underlying_price, 5)
+            if base_strike < underlying_price:
                 base_strike += 5
             strike_buy = base_strike
         trade_details["strike_buy"] = strike_buy
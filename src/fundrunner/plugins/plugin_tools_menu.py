@@ -17,17 +17,22 @@ from plugins.sentiment_finbert import analyze_sentiment
 
 console = Console()
 
+MENU = (
+    "\n[bold cyan]PLUGIN TEST MENU[/bold cyan]\n"
+    "[1] Plot Trades\n"
+    "[2] Optimize Portfolio\n"
+    "[3] Analyze Sentiment\n"
+    "[0] Return to Main Menu"
+)
+MENU_CHOICES = ("0", "1", "2", "3")
+
 
 def plugin_tools_menu():
     """Display an interactive console for trying out plugins."""
     while True:
-        console.print("\n[bold cyan]PLUGIN TEST MENU[/bold cyan]")
-        console.print("[1] Plot Trades")
-        console.print("[2] Optimize Portfolio")
-        console.print("[3] Analyze Sentiment")
-        console.print("[0] Return to Main Menu")
+        console.print(MENU)
 
-        choice = Prompt.ask("Select", choices=["0", "1", "2", "3"])
+        choice = Prompt.ask("Select", choices=MENU_CHOICES)
 
         if choice == "1":
             # Simulated data
@@ -5,12 +5,21 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+
+def _env_bool(name: str, default: str = "false") -> bool:
+    """Return ``True`` when environment variable ``name`` is ``"true"``."""
+    return os.getenv(name, default).lower() == "true"
+
+
 # Alpaca API credentials and endpoint (paper trading endpoint)
 API_KEY = os.getenv("ALPACA_API_KEY", "your_api_key_here")
 API_SECRET = os.getenv("ALPACA_API_SECRET", "your_api_secret_here")
 BASE_URL = os.getenv("ALPACA_BASE_URL", "https://paper-api.alpaca.markets")
 DATA_URL = os.getenv("ALPACA_DATA_URL", "https://data.alpaca.markets")
 DATA_FEED = os.getenv("ALPACA_DATA_FEED", "iex")
+DATA_STREAM_URL = os.getenv(
+    "ALPACA_DATA_STREAM_URL", "https://stream.data.alpaca.markets"
+)
 
 # OpenAI API key for ChatGPT integration
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY", "your_openai_api_key_here")
@@ -18,16 +27,14 @@ OPENAI_API_KEY = os.getenv("OPENAI_API_KEY", "your_openai_api_key_here")
 # Local LLM API endpoint (for your custom local model)
 LOCAL_LLM_API_URL = os.getenv("LOCAL_LLM_API_URL", "http://localhost:5051/v1/chat")
 LOCAL_LLM_API_KEY = os.getenv("LOCAL_LLM_API_KEY", "your_local_llm_key")
-USE_LOCAL_LLM = os.getenv("USE_LOCAL_LLM", "false").lower() == "true"
+USE_LOCAL_LLM = _env_bool("USE_LOCAL_LLM")
 
 # Ticker filtering for trading bot (comma-separated strings)
 DEFAULT_TICKERS = os.getenv("DEFAULT_TICKERS", "AAPL,MSFT,GOOGL,AMZN,FB")
 EXCLUDE_TICKERS = os.getenv("EXCLUDE_TICKERS", "")
 
 # Flag to indicate if default tickers should be fetched via GPT
-DEFAULT_TICKERS_FROM_GPT = (
-    os.getenv("DEFAULT_TICKERS_FROM_GPT", "false").lower() == "true"
-)
+DEFAULT_TICKERS_FROM_GPT = _env_bool("DEFAULT_TICKERS_FROM_GPT")
 
 # SMTP configuration for notifications (if needed)
 SMTP_SERVER = os.getenv("SMTP_SERVER", "smtp.example.com")
@@ -38,17 +45,15 @@ NOTIFICATION_EMAIL = os.getenv("NOTIFICATION_EMAIL", "recipient@example.com")
 DISCORD_WEBHOOK_URL = os.getenv("DISCORD_WEBHOOK_URL", "")
 
 # Simulation settings for paper account
-SIMULATION_MODE = os.getenv("SIMULATION_MODE", "False").lower() == "true"
+SIMULATION_MODE = _env_bool("SIMULATION_MODE")
 SIMULATED_STARTING_CASH = float(os.getenv("SIMULATED_STARTING_CASH", "5000"))
 
 # Micro account configuration
-MICRO_MODE = os.getenv("MICRO_MODE", "false").lower() == "true"
+MICRO_MODE = _env_bool("MICRO_MODE")
 MICRO_ACCOUNT_SIZE = float(os.getenv("MICRO_ACCOUNT_SIZE", "100"))
 
 # Portfolio Manager mode configuration
-PORTFOLIO_MANAGER_MODE = (
-    os.getenv("PORTFOLIO_MANAGER_MODE", "false").lower() == "true"
-)
+PORTFOLIO_MANAGER_MODE = _env_bool("PORTFOLIO_MANAGER_MODE")
 
 if MICRO_MODE:
     # Override starting cash when running in micro mode
@@ -56,8 +61,10 @@ if MICRO_MODE:
 
 # GPT model configuration (centralized so all modules use the same model)
 GPT_MODEL = os.getenv("GPT_MODEL", "gpt-4o-mini")
-GPT_JSON_STRICT = os.getenv("GPT_JSON_STRICT", "true").lower() == "true"
+GPT_JSON_STRICT = _env_bool("GPT_JSON_STRICT", "true")
 LLM_REQUEST_TIMEOUT = int(os.getenv("LLM_REQUEST_TIMEOUT", "30"))
+# Append-only JSON-lines log of GPT prompts and responses; empty disables it
+GPT_REQUEST_LOG = os.getenv("GPT_REQUEST_LOG", "")
 
 # Tradier API key for live options data
 TRADIER_API_KEY = os.getenv("TRADIER_API_KEY", "your_tradier_api_key_here")
@@ -65,6 +72,28 @@ TRADIER_API_KEY = os.getenv("TRADIER_API_KEY", "your_tradier_api_key_here")
 # Base URL for the optional trading daemon API
 TRADING_DAEMON_URL = os.getenv("TRADING_DAEMON_URL", "http://127.0.0.1:8000")
 
+# Caching and fan-out settings
+
+# Optional comma-separated list of daemons (e.g. one per strategy) controlled
+# together from the CLI; defaults to the single daemon above
+TRADING_DAEMON_URLS = [
+    url.strip()
+    for url in os.getenv("TRADING_DAEMON_URLS", TRADING_DAEMON_URL).split(",")
+    if url.strip()
+]
+
+# On-disk cache for Alpaca historical bars (TTLs in seconds)
+ALPACA_CACHE_ENABLED = _env_bool("ALPACA_CACHE_ENABLED", "true")
+ALPACA_CACHE_DIR = os.getenv("ALPACA_CACHE_DIR", ".cache/alpaca")
+BARS_DAILY_TTL = int(os.getenv("BARS_DAILY_TTL", "86400"))
+BARS_INTRADAY_TTL = int(os.getenv("BARS_INTRADAY_TTL", "300"))
+# Account/position/order/watchlist reads are cached briefly in memory and
+# invalidated by writes
+ACCOUNT_TTL = int(os.getenv("ACCOUNT_TTL", "5"))
+ORDERS_TTL = int(os.getenv("ORDERS_TTL", "2"))
+POSITIONS_TTL = int(os.getenv("POSITIONS_TTL", "5"))
+WATCHLISTS_TTL = int(os.getenv("WATCHLISTS_TTL", "300"))
+
 # Trading daemon limits
 MAX_TRADES_PER_HOUR = int(os.getenv("MAX_TRADES_PER_HOUR", "10"))
 DAILY_STOP_LOSS = float(os.getenv("DAILY_STOP_LOSS", "1000"))
@@ -91,5 +120,5 @@ ALPHA_VANTAGE_API_KEY = os.getenv("ALPHA_VANTAGE_API_KEY", "")
 # Agentic Workflow Configuration
 AGENTS_ARTIFACTS_DIR = os.getenv("AGENTS_ARTIFACTS_DIR", "artifacts")
 AGENTS_MAX_CONTEXT_TOKENS = int(os.getenv("AGENTS_MAX_CONTEXT_TOKENS", "8000"))
-AGENTS_AUTO_APPROVE = os.getenv("AGENTS_AUTO_APPROVE", "false").lower() == "true"
-AGENTS_HUMAN_IN_LOOP = os.getenv("AGENTS_HUMAN_IN_LOOP", "true").lower() == "true"
+AGENTS_AUTO_APPROVE = _env_bool("AGENTS_AUTO_APPROVE")
+AGENTS_HUMAN_IN_LOOP = _env_bool("AGENTS_HUMAN_IN_LOOP", "true")
@@ -0,0 +1,42 @@
+"""JSON helpers that use :mod:`orjson` when it is installed.
+
+``orjson`` parses numeric-heavy payloads such as market data several times
+faster than the standard library. It is optional; without it these helpers
+fall back to :mod:`json` with identical results.
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+JSONDecodeError = json.JSONDecodeError
+
+
+def loads(data):
+    """Deserialize ``data`` (``bytes`` or ``str``) to a Python object.
+
+    Raises :class:`json.JSONDecodeError` on invalid input with either backend.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj):
+    """Serialize ``obj`` to a compact JSON ``str``.
+
+    NumPy scalars and arrays are supported; other unknown types fall back to
+    ``str()``.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+    return json.dumps(obj, separators=(",", ":"), default=_default)
+
+
+def _default(obj):
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    return str(obj)
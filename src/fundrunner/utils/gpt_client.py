@@ -9,8 +9,10 @@ import json
 import re
 import time
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from logging.handlers import RotatingFileHandler
 from typing import Dict, Any, Optional, Union
-from functools import wraps
+from functools import lru_cache, wraps
 import os
 
 from openai import OpenAI
@@ -23,11 +25,25 @@ from fundrunner.utils.config import (
     LOCAL_LLM_API_KEY,
     GPT_MODEL,
     GPT_JSON_STRICT,
-    LLM_REQUEST_TIMEOUT
+    LLM_REQUEST_TIMEOUT,
+    GPT_REQUEST_LOG,
 )
+from fundrunner.utils import fast_json
 
 logger = logging.getLogger(__name__)
 
+# One compact JSON record per request. The handler keeps a single descriptor
+# open (created on first write) instead of reopening the file per call.
+_request_log = logging.getLogger("gpt.requests")
+_request_log.propagate = False
+if GPT_REQUEST_LOG and not _request_log.handlers:
+    _handler = RotatingFileHandler(
+        GPT_REQUEST_LOG, maxBytes=10_000_000, backupCount=5, delay=True
+    )
+    _handler.setFormatter(logging.Formatter("%(message)s"))
+    _request_log.addHandler(_handler)
+    _request_log.setLevel(logging.INFO)
+
 # Initialize OpenAI client
 api_key = os.getenv("OPENAI_API_KEY")
 openai_client = OpenAI(api_key=api_key) if api_key else None
@@ -38,14 +54,22 @@ _min_request_interval = 1.0  # Minimum seconds between requests
 _request_count = 0
 _cost_tracking = {"total_tokens": 0, "estimated_cost_usd": 0.0}
 
+# Tokenizing is only needed for cost tracking, so it runs alongside the request
+_TOKEN_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="gpt-tokens")
 
-def count_tokens(prompt: str, model: str = "gpt-4") -> int:
-    """Return the number of tokens ``prompt`` would consume for ``model``."""
+
+@lru_cache(maxsize=8)
+def _get_encoding(model: str):
+    """Return the tiktoken encoding for ``model``, resolved once per model."""
     try:
-        encoding = tiktoken.encoding_for_model(model)
+        return tiktoken.encoding_for_model(model)
     except Exception:
-        encoding = tiktoken.get_encoding("cl100k_base")
-    return len(encoding.encode(prompt))
+        return tiktoken.get_encoding("cl100k_base")
+
+
+def count_tokens(prompt: str, model: str = "gpt-4") -> int:
+    """Return the number of tokens ``prompt`` would consume for ``model``."""
+    return len(_get_encoding(model).encode(prompt))
 
 
 def call_local_webui(prompt: str, max_tokens: int = 1000) -> str:
@@ -230,12 +254,12 @@ def ask_gpt_enhanced(prompt: str, model: str = None, timeout: int = None) -> Opt
     
     model = model or GPT_MODEL
     timeout = timeout or LLM_REQUEST_TIMEOUT
-    token_count = count_tokens(prompt, model)
+    token_future = _TOKEN_POOL.submit(count_tokens, prompt, model)
     
     _rate_limit()
     _request_count += 1
     
-    logger.debug(f"LLM request #{_request_count}, {token_count} tokens, model: {model}")
+    logger.debug(f"LLM request #{_request_count}, model: {model}")
     
     try:
         if USE_LOCAL_LLM:
@@ -257,16 +281,26 @@ def ask_gpt_enhanced(prompt: str, model: str = None, timeout: int = None) -> Opt
             )
             response = response.choices[0].message.content
         
-        # Update cost tracking
-        _update_cost_tracking(token_count, model)
-        
-        logger.info(f"LLM request completed: {token_count} tokens, estimated cost: ${_estimate_cost(token_count, model):.4f}")
-        return response
-        
     except Exception as e:
         logger.error(f"LLM request failed: {e}")
         raise
 
+    # Token counts only feed cost tracking; a tokenizer failure must not
+    # discard the response or trigger a retry of the paid request.
+    try:
+        token_count = token_future.result()
+    except Exception as e:
+        logger.debug(f"Token count failed, estimating from length: {e}")
+        token_count = len(prompt) // 4
+    _update_cost_tracking(token_count, model)
+    
+    logger.info(f"LLM request completed: {token_count} tokens, estimated cost: ${_estimate_cost(token_count, model):.4f}")
+    if _request_log.handlers:
+        _request_log.info(fast_json.dumps(
+            {"model": model, "tokens": token_count, "prompt": prompt, "response": response}
+        ))
+    return response
+
 
 def ask_gpt_json(prompt: str, schema: Optional[Dict[str, Any]] = None, model: str = None) -> Optional[Dict[str, Any]]:
     """Send prompt to GPT and return parsed JSON response.
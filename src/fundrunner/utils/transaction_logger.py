@@ -33,9 +33,36 @@ def log_transaction(trade_details, order):
         f.write(json.dumps(log_entry) + "\n")
 
 
+def _tail_lines(path, n, chunk_size=8192):
+    """Return the last ``n`` non-empty lines of ``path`` as bytes.
+
+    The file is read backwards in ``chunk_size`` blocks, so the cost depends
+    on ``n`` rather than on the size of the log.
+    """
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        pos = f.tell()
+        chunks = []
+        newlines = 0
+        # n lines need n + 1 newlines unless the start of the file is reached
+        while pos > 0 and newlines <= n:
+            step = min(chunk_size, pos)
+            pos -= step
+            f.seek(pos)
+            chunk = f.read(step)
+            chunks.append(chunk)
+            newlines += chunk.count(b"\n")
+    data = b"".join(reversed(chunks))
+    lines = [line for line in data.splitlines() if line.strip()]
+    return lines[-n:] if n > 0 else []
+
+
 def read_transactions(limit=10):
     """Return the most recent transaction records.
 
+    Only the tail of the log is read, so large logs are not loaded into
+    memory.
+
     Parameters
     ----------
     limit : int, optional
@@ -49,7 +76,4 @@ def read_transactions(limit=10):
 
     if not os.path.exists(TRANSACTION_LOG_FILE):
         return []
-    with open(TRANSACTION_LOG_FILE, "r") as f:
-        lines = f.readlines()
-    lines = lines[-limit:]
-    return [json.loads(line) for line in lines]
+    return [json.loads(line) for line in _tail_lines(TRANSACTION_LOG_FILE, limit)]
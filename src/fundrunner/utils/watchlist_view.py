@@ -9,7 +9,7 @@ from rich.table import Table
 from rich.prompt import Prompt
 
 from fundrunner.alpaca.watchlist_manager import WatchlistManager
-from fundrunner.alpaca.api_client import AlpacaClient
+from fundrunner.alpaca.api_client import get_client
 
 
 def _select_watchlist(manager: WatchlistManager, console: Console):
@@ -22,9 +22,10 @@ def _select_watchlist(manager: WatchlistManager, console: Console):
     if not watchlists:
         console.print("[red]No watchlists available.[/red]")
         return None
-    console.print("[bold blue]Available Watchlists[/bold blue]")
+    lines = ["[bold blue]Available Watchlists[/bold blue]"]
     for idx, wl in enumerate(watchlists, start=1):
-        console.print(f"[{idx}] {getattr(wl, 'name', wl.id)} ({wl.id})")
+        lines.append(f"[{idx}] {getattr(wl, 'name', wl.id)} ({wl.id})")
+    console.print("\n".join(lines))
     choice = Prompt.ask(
         "Select watchlist number",
         choices=[str(i) for i in range(1, len(watchlists) + 1)],
@@ -44,7 +45,7 @@ def main() -> None:
     """Launch the watchlist viewer CLI."""
     console = Console()
     manager = WatchlistManager()
-    client = AlpacaClient()
+    client = get_client()
 
     wl = _select_watchlist(manager, console)
     if wl is None:
@@ -65,8 +66,9 @@ def main() -> None:
     table.add_column("Symbol")
     table.add_column("Latest Price", justify="right")
 
+    prices = client.get_latest_prices(symbols)
     for sym in symbols:
-        price = client.get_latest_price(sym)
+        price = prices.get(sym)
         price_str = f"${price:.2f}" if price is not None else "N/A"
         table.add_row(sym, price_str)
 
@@ -0,0 +1,4 @@
+import os
+
+# Keep unit tests off the on-disk market data cache
+os.environ["ALPACA_CACHE_ENABLED"] = "false"
@@ -37,3 +37,53 @@ def test_position_fields(monkeypatch):
     pos = client.get_position('AAPL')
     assert pos['avg_entry_price'] == 95
     assert pos['current_price'] == 100
+
+
+def test_list_positions_makes_no_account_calls(monkeypatch):
+    class CountingREST(DummyREST):
+        account_calls = 0
+
+        def get_account(self):
+            CountingREST.account_calls += 1
+
+    monkeypatch.setattr(api_mod.tradeapi, 'REST', lambda *a, **k: CountingREST())
+    client = api_mod.AlpacaClient()
+    client.list_positions()
+    assert client.safe_float('bad', 1.5) == 1.5
+    assert CountingREST.account_calls == 0
+
+
+def test_list_positions_vectorizes_raw_payloads(monkeypatch):
+    class RawPos:
+        def __init__(self, raw):
+            self._raw = raw
+
+    class RawREST(DummyREST):
+        def list_positions(self):
+            return [
+                RawPos(
+                    {
+                        'symbol': 'AAPL',
+                        'qty': '3',
+                        'market_value': '300.5',
+                        'avg_entry_price': '90',
+                        'current_price': '100.1',
+                        'unrealized_plpc': '0.25',
+                    }
+                ),
+                RawPos({'symbol': 'MSFT', 'qty': '1', 'market_value': 'bad'}),
+            ]
+
+    monkeypatch.setattr(api_mod.tradeapi, 'REST', lambda *a, **k: RawREST())
+    positions = api_mod.AlpacaClient().list_positions()
+    assert positions[0] == {
+        'symbol': 'AAPL',
+        'qty': 3.0,
+        'market_value': 300.5,
+        'avg_entry_price': 90.0,
+        'current_price': 100.1,
+        'unrealized_pl_percent': 25.0,
+    }
+    assert positions[1]['market_value'] == 0.0
+    assert positions[1]['current_price'] == 0.0
+    assert type(positions[0]['qty']) is float
@@ -0,0 +1,137 @@
+import fundrunner.alpaca.api_client as api_mod
+
+
+class DummyREST:
+    def __init__(self, *args, **kwargs):
+        self._session = None
+
+
+def test_clients_share_pooled_session(monkeypatch):
+    monkeypatch.setattr(api_mod.tradeapi, "REST", lambda *a, **k: DummyREST())
+    first = api_mod.AlpacaClient()
+    second = api_mod.AlpacaClient()
+    assert first.api._session is second.api._session
+    assert first.api._session is api_mod.get_session()
+    adapter = first.api._session.get_adapter("https://api.alpaca.markets")
+    assert adapter._pool_maxsize == 32
+
+
+def test_get_latest_prices_batches_symbols(monkeypatch):
+    class PriceREST(DummyREST):
+        def get_latest_bar(self, symbol, feed=None):
+            if symbol == "BAD":
+                raise RuntimeError("no data")
+            return type("Bar", (), {"c": {"AAPL": 150.0, "MSFT": 300.0}[symbol]})()
+
+    monkeypatch.setattr(api_mod.tradeapi, "REST", lambda *a, **k: PriceREST())
+    client = api_mod.AlpacaClient()
+    prices = client.get_latest_prices(["AAPL", "MSFT", "AAPL", "BAD"])
+    assert prices == {"AAPL": 150.0, "MSFT": 300.0, "BAD": None}
+    assert client.get_latest_prices([]) == {}
+
+
+def test_submit_orders_bulk_preserves_order_and_errors(monkeypatch):
+    class OrderREST(DummyREST):
+        def submit_order(self, symbol, qty, side, type, time_in_force):
+            if symbol == "BAD":
+                raise RuntimeError("rejected")
+            return {"symbol": symbol, "side": side, "tif": time_in_force}
+
+    monkeypatch.setattr(api_mod.tradeapi, "REST", lambda *a, **k: OrderREST())
+    client = api_mod.AlpacaClient()
+    results = client.submit_orders_bulk(
+        [
+            {"symbol": "AAPL", "qty": 1, "side": "buy"},
+            {"symbol": "BAD", "qty": 1, "side": "sell"},
+            {"symbol": "MSFT", "qty": 2, "side": "sell", "time_in_force": "day"},
+        ]
+    )
+    assert results[0] == {"symbol": "AAPL", "side": "buy", "tif": "gtc"}
+    assert isinstance(results[1], api_mod.TradingError)
+    assert results[2]["tif"] == "day"
+    assert client.submit_orders_bulk([]) == []
+
+
+def test_submit_orders_bulk_bounds_orders_in_flight(monkeypatch):
+    import threading
+    import time
+
+    active = []
+    peak = []
+    lock = threading.Lock()
+
+    class SlowREST(DummyREST):
+        def submit_order(self, symbol, qty, side, type, time_in_force):
+            with lock:
+                active.append(symbol)
+                peak.append(len(active))
+            time.sleep(0.02)
+            with lock:
+                active.remove(symbol)
+            return symbol
+
+    monkeypatch.setattr(api_mod.tradeapi, "REST", lambda *a, **k: SlowREST())
+    client = api_mod.AlpacaClient()
+    orders = [{"symbol": f"S{i}", "qty": 1, "side": "buy"} for i in range(8)]
+    results = client.submit_orders_bulk(orders, max_concurrency=2)
+    assert results == [f"S{i}" for i in range(8)]
+    assert max(peak) <= 2
+
+
+def test_get_client_returns_shared_instance(monkeypatch):
+    monkeypatch.setattr(api_mod.tradeapi, "REST", lambda *a, **k: DummyREST())
+    monkeypatch.setattr(api_mod, "_default_client", None)
+    assert api_mod.get_client() is api_mod.get_client()
+
+
+def test_session_adapter_sets_socket_options():
+    adapter = api_mod.get_session().get_adapter("https://api.alpaca.markets")
+    options = adapter.poolmanager.connection_pool_kw["socket_options"]
+    assert (api_mod.socket.IPPROTO_TCP, api_mod.socket.TCP_NODELAY, 1) in options
+    assert (api_mod.socket.SOL_SOCKET, api_mod.socket.SO_KEEPALIVE, 1) in options
+
+
+def test_submit_order_forces_day_for_fractional_qty(monkeypatch):
+    calls = []
+
+    class OrderREST(DummyREST):
+        def submit_order(self, symbol, qty, side, type, time_in_force):
+            calls.append((qty, time_in_force))
+
+    monkeypatch.setattr(api_mod.tradeapi, "REST", lambda *a, **k: OrderREST())
+    client = api_mod.AlpacaClient()
+    for qty in (0.5, "1.50", 2, 3.0, "2.00"):
+        client.submit_order("AAPL", qty, "buy", "market", "gtc")
+    assert [tif for _, tif in calls] == ["day", "day", "gtc", "gtc", "gtc"]
+
+
+def test_session_decodes_json_with_fast_parser():
+    import requests
+
+    response = requests.Response()
+    response._content = b'{"bars": [{"c": 1.5}]}'
+    response.status_code = 200
+    for hook in api_mod.get_session().hooks["response"]:
+        hook(response)
+    assert response.json() == {"bars": [{"c": 1.5}]}
+
+
+def test_get_latest_prices_uses_single_batch_request(monkeypatch):
+    calls = []
+
+    class BatchREST(DummyREST):
+        def get_latest_bars(self, symbols, feed=None):
+            calls.append(list(symbols))
+            return {
+                "AAPL": type("Bar", (), {"c": 150.0})(),
+                "MSFT": type("Bar", (), {"c": 300.0})(),
+            }
+
+        def get_latest_bar(self, symbol, feed=None):
+            raise AssertionError("per-symbol fallback should not run")
+
+    monkeypatch.setattr(api_mod.tradeapi, "REST", lambda *a, **k: BatchREST())
+    client = api_mod.AlpacaClient()
+    prices = client.get_latest_prices(["AAPL", "MSFT", "GONE"])
+    assert prices == {"AAPL": 150.0, "MSFT": 300.0, "GONE": None}
+    assert calls == [["AAPL", "MSFT", "GONE"]]
@@ -30,3 +30,119 @@ def test_get_historical_bars_format(monkeypatch):
     assert args["end"].endswith("Z")
     assert "." not in args["start"] and "." not in args["end"]
     assert args["feed"] == api_mod.DATA_FEED
+
+
+def test_get_historical_bars_multi_splits_by_symbol(monkeypatch):
+    class MultiREST(DummyREST):
+        def get_bars(self, symbol, timeframe, start, end, feed=None):
+            self.called_with = {"symbol": symbol}
+            frame = pd.DataFrame(
+                {
+                    "symbol": ["AAPL", "MSFT", "AAPL"],
+                    "close": [1.0, 2.0, 3.0],
+                }
+            )
+            return type("Result", (), {"df": frame})()
+
+    dummy = MultiREST()
+    monkeypatch.setattr(api_mod.tradeapi, "REST", lambda *a, **k: dummy)
+    client = AlpacaClient()
+    frames = client.get_historical_bars_multi(["AAPL", "MSFT", "TSLA"], days=5)
+    assert dummy.called_with["symbol"] == ["AAPL", "MSFT", "TSLA"]
+    assert set(frames) == {"AAPL", "MSFT"}
+    assert frames["AAPL"]["close"].tolist() == [1.0, 3.0]
+    assert "symbol" not in frames["MSFT"].columns
+
+
+def test_get_historical_bars_uses_file_cache(monkeypatch, tmp_path):
+    from fundrunner.alpaca._cache import FileCache
+
+    dummy = DummyREST()
+    calls = []
+    original = dummy.get_bars
+
+    def counting_get_bars(*args, **kwargs):
+        calls.append(args)
+        return original(*args, **kwargs)
+
+    dummy.get_bars = counting_get_bars
+    monkeypatch.setattr(api_mod.tradeapi, "REST", lambda *a, **k: dummy)
+    client = AlpacaClient(cache=FileCache(tmp_path))
+    first = client.get_historical_bars("AAPL", days=1)
+    second = client.get_historical_bars("AAPL", days=1)
+    assert len(calls) == 1
+    pd.testing.assert_frame_equal(first, second)
+    assert list((tmp_path / "bars").glob("*.pkl"))
+
+
+def test_daily_window_aligned_to_midnight_and_intraday_to_now():
+    start, end = api_mod._bar_window(30, TimeFrame.Day)
+    assert end.endswith("T00:00:00Z")
+    assert api_mod._bar_window(30, TimeFrame.Day) == (start, end)
+
+    start, end = api_mod._bar_window(1, TimeFrame.Minute)
+    assert end.endswith("Z") and "." not in end
+    assert start < end
+
+
+def test_get_historical_close_volume_reads_raw_bars(monkeypatch):
+    class RawREST(DummyREST):
+        def get_bars(self, symbol, timeframe, start, end, feed=None):
+            return type(
+                "Result", (), {"_raw": [{"c": 10.0, "v": 100}, {"c": 11.5, "v": 200}]}
+            )()
+
+    monkeypatch.setattr(api_mod.tradeapi, "REST", lambda *a, **k: RawREST())
+    closes, volumes = AlpacaClient().get_historical_close_volume("AAPL", days=2)
+    assert closes.tolist() == [10.0, 11.5]
+    assert volumes.tolist() == [100.0, 200.0]
+
+
+def test_get_historical_bars_multi_reuses_cached_symbols(monkeypatch, tmp_path):
+    from fundrunner.alpaca._cache import FileCache
+
+    requested = []
+
+    class MultiREST(DummyREST):
+        def get_bars(self, symbol, timeframe, start, end, feed=None):
+            requested.append(list(symbol))
+            frame = pd.DataFrame(
+                {"symbol": list(symbol), "close": [float(len(s)) for s in symbol]}
+            )
+            return type("Result", (), {"df": frame})()
+
+    monkeypatch.setattr(api_mod.tradeapi, "REST", lambda *a, **k: MultiREST())
+    client = AlpacaClient(cache=FileCache(tmp_path))
+    first = client.get_historical_bars_multi(["AAPL", "MSFT"], days=5)
+    second = client.get_historical_bars_multi(["AAPL", "MSFT", "GOOGL"], days=5)
+    assert requested == [["AAPL", "MSFT"], ["GOOGL"]]
+    pd.testing.assert_frame_equal(first["AAPL"], second["AAPL"])
+    assert list(second) == ["AAPL", "MSFT", "GOOGL"]
+    # Per-symbol lookups share the same cache entries.
+    pd.testing.assert_frame_equal(
+        client.get_historical_bars("MSFT", days=5), first["MSFT"]
+    )
+    assert len(requested) == 2
+
+
+def test_intraday_cache_key_changes_each_bar(monkeypatch, tmp_path):
+    from datetime import datetime
+
+    from alpaca_trade_api.rest import TimeFrameUnit
+
+    from fundrunner.alpaca._cache import FileCache
+
+    monkeypatch.setattr(api_mod.tradeapi, "REST", lambda *a, **k: DummyREST())
+    client = AlpacaClient(cache=FileCache(tmp_path))
+
+    def key(timeframe, hh, mm, ss):
+        return client._bars_cache_key(
+            "AAPL", 1, timeframe, datetime(2024, 1, 2, hh, mm, ss)
+        )
+
+    assert key(TimeFrame.Minute, 15, 30, 5) == key(TimeFrame.Minute, 15, 30, 59)
+    assert key(TimeFrame.Minute, 15, 30, 59) != key(TimeFrame.Minute, 15, 31, 0)
+    fifteen = TimeFrame(15, TimeFrameUnit.Minute)
+    assert key(fifteen, 15, 30, 0) == key(fifteen, 15, 44, 59)
+    assert key(fifteen, 15, 44, 59) != key(fifteen, 15, 45, 0)
+    assert key(TimeFrame.Day, 0, 0, 1) == key(TimeFrame.Day, 23, 59, 59)
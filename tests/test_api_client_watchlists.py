@@ -0,0 +1,153 @@
+import types
+
+import pytest
+
+import fundrunner.alpaca.api_client as api_mod
+
+
+class DummyREST:
+    def __init__(self, *args, **kwargs):
+        self.list_calls = 0
+        self.by_name_calls = 0
+        self.added = []
+
+    def get_watchlists(self):
+        self.list_calls += 1
+        return [types.SimpleNamespace(name="Tech", id="wl-1")]
+
+    def get_watchlist_by_name(self, name):
+        self.by_name_calls += 1
+        if name != "Tech":
+            raise api_mod.tradeapi.rest.APIError({"message": "watchlist not found"})
+        return types.SimpleNamespace(name="Tech", id="wl-1")
+
+    def add_to_watchlist(self, watchlist_id, symbol):
+        self.added.append((watchlist_id, symbol))
+        return watchlist_id
+
+    def create_watchlist(self, name, symbols):
+        return types.SimpleNamespace(name=name, id="wl-2")
+
+    def delete_watchlist(self, watchlist_id):
+        return None
+
+
+def test_add_to_watchlist_resolves_name_once(monkeypatch):
+    dummy = DummyREST()
+    monkeypatch.setattr(api_mod.tradeapi, "REST", lambda *a, **k: dummy)
+    client = api_mod.AlpacaClient()
+    for sym in ("AAPL", "MSFT", "GOOGL"):
+        client.add_to_watchlist("tech", sym)
+    assert dummy.list_calls == 1
+    assert dummy.added[-1] == ("wl-1", "GOOGL")
+
+    client.create_watchlist("Energy", ["XOM"])
+    client.add_to_watchlist("Tech", "NVDA")
+    client.add_to_watchlist("energy", "CVX")
+    assert dummy.list_calls == 1
+    assert dummy.added[-1] == ("wl-2", "CVX")
+
+    client.delete_watchlist("wl-2")
+    with pytest.raises(ValueError):
+        client.add_to_watchlist("Energy", "OXY")
+    assert dummy.list_calls == 2
+
+    with pytest.raises(ValueError):
+        client.add_to_watchlist("missing", "AAPL")
+
+
+def test_add_to_watchlist_uses_by_name_lookup(monkeypatch):
+    dummy = DummyREST()
+    monkeypatch.setattr(api_mod.tradeapi, "REST", lambda *a, **k: dummy)
+    client = api_mod.AlpacaClient()
+    client.add_to_watchlist("Tech", "AAPL")
+    client.add_to_watchlist("tech", "MSFT")
+    assert dummy.by_name_calls == 1
+    assert dummy.list_calls == 0
+    assert dummy.added == [("wl-1", "AAPL"), ("wl-1", "MSFT")]
+
+
+def test_reads_cached_on_disk_until_a_write(monkeypatch, tmp_path):
+    from fundrunner.alpaca._cache import FileCache
+
+    class CountingREST(DummyREST):
+        def __init__(self):
+            super().__init__()
+            self.account_calls = 0
+            self.position_calls = 0
+            self.order_calls = 0
+
+        def get_watchlists(self):
+            self.list_calls += 1
+            return [api_mod.tradeapi.entity.Watchlist({"name": "Tech", "id": "wl-1"})]
+
+        def get_account(self):
+            self.account_calls += 1
+            return types.SimpleNamespace(
+                cash="10", buying_power="20", equity="30", portfolio_value="30"
+            )
+
+        def list_positions(self):
+            self.position_calls += 1
+            return []
+
+        def list_orders(self, status):
+            self.order_calls += 1
+            return [api_mod.tradeapi.entity.Order({"id": "o-1", "status": status})]
+
+        def submit_order(self, **kwargs):
+            return kwargs
+
+    dummy = CountingREST()
+    monkeypatch.setattr(api_mod.tradeapi, "REST", lambda *a, **k: dummy)
+    client = api_mod.AlpacaClient(cache=FileCache(tmp_path))
+
+    assert client.get_account()["cash"] == 10.0
+    client.get_account()
+    client.list_positions()
+    client.list_positions()
+    assert client.list_orders()[0].id == "o-1"
+    client.list_orders()
+    assert (dummy.account_calls, dummy.position_calls, dummy.order_calls) == (1, 1, 1)
+
+    client.submit_order("AAPL", 1, "buy", "market", "gtc")
+    client.get_account()
+    client.list_positions()
+    client.list_orders()
+    assert (dummy.account_calls, dummy.position_calls, dummy.order_calls) == (2, 2, 2)
+    # Balances stay in memory; they are never written to the shared disk cache
+    assert not (tmp_path / "account").exists()
+
+    first = client.list_watchlists()
+    assert first[0].name == "Tech"
+    client.list_watchlists()
+    assert dummy.list_calls == 1
+    client.add_to_watchlist("Tech", "AAPL")
+    client.list_watchlists()
+    assert dummy.list_calls == 2
+
+
+def test_created_watchlist_resolves_without_lookup(monkeypatch):
+    dummy = DummyREST()
+    monkeypatch.setattr(api_mod.tradeapi, "REST", lambda *a, **k: dummy)
+    client = api_mod.AlpacaClient()
+    client.create_watchlist("Energy", ["XOM"])
+    client.add_to_watchlist("energy", "CVX")
+    assert (dummy.by_name_calls, dummy.list_calls) == (0, 0)
+    assert dummy.added == [("wl-2", "CVX")]
+
+
+def test_by_name_http_error_falls_back_to_list(monkeypatch):
+    class HTMLErrorREST(DummyREST):
+        def get_watchlist_by_name(self, name):
+            self.by_name_calls += 1
+            raise api_mod.requests.HTTPError("404 Client Error: Not Found")
+
+    dummy = HTMLErrorREST()
+    monkeypatch.setattr(api_mod.tradeapi, "REST", lambda *a, **k: dummy)
+    client = api_mod.AlpacaClient()
+    client.add_to_watchlist("tech", "AAPL")
+    assert dummy.list_calls == 1
+    assert dummy.added == [("wl-1", "AAPL")]
+    with pytest.raises(ValueError):
+        client.add_to_watchlist("missing", "AAPL")
@@ -19,7 +19,7 @@ class DummyClient:
 
 
 def test_run_backtest(monkeypatch=None):
-    backtester.AlpacaClient = lambda: DummyClient()
+    backtester.get_client = lambda: DummyClient()
     result = backtester.run_backtest(
         "AAPL", "2023-01-01", "2023-01-03", initial_capital=1000, allocation_limit=0.1
     )
@@ -29,7 +29,7 @@ def test_run_backtest(monkeypatch=None):
 
 
 def test_backtest_portfolio(monkeypatch=None):
-    backtester.AlpacaClient = lambda: DummyClient()
+    backtester.get_client = lambda: DummyClient()
     result = backtester.backtest_portfolio(
         ["AAPL", "MSFT"],
         {"AAPL": 0.5, "MSFT": 0.5},
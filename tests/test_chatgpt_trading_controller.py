@@ -1,4 +1,5 @@
 import json
+import pytest
 from fundrunner.bots.chatgpt_trading_controller import run_chatgpt_controller
 
 class DummyPM:
@@ -18,6 +19,16 @@ class DummyTM:
     def sell(self, symbol, qty, order_type='market', time_in_force='gtc'):
         self.actions.append(("sell", symbol, qty))
 
+    def submit_orders(self, orders):
+        results = []
+        for order in orders:
+            if order["symbol"] == "FAIL":
+                results.append(RuntimeError("rejected"))
+                continue
+            side = self.buy if order["side"] == "buy" else self.sell
+            results.append(side(order["symbol"], order["qty"]))
+        return results
+
 def test_gpt_response_triggers_trades(monkeypatch):
     response = json.dumps({"actions": [{"action": "buy", "symbol": "MSFT", "quantity": 2}], "request": "done"})
     monkeypatch.setattr('fundrunner.bots.chatgpt_trading_controller.ask_gpt', lambda prompt: response)
@@ -27,3 +38,104 @@ def test_gpt_response_triggers_trades(monkeypatch):
     run_chatgpt_controller(max_cycles=1)
     assert dummy.actions == [("buy", "MSFT", 2)]
 
+
+def test_gpt_actions_submitted_as_one_batch(monkeypatch):
+    response = json.dumps(
+        {
+            "actions": [
+                {"action": "sell", "symbol": "AAPL", "qty": 1},
+                {"action": "hold", "symbol": "TSLA", "qty": 1},
+                {"action": "buy", "symbol": "FAIL", "qty": 1},
+                {"action": "buy", "symbol": "MSFT", "quantity": 3},
+                {"action": "buy", "symbol": "NVDA"},
+            ],
+            "request": "done",
+        }
+    )
+    monkeypatch.setattr(
+        'fundrunner.bots.chatgpt_trading_controller.ask_gpt', lambda prompt: response
+    )
+    monkeypatch.setattr(
+        'fundrunner.bots.chatgpt_trading_controller.PortfolioManager', lambda: DummyPM()
+    )
+    dummy = DummyTM()
+    batches = []
+    submit = dummy.submit_orders
+
+    def record(orders):
+        batches.append(orders)
+        return submit(orders)
+
+    dummy.submit_orders = record
+    monkeypatch.setattr('fundrunner.bots.chatgpt_trading_controller.TradeManager', lambda: dummy)
+    run_chatgpt_controller(max_cycles=1)
+    assert len(batches) == 1
+    assert [o["symbol"] for o in batches[0]] == ["AAPL", "FAIL", "MSFT"]
+    assert dummy.actions == [("sell", "AAPL", 1), ("buy", "MSFT", 3)]
+
+
+def test_compute_risk_metrics_splits_winners_and_losers():
+    from fundrunner.bots.chatgpt_trading_controller import compute_risk_metrics
+
+    positions = [
+        {"market_value": 100, "unrealized_pl_percent": 10},
+        {"market_value": 200, "unrealized_pl_percent": -5},
+        {"market_value": 50, "unrealized_pl_percent": 20},
+        {"market_value": 80},
+    ]
+    metrics = compute_risk_metrics(positions)
+    # Profits: 10, -10, 10, 0 -> win_prob 0.75, avg_win 20/3, avg_loss 10
+    assert metrics["expected_value"] == pytest.approx(0.75 * 20 / 3 - 0.25 * 10)
+    assert metrics["kelly_fraction"] == pytest.approx(0.75 - 0.25 / (2 / 3))
+    assert compute_risk_metrics([]) == {"expected_value": 0.0, "kelly_fraction": 0.0}
+
+
+def test_account_and_positions_fetched_concurrently(monkeypatch):
+    import threading
+
+    barrier = threading.Barrier(2, timeout=2)
+
+    class ConcurrentPM(DummyPM):
+        def view_account(self):
+            barrier.wait()
+            return super().view_account()
+
+        def view_positions(self):
+            barrier.wait()
+            return super().view_positions()
+
+    prompts = []
+
+    def fake_gpt(prompt):
+        prompts.append(prompt)
+        return json.dumps({"actions": [], "request": "done"})
+
+    monkeypatch.setattr('fundrunner.bots.chatgpt_trading_controller.ask_gpt', fake_gpt)
+    monkeypatch.setattr(
+        'fundrunner.bots.chatgpt_trading_controller.PortfolioManager', lambda: ConcurrentPM()
+    )
+    monkeypatch.setattr(
+        'fundrunner.bots.chatgpt_trading_controller.TradeManager', lambda: DummyTM()
+    )
+    run_chatgpt_controller(max_cycles=2)
+    assert len(prompts) == 1
+    assert 'Account: {"cash":1000}' in prompts[0]
+
+
+def test_risk_metrics_loop_and_numpy_paths_agree():
+    import random
+
+    from fundrunner.bots import chatgpt_trading_controller as ctl
+
+    rng = random.Random(7)
+    positions = [
+        {
+            "market_value": rng.uniform(0, 1000),
+            "unrealized_pl_percent": rng.uniform(-20, 20),
+        }
+        for _ in range(200)
+    ]
+    for n in (1, 5, 200):
+        assert ctl._win_loss_stats(positions[:n]) == pytest.approx(
+            ctl._win_loss_stats_np(positions[:n])
+        )
@@ -22,3 +22,220 @@ def test_run_menu_triggers_watchlist_view():
         except SystemExit:
             pass
         manage_mock.assert_called_once()
+
+
+def test_watch_daemon_status_reuses_session():
+    cli = CLI()
+
+    class Response:
+        def json(self):
+            return {"running": True}
+
+    with patch("fundrunner.main.DAEMON_SESSION") as session, patch(
+        "fundrunner.main.time.sleep"
+    ) as sleep, patch.object(cli, "console"):
+        session.request.return_value = Response()
+        cli.watch_daemon_status(interval=2, iterations=3)
+    assert session.request.call_count == 3
+    assert [c.args for c in sleep.call_args_list] == [(2,), (2,)]
+
+
+def test_watch_flag_polls_daemon_instead_of_menu():
+    from fundrunner.main import main
+
+    with patch("fundrunner.main.setup_global_error_handler"), patch.object(
+        CLI, "watch_daemon_status"
+    ) as watch, patch.object(CLI, "run") as run:
+        main(["--watch", "2.5"])
+    watch.assert_called_once_with(interval=2.5)
+    run.assert_not_called()
+
+
+def test_daemon_commands_fan_out_to_all_urls():
+    import threading
+
+    cli = CLI()
+    barrier = threading.Barrier(2, timeout=2)
+
+    class Response:
+        def __init__(self, url):
+            self.url = url
+
+        def json(self):
+            return {"url": self.url}
+
+    def fake_request(method, url):
+        barrier.wait()
+        if url.startswith("http://b"):
+            raise ConnectionError("down")
+        return Response(url)
+
+    with patch("fundrunner.main.DAEMON_SESSION") as session, patch.object(
+        cli, "console"
+    ) as console:
+        session.request.side_effect = fake_request
+        cli.start_daemon(["http://a:1", "http://b:2"])
+    lines = [c.args[0] for c in console.print.call_args_list]
+    assert lines[0] == "http://a:1: {'url': 'http://a:1/start'}"
+    assert "http://b:2: Error starting daemon: down" in lines[1]
+
+
+def test_print_menu_reuses_prebuilt_panel():
+    cli = CLI()
+    with patch.object(cli, "save_portfolio_snapshot"), patch.object(
+        cli, "console"
+    ) as console:
+        cli.print_menu()
+        cli.print_menu()
+    printed = [c.args[0] for c in console.print.call_args_list]
+    assert len(printed) == 2 and printed[0] is printed[1]
+    assert printed[0].renderable.row_count == len(CLI._MENU_OPTIONS)
+
+
+def test_parse_symbols_tokenizes_pasted_lists():
+    from fundrunner.main import _parse_symbols
+
+    assert _parse_symbols("aapl, msft,,brk.b\nGOOGL  ; $TSLA") == [
+        "AAPL",
+        "MSFT",
+        "BRK.B",
+        "GOOGL",
+        "TSLA",
+    ]
+    assert _parse_symbols("  ") == []
+
+
+def test_symbol_completion_learns_entered_symbols():
+    cli = CLI()
+    with patch("fundrunner.main.Prompt.ask", return_value="nvda, nflx"):
+        assert cli._ask_symbols("Symbols") == ["NVDA", "NFLX"]
+
+    assert cli._complete_symbol("n", 0) == "NFLX"
+    assert cli._complete_symbol("n", 1) == "NVDA"
+    assert cli._complete_symbol("n", 2) is None
+
+
+def test_view_open_orders_prints_one_table():
+    import types
+
+    cli = CLI()
+    order = types.SimpleNamespace(
+        id="o-1", symbol="AAPL", side="buy", qty="1", status="new"
+    )
+    cli.trade_manager = types.SimpleNamespace(list_open_orders=lambda: [order, order])
+    printed = []
+    cli.console = types.SimpleNamespace(print=printed.append)
+    cli.view_open_orders()
+    assert len(printed) == 1
+    table = printed[0]
+    assert [c.header for c in table.columns] == [
+        "ID",
+        "Symbol",
+        "Side",
+        "Qty",
+        "Status",
+    ]
+    assert table.row_count == 2
+
+
+def test_get_trading_advice_loads_advisor_in_background(monkeypatch):
+    import contextlib
+    import sys
+    import types
+
+    fake = types.ModuleType("fundrunner.bots.chatgpt_advisor")
+    fake.get_account_overview = lambda prompt: f"advice for {prompt}"
+    monkeypatch.setitem(sys.modules, "fundrunner.bots.chatgpt_advisor", fake)
+    cli = CLI()
+    printed = []
+    cli.console = types.SimpleNamespace(
+        print=printed.append, status=lambda *a, **k: contextlib.nullcontext()
+    )
+    with patch("fundrunner.main.Prompt.ask", return_value="buy?"):
+        cli.get_trading_advice()
+    assert printed[0].renderable == "advice for buy?"
+
+
+def test_save_portfolio_snapshot_throttles_and_skips_unchanged(monkeypatch, tmp_path):
+    import types
+
+    monkeypatch.chdir(tmp_path)
+    cli = CLI()
+    account = {"cash": 100.0}
+    cli.portfolio_manager = types.SimpleNamespace(
+        view_account=lambda: account, view_positions=lambda: []
+    )
+    snapshot = tmp_path / "portfolio_snapshot.json"
+
+    cli.save_portfolio_snapshot()
+    assert '"cash":100.0' in snapshot.read_text()
+    account["cash"] = 75.0
+    cli.save_portfolio_snapshot()
+    assert '"cash":100.0' in snapshot.read_text()  # within the interval
+
+    cli._SNAPSHOT_INTERVAL = 0
+    account["cash"] = 100.0
+    snapshot.write_text("stale")
+    cli.save_portfolio_snapshot()
+    assert snapshot.read_text() == "stale"  # unchanged data is not rewritten
+
+    account["cash"] = 50.0
+    cli.save_portfolio_snapshot()
+    assert '"cash":50.0' in snapshot.read_text()
+    assert [p.name for p in tmp_path.iterdir()] == ["portfolio_snapshot.json"]
+
+
+def test_run_async_reuses_one_event_loop():
+    import asyncio
+
+    async def current_loop():
+        return asyncio.get_running_loop()
+
+    cli = CLI()
+    first = cli._run_async(current_loop())
+    assert cli._run_async(current_loop()) is first
+    cli._close_event_loop()
+    assert first.is_closed()
+
+
+def test_run_async_drains_leftover_tasks():
+    import asyncio
+
+    cancelled = []
+
+    async def monitor():
+        try:
+            await asyncio.sleep(3600)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    async def action():
+        asyncio.get_running_loop().create_task(monitor())
+        await asyncio.sleep(0)
+        return "done"
+
+    cli = CLI()
+    assert cli._run_async(action()) == "done"
+    assert cancelled == [True]
+    assert not asyncio.all_tasks(cli._event_loop)
+    cli._close_event_loop()
+
+
+def test_position_rows_formats_pl_and_missing_values():
+    from fundrunner.main import _position_rows
+
+    rows = _position_rows(
+        [
+            {"symbol": "AAPL", "qty": 2, "avg_entry_price": 100.0, "current_price": 110.0},
+            {"symbol": "FREE", "qty": 1, "avg_entry_price": 0, "current_price": 5},
+            {"symbol": "MSFT", "qty": "2", "avg_entry_price": None, "current_price": 4},
+            {"symbol": "TSLA", "qty": 3, "current_price": None},
+        ]
+    )
+    assert rows == [
+        ("AAPL", "2", "$220.00", "100.00", "110.00", "$20.00", "10.00%"),
+        ("FREE", "1", "$5.00", "0.00", "5.00", "$5.00", "0.00%"),
+        ("MSFT", "2", "$8.00", "N/A", "N/A", "N/A", "N/A"),
+        ("TSLA", "3", "N/A", "N/A", "N/A", "N/A", "N/A"),
+    ]
@@ -13,3 +13,43 @@ def test_dashboard_tables_update():
     dash.refresh()
     dash.stop()
     assert len(dash.summary_table.rows) == 1
+
+
+def test_summary_rows_updated_in_place():
+    dash = Dashboard(Console())
+    dash.reset_summary(["AAPL", "MSFT"])
+    dash.update_summary_row("MSFT", "300", "0.70", "0.0100", "Executed")
+    dash.update_summary_row("TSLA", "200", "0.40", "0.0000", "No Trade")
+    table = dash.summary_table
+    assert table.row_count == 3
+    assert [c._cells[1] for c in table.columns] == [
+        "MSFT",
+        "300",
+        "0.70",
+        "0.0100",
+        "Executed",
+    ]
+    assert table.columns[4]._cells[0] == "Pending"
+
+    dash.reset_summary(["GOOGL"])
+    assert table.row_count == 1
+    assert table.columns[0]._cells == ["GOOGL"]
+
+
+def test_refresh_skips_live_update_when_clean():
+    dash = Dashboard(Console())
+    assert dash.live.auto_refresh is False
+    calls = []
+    dash._live.refresh = lambda: calls.append(dash._live.renderable)
+
+    dash.refresh()
+    dash.refresh()
+    assert len(calls) == 1
+
+    dash.set_rows(dash.portfolio_table, [("AAPL", "1", "10", "11", "1")])
+    dash.set_rows(dash.portfolio_table, [("MSFT", "2", "20", "21", "2")])
+    dash.refresh()
+    assert len(calls) == 2
+    assert calls[0] is calls[1]
+    assert dash.portfolio_table.row_count == 1
+    assert dash.portfolio_table.columns[0]._cells == ["MSFT"]
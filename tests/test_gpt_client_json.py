@@ -239,6 +239,22 @@ class TestGPTClientJSON(unittest.TestCase):
             # Sleep called for: rate limiting (3x) + retries (2x) = 5x
             self.assertEqual(mock_sleep.call_count, 5)
 
+    @patch('fundrunner.utils.gpt_client.time.sleep')
+    def test_token_count_failure_keeps_response(self, mock_sleep):
+        """Test a tokenizer failure neither drops the reply nor retries."""
+        with patch('fundrunner.utils.gpt_client.openai_client') as mock_client, \
+                patch('fundrunner.utils.gpt_client.count_tokens',
+                      side_effect=RuntimeError("tokenizer unavailable")):
+            mock_client.chat.completions.create.return_value = Mock(
+                choices=[Mock(message=Mock(content="Success"))]
+            )
+
+            result = ask_gpt_enhanced("Test prompt")
+
+            self.assertEqual(result, "Success")
+            self.assertEqual(mock_client.chat.completions.create.call_count, 1)
+            self.assertEqual(get_cost_summary()["total_tokens"], len("Test prompt") // 4)
+
     def test_backwards_compatibility(self):
         """Test that legacy ask_gpt function still works."""
         from fundrunner.utils.gpt_client import ask_gpt
@@ -0,0 +1,37 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from fundrunner.alpaca._kernels import _trade_stats_loop, _trade_stats_numpy, trade_stats
+
+
+def _padded(rows):
+    width = max(len(r) for r in rows)
+    out = np.full((len(rows), width), np.nan)
+    for i, r in enumerate(rows):
+        out[i, width - len(r):] = r
+    return out
+
+
+def test_trade_stats_loop_matches_numpy_and_pandas():
+    rows = [[100.0, 102.0, 99.0, 101.0, 104.0], [50.0, 50.5], [10.0, 10.0, 10.0]]
+    closes = _padded(rows)
+    loop = _trade_stats_loop(closes)
+    vectorized = _trade_stats_numpy(closes)
+    np.testing.assert_allclose(loop, vectorized, equal_nan=True)
+    np.testing.assert_allclose(trade_stats(closes), vectorized, equal_nan=True)
+
+    returns = pd.Series(rows[0]).pct_change().dropna()
+    assert loop[0, 0] == pytest.approx(returns.mean())
+    assert loop[0, 1] == pytest.approx(returns.std())
+    # A single return has no volatility; flat prices have zero volatility.
+    assert np.isnan(loop[1, 1]) and loop[1, 2] == 0.5
+    assert loop[2, 1] == 0.0 and loop[2, 2] == 0.5
+
+
+def test_trade_stats_float32_close_to_float64():
+    rng = np.random.default_rng(0)
+    closes = 100 * np.cumprod(1 + rng.normal(0, 0.02, size=(5, 30)), axis=1)
+    full = trade_stats(closes)
+    single = trade_stats(closes.astype(np.float32))
+    np.testing.assert_allclose(single[:, 2], full[:, 2], atol=1e-4)
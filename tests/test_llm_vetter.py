@@ -0,0 +1,29 @@
+import fundrunner.alpaca.llm_vetter as vetter_mod
+
+
+def test_vet_trade_reads_leading_verdict(monkeypatch):
+    responses = iter(["APPROVED\nLooks fine", "**Rejected** - yes, too risky"])
+    monkeypatch.setattr(vetter_mod, "ask_gpt", lambda prompt: next(responses))
+    vetter = vetter_mod.LLMVetter()
+    assert vetter.vet_trade_logic({"symbol": "AAPL", "qty": 1}) is True
+    assert vetter.vet_trade_logic({"symbol": "MSFT", "qty": 1}) is False
+
+
+def test_vet_trade_reuses_cached_verdict(monkeypatch):
+    prompts = []
+
+    def fake_ask(prompt):
+        prompts.append(prompt)
+        return "APPROVED"
+
+    monkeypatch.setattr(vetter_mod, "ask_gpt", fake_ask)
+    vetter = vetter_mod.LLMVetter()
+    details = {"symbol": "AAPL", "qty": 1}
+    assert vetter.vet_trade_logic(details) is True
+    assert vetter.vet_trade_logic(dict(details)) is True
+    assert len(prompts) == 1
+    assert "APPROVED or REJECTED" in prompts[0]
+
+    vetter.cache_ttl = -1
+    assert vetter.vet_trade_logic(details) is True
+    assert len(prompts) == 2
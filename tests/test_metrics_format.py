@@ -45,3 +45,47 @@ def test_format_primary_metric_spread():
         "Spread metric formatting passed with output: %s",
         formatted.get("risk_reward_ratio_formatted"),
     )
+
+
+def test_alpaca_ticker_fetches_price_once(monkeypatch):
+    from fundrunner.options import options_integration
+
+    calls = []
+
+    def fake_price(symbol):
+        calls.append(symbol)
+        return 123.0
+
+    monkeypatch.setattr(options_integration, "get_latest_stock_price", fake_price)
+    ticker = options_integration.AlpacaTicker("AAPL")
+    assert ticker.info.get("regularMarketPrice") == 123.0
+    assert ticker.info.get("regularMarketPrice") == 123.0
+    assert ticker.last_price == 123.0
+    assert calls == ["AAPL"]
+
+
+def test_analyze_sentiment_uses_20_bar_average(monkeypatch):
+    from types import SimpleNamespace
+
+    from fundrunner.options import options_integration
+
+    def fake_get(closes):
+        payload = {"bars": [{"c": c} for c in closes]}
+        return lambda *args, **kwargs: SimpleNamespace(
+            status_code=200, json=lambda: payload
+        )
+
+    rising = [100.0 + i for i in range(20)]
+    monkeypatch.setattr(options_integration.requests, "get", fake_get(rising))
+    assert options_integration.analyze_sentiment("AAPL") == "bullish"
+
+    falling = rising[::-1]
+    monkeypatch.setattr(options_integration.requests, "get", fake_get(falling))
+    assert options_integration.analyze_sentiment("AAPL") == "bearish"
+
+    # Fewer than 20 bars leaves the moving average undefined, as with pandas.
+    monkeypatch.setattr(options_integration.requests, "get", fake_get(rising[:5]))
+    assert options_integration.analyze_sentiment("AAPL") == "bearish"
+
+    monkeypatch.setattr(options_integration.requests, "get", fake_get([]))
+    assert options_integration.analyze_sentiment("AAPL") == "neutral"
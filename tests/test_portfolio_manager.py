@@ -0,0 +1,73 @@
+from types import SimpleNamespace
+
+from fundrunner.alpaca.portfolio_manager import PortfolioManager
+
+
+def test_view_positions_normalizes_to_dicts(monkeypatch):
+    pm = PortfolioManager()
+    entity = SimpleNamespace(
+        symbol="MSFT",
+        qty=2.0,
+        market_value=600.0,
+        avg_entry_price=290.0,
+        current_price=300.0,
+        unrealized_pl_percent=3.4,
+    )
+    already = {"symbol": "AAPL", "qty": 1.0, "unrealized_pl_percent": -1.0}
+    monkeypatch.setattr(pm.client, "list_positions", lambda: [already, entity])
+
+    positions = pm.view_positions()
+    assert positions[0] is already
+    assert positions[1] == {
+        "symbol": "MSFT",
+        "qty": 2.0,
+        "market_value": 600.0,
+        "avg_entry_price": 290.0,
+        "current_price": 300.0,
+        "unrealized_pl_percent": 3.4,
+    }
+
+
+def test_view_account_fresh_after_order(monkeypatch, tmp_path):
+    from fundrunner.alpaca import api_client as api_mod
+    from fundrunner.alpaca._cache import FileCache
+
+    class REST:
+        def __init__(self):
+            self.account_calls = 0
+
+        def get_account(self):
+            self.account_calls += 1
+            return SimpleNamespace(
+                cash="1",
+                buying_power=str(100 * self.account_calls),
+                equity="1",
+                portfolio_value="1",
+            )
+
+        def submit_order(self, **kwargs):
+            return kwargs
+
+    rest = REST()
+    monkeypatch.setattr(api_mod.tradeapi, "REST", lambda *a, **k: rest)
+    pm = PortfolioManager(api_mod.AlpacaClient(cache=FileCache(tmp_path)))
+
+    assert pm.view_account()["buying_power"] == 100.0
+    assert pm.view_account()["buying_power"] == 100.0
+    assert rest.account_calls == 1
+
+    # Orders placed outside the portfolio manager still refresh its view
+    pm.trader.sell("AAPL", 1)
+    assert pm.view_account()["buying_power"] == 200.0
+    assert not (tmp_path / "account").exists()
+
+
+def test_managers_share_an_injected_client():
+    from fundrunner.alpaca.trade_manager import TradeManager
+    from fundrunner.alpaca.watchlist_manager import WatchlistManager
+
+    client = SimpleNamespace(list_watchlists=lambda: ["wl"])
+    pm = PortfolioManager(client)
+    assert pm.client is client and pm.trader.client is client
+    assert TradeManager(client).client is client
+    assert WatchlistManager(client).list_watchlists() == ["wl"]
@@ -0,0 +1,92 @@
+import pandas as pd
+import pytest
+
+from fundrunner.alpaca.risk_manager import RiskManager
+
+
+class DummyClient:
+    def __init__(self, frame):
+        self.frame = frame
+
+    def get_historical_close_volume(self, symbol, days=30):
+        if self.frame is None:
+            return None
+        return self.frame["close"].to_numpy(), self.frame["volume"].to_numpy()
+
+
+def test_adjust_parameters_matches_pandas_volatility():
+    frame = pd.DataFrame(
+        {"close": [100.0, 102.0, 99.0, 101.0, 104.0], "volume": [2e6] * 5}
+    )
+    rm = RiskManager(client=DummyClient(frame))
+    allocation, threshold = rm.adjust_parameters("AAPL")
+    volatility = frame["close"].pct_change().std()
+    expected_alloc = max(
+        rm.base_allocation_limit * min(0.02 / volatility, 1), rm.minimum_allocation
+    )
+    assert allocation == pytest.approx(expected_alloc)
+    assert threshold == pytest.approx(min(rm.base_risk_threshold + volatility * 10, 0.9))
+    assert "Return" not in frame.columns
+
+
+def test_adjust_parameters_without_data_returns_base():
+    rm = RiskManager(client=DummyClient(None))
+    assert rm.adjust_parameters("AAPL") == (
+        rm.base_allocation_limit,
+        rm.base_risk_threshold,
+    )
+
+
+def test_adjust_parameters_many_matches_single_symbol():
+    frames = {
+        "AAPL": pd.DataFrame(
+            {"close": [100.0, 102.0, 99.0, 101.0, 104.0], "volume": [2e6] * 5}
+        ),
+        "MSFT": pd.DataFrame({"close": [50.0, 50.5, 51.0], "volume": [5e5] * 3}),
+    }
+
+    class MultiClient:
+        def get_historical_bars_multi(self, symbols, days=30):
+            return frames
+
+    rm = RiskManager(client=MultiClient())
+    results = rm.adjust_parameters_many(["AAPL", "MSFT", "TSLA"])
+    for symbol, frame in frames.items():
+        expected = RiskManager(client=DummyClient(frame)).adjust_parameters(symbol)
+        assert results[symbol] == pytest.approx(expected)
+    assert results["TSLA"] == (rm.base_allocation_limit, rm.base_risk_threshold)
+
+
+def test_adjust_parameters_cached_per_day():
+    frame = pd.DataFrame(
+        {"close": [100.0, 102.0, 99.0, 101.0, 104.0], "volume": [2e6] * 5}
+    )
+
+    class CountingClient(DummyClient):
+        calls = 0
+
+        def get_historical_close_volume(self, symbol, days=30):
+            CountingClient.calls += 1
+            return super().get_historical_close_volume(symbol, days)
+
+    rm = RiskManager(client=CountingClient(frame))
+    first = rm.adjust_parameters("AAPL")
+    assert rm.adjust_parameters("AAPL") == first
+    assert CountingClient.calls == 1
+
+
+def test_adjust_parameters_uses_supplied_data_over_cache():
+    calm = pd.DataFrame({"close": [100.0] * 5, "volume": [2e6] * 5})
+    rm = RiskManager(client=DummyClient(calm))
+    cached = rm.adjust_parameters("AAPL")
+
+    volatile = pd.DataFrame(
+        {"Close": [100.0, 110.0, 95.0, 112.0, 90.0], "Volume": [2e6] * 5}
+    )
+    fresh = rm.adjust_parameters("AAPL", data=volatile)
+    expected = RiskManager(
+        client=DummyClient(volatile.rename(columns=str.lower))
+    ).adjust_parameters("AAPL")
+    assert fresh == pytest.approx(expected)
+    assert fresh != cached
+    assert rm.adjust_parameters("AAPL") == cached
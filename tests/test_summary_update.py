@@ -40,3 +40,30 @@ def test_update_summary_row_does_not_add_rows():
             assert str(cell) == "Hold"
 
     asyncio.run(_run())
+
+
+def test_update_summary_row_keeps_action_log():
+    bot = TradingBot()
+    bot.eval_queue = asyncio.Queue()
+    bot.session_summary.append({"ticker": "AAPL", "action": "Executed"})
+    bot.update_summary_row("AAPL", "100", "0.6", "0.1", "Executed")
+    bot.update_summary_row("MSFT", "-", "-", "-", "No Trade")
+    bot.update_summary_row("AAPL", "101", "0.7", "0.2", "Executed")
+
+    assert bot.session_summary == [{"ticker": "AAPL", "action": "Executed"}]
+    assert list(bot._rows) == ["AAPL", "MSFT"]
+    assert bot._rows["AAPL"]["current_price"] == "101"
+    assert bot._rows["AAPL"]["probability"] == "0.70"
+
+
+def test_summary_rows_keep_initial_ticker_order():
+    bot = TradingBot()
+    bot.eval_queue = asyncio.Queue()
+    bot.init_summary_table(["MSFT", "AAPL", "TSLA"])
+    # Evaluations complete in a different order than they were queued.
+    bot.update_summary_row("TSLA", "200", "0.4", "0", "No Trade")
+    bot.update_summary_row("AAPL", "100", "0.6", "0.1", "Executed")
+
+    assert list(bot._rows) == ["MSFT", "AAPL", "TSLA"]
+    assert bot._rows["MSFT"]["decision"] == "Pending"
+    assert bot._rows["TSLA"]["decision"] == "No Trade"
@@ -23,3 +23,26 @@ def test_dashboard_app_populates():
             assert app.calc_log.line_count == 1
 
     asyncio.run(_run())
+
+
+def test_queued_burst_applied_in_one_batch():
+    eval_q = asyncio.Queue()
+    app = DashboardApp(eval_q, asyncio.Queue(), asyncio.Queue())
+
+    async def _run():
+        async with app.run_test() as pilot:
+            batches = []
+            original = app.batch_update
+
+            def counting_batch_update():
+                batches.append(1)
+                return original()
+
+            app.batch_update = counting_batch_update
+            for i in range(50):
+                eval_q.put_nowait((f"T{i}", "1", "0.5", "0.1", "Pending"))
+            await pilot.pause()
+            assert app.eval_table.row_count == 50
+            assert len(batches) == 1
+
+    asyncio.run(_run())
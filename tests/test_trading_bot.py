@@ -17,3 +17,393 @@ def test_confirm_trade_timeout(monkeypatch):
 
     result = asyncio.run(bot.confirm_trade({"symbol": "AAPL"}))
     assert result is True
+
+
+def test_evaluate_trade_uses_prefetched_history(monkeypatch):
+    import pandas as pd
+
+    bot = TradingBot(auto_confirm=True)
+
+    async def no_sleep(_):
+        return None
+
+    def fail(*args, **kwargs):
+        raise AssertionError("per-symbol bars should not be requested")
+
+    monkeypatch.setattr(asyncio, "sleep", no_sleep)
+    monkeypatch.setattr(bot.client, "get_historical_bars", fail)
+    monkeypatch.setattr(bot.risk_manager.client, "get_historical_close_volume", fail)
+    monkeypatch.setattr(bot.portfolio, "view_account", lambda: {"buying_power": 1e6})
+    monkeypatch.setattr(bot.client, "get_latest_price", fail)
+
+    closes = [100 * 1.01**i for i in range(30)]
+    history = pd.DataFrame({"close": closes, "volume": [2e6] * 30})
+
+    trade = asyncio.run(bot.evaluate_trade("AAPL", history=history))
+    assert trade is not None
+    assert trade["symbol"] == "AAPL"
+    assert trade["current_price"] == closes[-1]
+
+
+def test_evaluate_trade_sizes_from_live_price(monkeypatch):
+    import pandas as pd
+
+    bot = TradingBot(auto_confirm=True)
+
+    async def no_sleep(_):
+        return None
+
+    def fail(*args, **kwargs):
+        raise AssertionError("price was supplied")
+
+    monkeypatch.setattr(asyncio, "sleep", no_sleep)
+    monkeypatch.setattr(bot.portfolio, "view_account", lambda: {"buying_power": 1e6})
+    monkeypatch.setattr(bot.client, "get_latest_price", fail)
+
+    closes = [100 * 1.01**i for i in range(30)]
+    history = pd.DataFrame({"close": closes, "volume": [2e6] * 30})
+
+    trade = asyncio.run(bot.evaluate_trade("AAPL", history=history, price=150.0))
+    assert trade["current_price"] == trade["entry_price"] == 150.0
+    assert trade["stop_loss"] == 150.0 * 0.95
+    assert trade["qty"] == int(1e6 * bot.allocation_limit / 150.0 * 0.5)
+
+
+def test_eval_one_bounds_concurrency():
+    bot = TradingBot(auto_confirm=True)
+    active = 0
+    peak = 0
+
+    async def fake_evaluate(symbol, history=None, metrics=None, price=None):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        if symbol == "BAD":
+            raise RuntimeError("boom")
+        return {"symbol": symbol}
+
+    bot.evaluate_trade = fake_evaluate
+
+    async def _run():
+        sem = asyncio.Semaphore(2)
+        symbols = ["AAPL", "MSFT", "BAD", "GOOGL", "AMZN"]
+        return await asyncio.gather(*(bot._eval_one(s, sem) for s in symbols))
+
+    results = asyncio.run(_run())
+    assert peak == 2
+    assert results[2] is None
+    assert [r["symbol"] for r in results if r] == ["AAPL", "MSFT", "GOOGL", "AMZN"]
+
+
+def test_send_trade_notification_reuses_smtp_connection(monkeypatch):
+    import smtplib
+
+    connections = []
+
+    class FakeSMTP:
+        def __init__(self, host, port):
+            self.sent = []
+            self.fail_next = False
+            connections.append(self)
+
+        def starttls(self):
+            pass
+
+        def login(self, user, password):
+            pass
+
+        def send_message(self, msg):
+            if self.fail_next:
+                raise smtplib.SMTPServerDisconnected("gone")
+            self.sent.append(msg["Subject"])
+
+        def quit(self):
+            pass
+
+        def close(self):
+            pass
+
+    monkeypatch.setattr(smtplib, "SMTP", FakeSMTP)
+    bot = TradingBot(auto_confirm=True)
+
+    bot.send_trade_notification({"symbol": "AAPL"}, "order-1")
+    bot.send_trade_notification({"symbol": "MSFT"}, "order-2")
+    assert len(connections) == 1
+    assert connections[0].sent == ["Trade Executed: AAPL", "Trade Executed: MSFT"]
+
+    connections[0].fail_next = True
+    bot.send_trade_notification({"symbol": "GOOGL"}, "order-3")
+    assert len(connections) == 2
+    assert connections[1].sent == ["Trade Executed: GOOGL"]
+
+    bot.close_notifications()
+    assert bot._smtp is None
+
+
+def test_notifications_sent_in_background_and_flushed(monkeypatch):
+    bot = TradingBot(auto_confirm=True)
+    sent = []
+    monkeypatch.setattr(
+        bot, "send_trade_notification", lambda details, order: sent.append(order)
+    )
+
+    async def _run():
+        bot.notify_trade_in_background({"symbol": "AAPL"}, "order-1")
+        bot.notify_trade_in_background({"symbol": "MSFT"}, "order-2")
+        await bot.flush_notifications()
+
+    asyncio.run(_run())
+    assert sorted(sent) == ["order-1", "order-2"]
+    assert bot._notify_tasks == []
+
+
+def test_compute_trade_metrics_matches_pandas():
+    import math
+
+    import pandas as pd
+    import pytest
+
+    histories = {
+        "AAPL": pd.DataFrame({"close": [100.0, 102.0, 99.0, 101.0, 104.0, 103.0]}),
+        "MSFT": pd.DataFrame({"Close": [50.0, 49.0, 51.0]}),
+        "EMPTY": pd.DataFrame({"close": []}),
+    }
+    metrics = TradingBot.compute_trade_metrics(histories)
+    assert set(metrics) == {"AAPL", "MSFT"}
+    for symbol in ("AAPL", "MSFT"):
+        frame = histories[symbol]
+        closes = frame.iloc[:, 0]
+        returns = closes.pct_change().dropna()
+        vol = returns.std()
+        expected_prob = 1 / (1 + math.exp(-5 * returns.mean() / vol))
+        expected_es = returns[returns <= returns.quantile(0.05)].mean()
+        result = metrics[symbol]
+        assert result["probability_of_profit"] == pytest.approx(expected_prob)
+        assert result["expected_net_value"] == pytest.approx(max(returns.mean(), 0))
+        assert result["expected_shortfall"] == pytest.approx(expected_es)
+        assert result["last_close"] == closes.iloc[-1]
+
+
+def test_llm_default_tickers_cached(monkeypatch):
+    import fundrunner.alpaca.trading_bot as tb
+
+    calls = []
+
+    def fake_overview(prompt):
+        calls.append(prompt)
+        return "TICKERS: AAPL, MSFT, RIVN"
+
+    monkeypatch.setattr(tb, "DEFAULT_TICKERS_FROM_GPT", True)
+    monkeypatch.setattr(tb, "get_account_overview", fake_overview)
+    monkeypatch.setattr(tb, "_llm_tickers_cache", None)
+    bot = TradingBot(auto_confirm=True)
+
+    assert bot.get_ticker_list() == ["AAPL", "MSFT", "RIVN"]
+    assert TradingBot(auto_confirm=True).get_ticker_list() == ["AAPL", "MSFT", "RIVN"]
+    assert len(calls) == 1
+
+
+def test_evaluate_trade_fetches_history_once(monkeypatch):
+    import pandas as pd
+
+    bot = TradingBot(auto_confirm=True)
+    bot.risk_manager._param_cache.clear()
+    calls = []
+    closes = [100 * 1.01**i for i in range(30)]
+
+    def fake_bars(symbol, days=30):
+        calls.append(symbol)
+        return pd.DataFrame({"close": closes, "volume": [2e6] * 30})
+
+    def fail(*args, **kwargs):
+        raise AssertionError("risk manager should reuse the fetched bars")
+
+    async def no_sleep(_):
+        return None
+
+    monkeypatch.setattr(asyncio, "sleep", no_sleep)
+    monkeypatch.setattr(bot.client, "get_historical_bars", fake_bars)
+    monkeypatch.setattr(bot.risk_manager.client, "get_historical_close_volume", fail)
+    monkeypatch.setattr(bot.portfolio, "view_account", lambda: {"buying_power": 1e6})
+
+    trade = asyncio.run(bot.evaluate_trade("MSFT"))
+    assert trade is not None
+    assert calls == ["MSFT"]
+
+
+def test_bar_stream_closes_position_on_target():
+    bot = TradingBot(auto_confirm=True)
+    sold = []
+
+    class FakeTrader:
+        def sell(self, symbol, qty, order_type, tif):
+            sold.append((symbol, qty))
+            return {"id": "1"}
+
+    class FakeStream:
+        def __init__(self):
+            self.subscribed = []
+
+        def subscribe_bars(self, handler, *symbols):
+            self.subscribed.extend(symbols)
+
+    bot.trader = FakeTrader()
+    bot._bar_stream = FakeStream()
+
+    async def positions():
+        return [
+            {"symbol": "AAPL", "qty": 2.0, "avg_entry_price": 100.0},
+            {"symbol": "MSFT", "qty": 1.0, "avg_entry_price": 200.0},
+        ]
+
+    bot.portfolio.view_positions_async = positions
+
+    async def _run():
+        await bot._refresh_watched()
+        await bot._on_bar({"S": "AAPL", "c": 101.0})
+        await bot._on_bar({"S": "MSFT", "c": 221.0})
+        await bot._on_bar({"S": "MSFT", "c": 230.0})
+
+    asyncio.run(_run())
+    assert sorted(bot._bar_stream.subscribed) == ["AAPL", "MSFT"]
+    assert sold == [("MSFT", 1.0)]
+    assert "MSFT" not in bot._watched
+    assert bot.session_summary[-1]["action"] == "Closed"
+
+
+def test_monitor_positions_falls_back_to_polling(monkeypatch):
+    bot = TradingBot(auto_confirm=True)
+    polled = []
+
+    def no_stream():
+        raise RuntimeError("no websocket")
+
+    async def fake_poll():
+        polled.append(True)
+
+    monkeypatch.setattr(bot.client, "bar_stream", no_stream)
+    monkeypatch.setattr(bot, "_poll_positions", fake_poll)
+    asyncio.run(bot.monitor_positions())
+    assert polled == [True]
+
+
+def test_monitor_positions_polls_when_stream_cannot_connect(monkeypatch):
+    import fundrunner.alpaca.trading_bot as bot_mod
+
+    bot = TradingBot(auto_confirm=True)
+    sold = []
+    real_sleep = asyncio.sleep
+
+    class FakeTrader:
+        def sell(self, symbol, qty, order_type, tif):
+            sold.append((symbol, qty))
+            return {"id": "1"}
+
+    class RefusingStream:
+        attempts = 0
+
+        async def connect(self):
+            RefusingStream.attempts += 1
+            raise ConnectionError("handshake refused")
+
+        async def close(self):
+            pass
+
+    async def positions():
+        return [{"symbol": "AAPL", "qty": 2.0, "unrealized_pl_percent": -6.0}]
+
+    async def fast_sleep(delay):
+        await real_sleep(0)
+
+    bot.trader = FakeTrader()
+    bot.portfolio.view_positions_async = positions
+    monkeypatch.setattr(bot.client, "bar_stream", RefusingStream)
+    monkeypatch.setattr(bot_mod.asyncio, "sleep", fast_sleep)
+
+    async def _run():
+        task = asyncio.create_task(bot.monitor_positions())
+        for _ in range(200):
+            if sold and RefusingStream.attempts == bot_mod.STREAM_MAX_RECONNECTS:
+                break
+            await real_sleep(0.01)
+        assert not task.done()
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    asyncio.run(_run())
+    assert RefusingStream.attempts == bot_mod.STREAM_MAX_RECONNECTS
+    # The position is still listed on every poll but is only sold once
+    assert sold == [("AAPL", 2.0)]
+    assert bot.session_summary[0]["action"] == "Closed"
+
+
+def test_bar_and_poll_close_position_only_once():
+    import threading
+
+    bot = TradingBot(auto_confirm=True)
+    release = threading.Event()
+    sold = []
+
+    class SlowTrader:
+        def sell(self, symbol, qty, order_type, tif):
+            sold.append((symbol, qty))
+            release.wait(2)
+            return {"id": str(len(sold))}
+
+    async def positions():
+        return [
+            {
+                "symbol": "MSFT",
+                "qty": 1.0,
+                "avg_entry_price": 200.0,
+                "unrealized_pl_percent": 12.0,
+            }
+        ]
+
+    bot.trader = SlowTrader()
+    bot.portfolio.view_positions_async = positions
+
+    async def _run():
+        await bot._refresh_watched()
+        bar = asyncio.create_task(bot._on_bar({"S": "MSFT", "c": 230.0}))
+        sweep = asyncio.create_task(bot._sweep_positions())
+        await asyncio.sleep(0.05)
+        release.set()
+        await asyncio.gather(bar, sweep)
+
+    asyncio.run(_run())
+    assert sold == [("MSFT", 1.0)]
+    assert [s["action"] for s in bot.session_summary] == ["Closed"]
+
+
+def test_poll_skips_rest_while_stream_connected(monkeypatch):
+    import fundrunner.alpaca.trading_bot as bot_mod
+
+    bot = TradingBot(auto_confirm=True)
+    bot._bar_stream = object()
+    fetches = []
+    sleeps = []
+
+    async def positions():
+        fetches.append(True)
+        return []
+
+    async def counting_sleep(delay):
+        sleeps.append(delay)
+        if len(sleeps) == 3:
+            raise asyncio.CancelledError
+
+    bot.portfolio.view_positions_async = positions
+    monkeypatch.setattr(bot_mod.asyncio, "sleep", counting_sleep)
+    try:
+        asyncio.run(bot._poll_positions())
+    except asyncio.CancelledError:
+        pass
+    # One reconciliation sweep, then no REST calls until the interval passes
+    assert fetches == [True]
+    assert len(sleeps) == 3
@@ -1,3 +1,4 @@
+import json
 import os
 import tempfile
 
@@ -16,3 +17,21 @@ def test_log_and_read_transactions(monkeypatch):
         entry = entries[0]
         assert entry["trade_details"]["symbol"] == "AAPL"
         assert entry["order"]["status"] == "filled"
+
+
+def test_read_transactions_returns_tail_across_chunks(monkeypatch, tmp_path):
+    log_file = tmp_path / "transactions.log"
+    monkeypatch.setattr(transaction_logger, "TRANSACTION_LOG_FILE", str(log_file))
+    for i in range(500):
+        transaction_logger.log_transaction({"symbol": f"S{i}", "pad": "x" * 40}, {})
+
+    # A chunk far smaller than one record still yields whole lines
+    tail = transaction_logger._tail_lines(str(log_file), 2, chunk_size=16)
+    assert [json.loads(line)["trade_details"]["symbol"] for line in tail] == [
+        "S498",
+        "S499",
+    ]
+    entries = transaction_logger.read_transactions(limit=3)
+    assert [e["trade_details"]["symbol"] for e in entries] == ["S497", "S498", "S499"]
+    assert len(transaction_logger.read_transactions(limit=1000)) == 500
+    assert transaction_logger.read_transactions(limit=0) == []
@@ -8,7 +8,7 @@ def test_watchlist_main_displays_table():
     wl = types.SimpleNamespace(id="1", name="Test", symbols=["AAPL", "MSFT"])
 
     with patch("fundrunner.utils.watchlist_view.WatchlistManager") as WM, \
-         patch("fundrunner.utils.watchlist_view.AlpacaClient") as AC, \
+         patch("fundrunner.utils.watchlist_view.get_client") as AC, \
          patch("fundrunner.utils.watchlist_view.Console") as ConsoleMock, \
          patch("fundrunner.utils.watchlist_view.Prompt.ask", return_value="1"):
         wm_inst = WM.return_value
@@ -16,10 +16,11 @@ def test_watchlist_main_displays_table():
         wm_inst.get_watchlist.return_value = wl
 
         ac_inst = AC.return_value
-        ac_inst.get_latest_price.side_effect = [150.0, 300.0]
+        ac_inst.get_latest_prices.return_value = {"AAPL": 150.0, "MSFT": 300.0}
 
         console_inst = ConsoleMock.return_value
 
         watchlist_view.main()
 
         assert console_inst.print.called
+        ac_inst.get_latest_prices.assert_called_once_with(["AAPL", "MSFT"])
@@ -1,3 +1,4 @@
+import json
 from datetime import datetime
 
 import pytest
@@ -55,3 +56,75 @@ def test_dividend_requires_symbols():
     farmer = YieldFarmer(client=DummyClient())
     with pytest.raises(ValueError):
         farmer.build_dividend_portfolio([], allocation_percent=0.5)
+
+
+def test_fetch_dividend_info_uses_shared_session(monkeypatch):
+    payload = {
+        "quoteSummary": {
+            "result": [
+                {
+                    "summaryDetail": {"dividendYield": {"raw": 0.031}},
+                    "calendarEvents": {"exDividendDate": {"fmt": "2025-08-01"}},
+                }
+            ]
+        }
+    }
+    urls = []
+
+    class FakeResponse:
+        ok = True
+        content = json.dumps(payload).encode()
+
+    class FakeSession:
+        def get(self, url, timeout):
+            urls.append(url)
+            return FakeResponse()
+
+    monkeypatch.setattr(
+        "fundrunner.alpaca.yield_farming.get_session", lambda: FakeSession()
+    )
+    farmer = YieldFarmer(client=DummyClient())
+    assert farmer.fetch_dividend_info("T") == (0.031, datetime(2025, 8, 1))
+    assert "quoteSummary/T" in urls[0]
+
+
+def test_build_dividend_portfolio_fetches_concurrently(monkeypatch):
+    import threading
+
+    farmer = YieldFarmer(client=DummyClient())
+    barrier = threading.Barrier(3, timeout=2)
+    data = {
+        "AAA": (0.05, datetime(2025, 7, 1)),
+        "BBB": (0.0, None),
+        "CCC": (0.04, datetime(2025, 6, 1)),
+    }
+
+    def fake_fetch(sym):
+        # Only passes if all three lookups are in flight at once.
+        barrier.wait()
+        return data[sym]
+
+    monkeypatch.setattr(farmer, "fetch_dividend_info", fake_fetch)
+    portfolio = farmer.build_dividend_portfolio(
+        ["AAA", "BBB", "CCC"], allocation_percent=1.0
+    )
+    assert [p["symbol"] for p in portfolio] == ["AAA", "CCC"]
+
+
+def test_build_lending_portfolio_batches_prices(monkeypatch):
+    class BatchClient(DummyClient):
+        def get_latest_price(self, symbol):
+            raise AssertionError("prices should be fetched in one batch")
+
+        def get_latest_prices(self, symbols):
+            return {sym: 50.0 for sym in symbols}
+
+    farmer = YieldFarmer(client=BatchClient())
+    monkeypatch.setattr(
+        farmer.lending_service,
+        "get_rates",
+        lambda symbols: {"AAA": 0.03, "BBB": 0.02},
+    )
+    portfolio = farmer.build_lending_portfolio(allocation_percent=0.5, top_n=2)
+    assert [p["symbol"] for p in portfolio] == ["AAA", "BBB"]
+    assert portfolio[0]["qty"] == 6